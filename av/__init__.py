@@ -17,7 +17,7 @@ from av.audio.stream import AudioStream
 from av.bitstream import BitStreamFilterContext, bitstream_filters_available
 from av.codec.codec import Codec, codecs_available
 from av.codec.context import CodecContext
-from av.container import open
+from av.container import concat, open
 from av.device import DeviceInfo, enumerate_input_devices, enumerate_output_devices
 from av.format import ContainerFormat, formats_available
 from av.packet import Packet
@@ -27,6 +27,7 @@ from av.video.codeccontext import VideoCodecContext
 from av.video.format import VideoFormat
 from av.video.frame import VideoFrame
 from av.video.stream import VideoStream
+from av.video.thumbnails import thumbnails
 
 __all__ = (
     "__version__",
@@ -46,6 +47,7 @@ __all__ = (
     "codecs_available",
     "CodecContext",
     "open",
+    "concat",
     "DeviceInfo",
     "enumerate_input_devices",
     "enumerate_output_devices",
@@ -56,6 +58,7 @@ __all__ = (
     "VideoFormat",
     "VideoFrame",
     "VideoStream",
+    "thumbnails",
 )
 
 
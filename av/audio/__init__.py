@@ -1,2 +1,5 @@
 from .frame import AudioFrame as AudioFrame
+from .segments import extract_segments as extract_segments
 from .stream import AudioStream as AudioStream
+from .waveforms import waveform as waveform
+from .waveforms import waveform_dtype as waveform_dtype
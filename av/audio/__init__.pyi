@@ -1,7 +1,10 @@
 from typing import Literal
 
 from .frame import AudioFrame
+from .segments import extract_segments as extract_segments
 from .stream import AudioStream
+from .waveforms import waveform as waveform
+from .waveforms import waveform_dtype as waveform_dtype
 
 # FFmpeg 8.1 encoders and the codec descriptor aliases that resolve to them.
 _AudioCodecName = Literal[
@@ -119,4 +122,10 @@ _AudioCodecName = Literal[
     "wmav2",
 ]
 
-__all__ = ("AudioFrame", "AudioStream")
+__all__ = (
+    "AudioFrame",
+    "AudioStream",
+    "extract_segments",
+    "waveform",
+    "waveform_dtype",
+)
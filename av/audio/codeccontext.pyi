@@ -28,5 +28,6 @@ class AudioCodecContext(CodecContext):
     @property
     def block_align(self) -> int: ...
     def encode(self, frame: AudioFrame | None = None) -> list[Packet]: ...
+    def encode_into(self, frame: AudioFrame | None, packets: list[Packet]) -> int: ...
     def encode_lazy(self, frame: AudioFrame | None = None) -> Iterator[Packet]: ...
     def decode(self, packet: Packet | None = None) -> list[AudioFrame]: ...
@@ -10,10 +10,19 @@ cdef class AudioFifo:
 
     cdef AudioFrame template
 
+    # Row pointers of the arrays passed to the ndarray methods.
+    cdef void **_planes
+    cdef object _dtype
+
     cdef readonly uint64_t samples_written
     cdef readonly uint64_t samples_read
     cdef readonly double pts_per_sample
 
+    cdef void _init_fifo(self, AudioFrame frame)
+    cdef object _ndarray_dtype(self)
+    cdef int _array_planes(self, object array, bint writable)
+    cdef object _read_ndarray(self, int samples, object out, bint partial, bint consume)
+
     cpdef write(self, AudioFrame frame)
     cpdef read(self, int samples=*, bint partial=*)
     cpdef read_many(self, int samples, bint partial=*)
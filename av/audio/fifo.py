@@ -1,6 +1,12 @@
 import cython
+from cython.cimports.av.audio.format import AudioFormat
 from cython.cimports.av.audio.frame import alloc_audio_frame
+from cython.cimports.av.audio.layout import AudioLayout
 from cython.cimports.av.error import err_check
+from cython.cimports.av.utils import check_ndarray
+from cython.cimports.libc.stdlib import free, malloc
+
+from av.audio.frame import format_dtypes
 
 
 @cython.final
@@ -24,6 +30,31 @@ class AudioFifo:
     def __dealloc__(self):
         if self.ptr:
             lib.av_audio_fifo_free(self.ptr)
+        free(self._planes)
+
+    @cython.cfunc
+    def _init_fifo(self, frame: AudioFrame) -> cython.void:
+        # Hold onto a copy of the attributes of the first frame to populate
+        # output frames with.
+        self.template = alloc_audio_frame()
+        self.template._copy_internal_attributes(frame)
+        self.template._init_user_attributes()
+
+        # Figure out our "time_base".
+        if frame._time_base.num and frame.ptr.sample_rate:
+            self.pts_per_sample = frame._time_base.den / float(frame._time_base.num)
+            self.pts_per_sample /= frame.ptr.sample_rate
+        else:
+            self.pts_per_sample = 0
+
+        self.ptr = lib.av_audio_fifo_alloc(
+            cython.cast(lib.AVSampleFormat, frame.ptr.format),
+            frame.layout.nb_channels,
+            max(frame.ptr.nb_samples * 2, 1),  # Just a default; it will adjust.
+        )
+
+        if not self.ptr:
+            raise RuntimeError("Could not allocate AVAudioFifo.")
 
     @cython.ccall
     def write(self, frame: AudioFrame | None):
@@ -49,28 +80,7 @@ class AudioFifo:
             return
 
         if not self.ptr:
-            # Hold onto a copy of the attributes of the first frame to populate
-            # output frames with.
-            self.template = alloc_audio_frame()
-            self.template._copy_internal_attributes(frame)
-            self.template._init_user_attributes()
-
-            # Figure out our "time_base".
-            if frame._time_base.num and frame.ptr.sample_rate:
-                self.pts_per_sample = frame._time_base.den / float(frame._time_base.num)
-                self.pts_per_sample /= frame.ptr.sample_rate
-            else:
-                self.pts_per_sample = 0
-
-            self.ptr = lib.av_audio_fifo_alloc(
-                cython.cast(lib.AVSampleFormat, frame.ptr.format),
-                frame.layout.nb_channels,
-                frame.ptr.nb_samples
-                * 2,  # Just a default number of samples; it will adjust.
-            )
-
-            if not self.ptr:
-                raise RuntimeError("Could not allocate AVAudioFifo.")
+            self._init_fifo(frame)
 
         # Make sure nothing changed.
         elif (
@@ -190,6 +200,240 @@ class AudioFifo:
 
         return frames
 
+    @cython.cfunc
+    def _ndarray_dtype(self):
+        if self._dtype is None:
+            import numpy as np
+
+            try:
+                self._dtype = np.dtype(format_dtypes[self.template.format.name])
+            except KeyError:
+                raise ValueError(
+                    f"Conversion from {self.template.format.name!r} format to numpy array is not supported."
+                )
+        return self._dtype
+
+    @cython.cfunc
+    def _array_planes(self, array, writable: cython.bint) -> cython.int:
+        # Point self._planes at the rows of `array`, which has the shape of
+        # AudioFrame.to_ndarray(), and return how many samples it holds.
+        dtype = self._ndarray_dtype()
+        nb_channels: cython.int = self.template.layout.nb_channels
+        is_planar: cython.bint = self.template.format.is_planar
+        nb_planes: cython.int = nb_channels if is_planar else 1
+        check_ndarray(array, dtype, 2)
+        if array.shape[0] != nb_planes:
+            raise ValueError(
+                f"Expected `array.shape[0]` to equal `{nb_planes}` but got `{array.shape[0]}`"
+            )
+        if not is_planar and array.shape[1] % nb_channels:
+            raise ValueError(
+                f"Expected packed `array.shape[1]` to be a multiple of `{nb_channels}`"
+            )
+        if array.shape[1] > 1 and array.strides[1] != dtype.itemsize:
+            raise ValueError("provided array does not have C_CONTIGUOUS rows")
+        if writable and not array.flags.writeable:
+            raise ValueError("provided array is read-only")
+
+        if self._planes == cython.NULL:
+            # The layout never changes, so neither does the plane count.
+            self._planes = cython.cast(
+                cython.pointer[cython.p_void],
+                malloc(nb_planes * cython.sizeof(cython.p_void)),
+            )
+            if self._planes == cython.NULL:
+                raise MemoryError("cannot allocate AudioFifo plane pointers")
+
+        c_data: cython.Py_ssize_t = array.ctypes.data
+        stride: cython.Py_ssize_t = array.strides[0]
+        i: cython.int
+        for i in range(nb_planes):
+            self._planes[i] = cython.cast(cython.p_char, c_data) + i * stride
+
+        return array.shape[1] // (1 if is_planar else nb_channels)
+
+    def write_ndarray(self, array, format=None, layout=None, rate=None):
+        """write_ndarray(array, format=None, layout=None, rate=None)
+
+        Push the samples of a numpy array into the queue, without building an
+        :class:`.AudioFrame`.
+
+        :param array: Samples in the shape :meth:`.AudioFrame.to_ndarray`
+            returns, with C-contiguous rows.
+        :param format: The :class:`.AudioFormat` of the samples, and
+        :param layout: their :class:`.AudioLayout`. Both are required for the
+            first write, and otherwise must match the FIFO if given.
+        :param int rate: The sample rate, for the first write. Frames read
+            back then count their :attr:`~.Frame.pts` in samples.
+
+        """
+        if not self.ptr:
+            if format is None or layout is None:
+                raise ValueError("format and layout are required to start the FIFO")
+            template: AudioFrame = AudioFrame(format=format, layout=layout)
+            if rate:
+                template.ptr.sample_rate = rate
+                template._time_base.num = 1
+                template._time_base.den = rate
+            self._init_fifo(template)
+        elif (
+            (
+                format is not None
+                and AudioFormat(format).name != self.template.format.name
+            )
+            or (layout is not None and AudioLayout(layout) != self.template.layout)
+            or (rate is not None and rate != self.template.ptr.sample_rate)
+        ):
+            raise ValueError("Array does not match AudioFifo parameters.")
+
+        samples: cython.int = self._array_planes(array, False)
+        if samples:
+            err_check(lib.av_audio_fifo_write(self.ptr, self._planes, samples))
+            self.samples_written += samples
+
+    @cython.cfunc
+    def _read_ndarray(
+        self,
+        samples: cython.int,
+        out,
+        partial: cython.bint,
+        consume: cython.bint,
+    ):
+        if not self.ptr:
+            return
+
+        buffered_samples: cython.int = lib.av_audio_fifo_size(self.ptr)
+        if buffered_samples < 1:
+            return
+
+        capacity: cython.int
+        if out is None:
+            import numpy as np
+
+            samples = samples or buffered_samples
+            if buffered_samples < samples:
+                if not partial:
+                    return
+                samples = buffered_samples
+            nb_channels: cython.int = self.template.layout.nb_channels
+            if self.template.format.is_planar:
+                shape = (nb_channels, samples)
+            else:
+                shape = (1, samples * nb_channels)
+            out = np.empty(shape, dtype=self._ndarray_dtype())
+
+        capacity = self._array_planes(out, True)
+        samples = samples or capacity
+        if samples > capacity:
+            raise ValueError(f"out holds {capacity} samples; {samples} requested")
+        if buffered_samples < samples:
+            if not partial:
+                return
+            samples = buffered_samples
+
+        if consume:
+            err_check(lib.av_audio_fifo_read(self.ptr, self._planes, samples))
+            self.samples_read += samples
+        else:
+            err_check(lib.av_audio_fifo_peek(self.ptr, self._planes, samples))
+
+        if samples == capacity:
+            return out
+        if self.template.format.is_planar:
+            return out[:, :samples]
+        return out[:, : samples * self.template.layout.nb_channels]
+
+    def read_ndarray(self, samples=0, out=None, partial=False):
+        """read_ndarray(samples=0, out=None, partial=False)
+
+        Read samples from the queue into a numpy array.
+
+        :param int samples: The number of samples to pull; 0 gets all, or as
+            many as ``out`` holds.
+        :param out: An array to read into, with the shape of
+            :meth:`.AudioFrame.to_ndarray` and C-contiguous rows, which is
+            reused rather than allocating a new one.
+        :param bool partial: Allow returning less than requested.
+        :returns: The array of samples, a view of ``out`` if it was given,
+            or ``None`` (if not enough are buffered).
+
+        """
+        return self._read_ndarray(samples, out, partial, True)
+
+    def peek(self, samples=0, out=None, partial=False):
+        """peek(samples=0, out=None, partial=False)
+
+        Like :meth:`read_ndarray`, but leave the samples in the queue.
+
+        """
+        return self._read_ndarray(samples, out, partial, False)
+
+    def drain(self, samples):
+        """drain(samples)
+
+        Discard samples from the front of the queue, without reading them.
+
+        :param int samples: The number of samples to drop; fewer are dropped
+            if fewer are buffered.
+
+        """
+        if not self.ptr:
+            return
+        samples = min(samples, lib.av_audio_fifo_size(self.ptr))
+        if samples > 0:
+            err_check(lib.av_audio_fifo_drain(self.ptr, samples))
+            self.samples_read += samples
+
+    def read_into(self, frame: AudioFrame):
+        """read_into(frame)
+
+        Fill an existing frame with samples from the queue, reusing its
+        buffers rather than allocating a new frame.
+
+        :param AudioFrame frame: A writable frame of the FIFO's format and
+            layout; :attr:`~.AudioFrame.samples` of it are read.
+        :returns: ``True``, or ``False`` (if not enough are buffered), in
+            which case nothing is read.
+
+        Timing is set on the frame as for :meth:`read`.
+
+        """
+        if frame is None:
+            raise TypeError("AudioFifo must be given an AudioFrame.")
+        if not self.ptr:
+            return False
+        if (
+            frame.ptr.format != self.template.ptr.format
+            or frame.layout.nb_channels != self.template.layout.nb_channels
+        ):
+            raise ValueError("Frame does not match AudioFifo parameters.")
+
+        samples: cython.int = frame.ptr.nb_samples
+        if not samples or lib.av_audio_fifo_size(self.ptr) < samples:
+            return False
+
+        if frame.ptr.buf[0] != cython.NULL:
+            err_check(lib.av_frame_make_writable(frame.ptr))
+        err_check(
+            lib.av_audio_fifo_read(
+                self.ptr,
+                cython.cast(cython.pointer[cython.p_void], frame.ptr.extended_data),
+                samples,
+            )
+        )
+
+        frame.ptr.sample_rate = self.template.ptr.sample_rate
+        frame._time_base = self.template._time_base
+        if self.pts_per_sample:
+            frame.ptr.pts = cython.cast(
+                uint64_t, self.pts_per_sample * self.samples_read
+            )
+        else:
+            frame.ptr.pts = lib.AV_NOPTS_VALUE
+
+        self.samples_read += samples
+        return True
+
     @property
     def format(self):
         """The :class:`.AudioFormat` of this FIFO."""
@@ -1,3 +1,7 @@
+from typing import Any
+
+import numpy as np
+
 from .format import AudioFormat
 from .frame import AudioFrame
 from .layout import AudioLayout
@@ -6,6 +10,27 @@ class AudioFifo:
     def write(self, frame: AudioFrame) -> None: ...
     def read(self, samples: int = 0, partial: bool = False) -> AudioFrame | None: ...
     def read_many(self, samples: int, partial: bool = False) -> list[AudioFrame]: ...
+    def write_ndarray(
+        self,
+        array: np.ndarray[Any, Any],
+        format: AudioFormat | str | None = None,
+        layout: AudioLayout | str | None = None,
+        rate: int | None = None,
+    ) -> None: ...
+    def read_ndarray(
+        self,
+        samples: int = 0,
+        out: np.ndarray[Any, Any] | None = None,
+        partial: bool = False,
+    ) -> np.ndarray[Any, Any] | None: ...
+    def peek(
+        self,
+        samples: int = 0,
+        out: np.ndarray[Any, Any] | None = None,
+        partial: bool = False,
+    ) -> np.ndarray[Any, Any] | None: ...
+    def drain(self, samples: int) -> None: ...
+    def read_into(self, frame: AudioFrame) -> bool: ...
     @property
     def format(self) -> AudioFormat: ...
     @property
@@ -1,9 +1,13 @@
 import cython
 from cython.cimports.av.audio.format import get_audio_format
 from cython.cimports.av.audio.layout import get_audio_layout
-from cython.cimports.av.audio.plane import AudioPlane
+from cython.cimports.av.audio.plane import AudioPlane, sample_dl_dtype
 from cython.cimports.av.error import err_check
+from cython.cimports.av.frame import numpy_avbuffer_free
+from cython.cimports.av.plane import dlpack_capsule, kCPU
 from cython.cimports.av.utils import check_ndarray
+from cython.cimports.cpython.ref import Py_DECREF, Py_INCREF
+from cython.cimports.libc.stdint import int64_t
 
 _cinit_bypass_sentinel = cython.declare(object, object())
 
@@ -137,6 +141,100 @@ class AudioFrame(Frame):
             plane.update(array[i, :])
         return frame
 
+    @staticmethod
+    def from_numpy_buffer(array, format="s16", layout="stereo", rate=None):
+        """
+        Construct a frame around the memory of a numpy array, without copying.
+
+        The array has the shape :meth:`from_ndarray` expects, and is kept
+        alive by the frame for as long as any reference to its buffer exists.
+        Each row must be C-contiguous; the rows of a planar array, one per
+        channel, may be spaced further apart than that.
+
+        :param int rate: The sample rate to set on the frame.
+
+        .. note:: The samples must be in the system's native byte order.
+
+        """
+        import numpy as np
+
+        py_format = format if isinstance(format, AudioFormat) else AudioFormat(format)
+        py_layout = layout if isinstance(layout, AudioLayout) else AudioLayout(layout)
+        cy_format: AudioFormat = py_format
+        cy_layout: AudioLayout = py_layout
+
+        try:
+            dtype = np.dtype(format_dtypes[py_format.name])
+        except KeyError:
+            raise ValueError(
+                f"Conversion from numpy array with format `{py_format.name}` is not yet supported"
+            )
+
+        nb_channels: cython.int = py_layout.nb_channels
+        nb_planes: cython.int = nb_channels if py_format.is_planar else 1
+        check_ndarray(array, dtype, 2)
+        if array.shape[0] != nb_planes:
+            kind = "planar" if py_format.is_planar else "packed"
+            raise ValueError(
+                f"Expected {kind} `array.shape[0]` to equal `{nb_planes}` but got `{array.shape[0]}`"
+            )
+        if py_format.is_packed and array.shape[1] % nb_channels:
+            raise ValueError(
+                f"Expected packed `array.shape[1]` to be a multiple of `{nb_channels}`"
+            )
+
+        line_size: cython.Py_ssize_t = array.shape[1] * dtype.itemsize
+        plane_stride: cython.Py_ssize_t = array.strides[0] if nb_planes > 1 else 0
+        if array.shape[1] > 1 and array.strides[1] != dtype.itemsize:
+            raise ValueError("provided array does not have C_CONTIGUOUS rows")
+        if nb_planes > 1 and plane_stride < line_size:
+            raise ValueError("provided array has overlapping or reversed rows")
+
+        frame: AudioFrame = alloc_audio_frame()
+        c_data: cython.Py_ssize_t = array.ctypes.data
+        c_ptr: cython.pointer[uint8_t] = cython.cast(cython.pointer[uint8_t], c_data)
+        i: cython.int
+
+        frame.ptr.format = cy_format.sample_fmt
+        frame.ptr.ch_layout = cy_layout.layout
+        frame.ptr.nb_samples = array.shape[1] // (
+            1 if py_format.is_planar else nb_channels
+        )
+        frame.ptr.linesize[0] = line_size
+        if rate is not None:
+            frame.ptr.sample_rate = rate
+
+        if nb_planes > lib.AV_NUM_DATA_POINTERS:
+            frame.ptr.extended_data = cython.cast(
+                cython.pointer[cython.pointer[uint8_t]],
+                lib.av_mallocz(nb_planes * cython.sizeof(cython.pointer[uint8_t])),
+            )
+            if frame.ptr.extended_data == cython.NULL:
+                frame.ptr.extended_data = frame.ptr.data
+                raise MemoryError("cannot allocate AudioFrame plane pointers")
+        for i in range(nb_planes):
+            frame.ptr.extended_data[i] = c_ptr + i * plane_stride
+            if i < lib.AV_NUM_DATA_POINTERS:
+                frame.ptr.data[i] = frame.ptr.extended_data[i]
+
+        # Hold on to a reference for the numpy buffer so that it doesn't get
+        # accidentally garbage collected. One buffer spans every plane.
+        py_buf = cython.cast(object, array)
+        Py_INCREF(py_buf)
+        frame.ptr.buf[0] = lib.av_buffer_create(
+            c_ptr,
+            (nb_planes - 1) * plane_stride + line_size,
+            numpy_avbuffer_free,
+            cython.cast(cython.p_void, py_buf),
+            0,
+        )
+        if frame.ptr.buf[0] == cython.NULL:
+            Py_DECREF(py_buf)
+            raise MemoryError("av_buffer_create failed")
+
+        frame._init_user_attributes()
+        return frame
+
     @property
     def planes(self):
         """
@@ -181,9 +279,52 @@ class AudioFrame(Frame):
     def rate(self, value):
         self.ptr.sample_rate = value
 
-    def to_ndarray(self):
+    @cython.cfunc
+    def _plane_stride(self) -> cython.Py_ssize_t:
+        # The distance in bytes between consecutive planes when every plane
+        # lies evenly spaced within a single allocation, or -1 if they do not.
+        # Packed and mono frames have one plane, at stride 0.
+        nb_planes: cython.int = self.layout.nb_channels if self.format.is_planar else 1
+        if nb_planes <= 1:
+            return 0
+
+        start: cython.pointer[uint8_t] = self.ptr.extended_data[0]
+        stride: cython.Py_ssize_t = self.ptr.extended_data[1] - start
+        size: cython.Py_ssize_t = self.ptr.nb_samples * lib.av_get_bytes_per_sample(
+            cython.cast(lib.AVSampleFormat, self.ptr.format)
+        )
+        if stride < size:
+            return -1
+        i: cython.int
+        for i in range(2, nb_planes):
+            if self.ptr.extended_data[i] != start + i * stride:
+                return -1
+
+        base: cython.pointer[uint8_t]
+        base_size: cython.size_t
+        if self.ptr.buf[0] != cython.NULL:
+            base = self.ptr.buf[0].data
+            base_size = self.ptr.buf[0].size
+        elif self._buffer != cython.NULL:
+            base = self._buffer
+            base_size = self._buffer_size
+        else:
+            return -1
+        if start < base or start + (nb_planes - 1) * stride + size > base + base_size:
+            return -1
+        return stride
+
+    def to_ndarray(self, copy: cython.bint = True):
         """Get a numpy array of this frame.
 
+        Planar formats give a ``(channels, samples)`` array, and packed ones
+        a ``(1, samples * channels)`` array of interleaved samples.
+
+        :param bool copy: Return a copy (the default). Otherwise return views
+            onto the frame's memory, which keep the frame alive: one 2D array
+            when the planes are evenly spaced in a single buffer, as they are
+            for packed formats, or else a tuple of 1D arrays, one per plane.
+
         .. note:: Numpy must be installed.
 
         """
@@ -201,6 +342,57 @@ class AudioFrame(Frame):
         else:
             count = self.samples * self.layout.nb_channels
 
-        return np.vstack(
-            [np.frombuffer(x, dtype=dtype, count=count) for x in self.planes]
+        if copy:
+            return np.vstack(
+                [np.frombuffer(x, dtype=dtype, count=count) for x in self.planes]
+            )
+
+        planes = self.planes
+        stride: cython.Py_ssize_t = self._plane_stride()
+        if stride < 0:
+            return tuple([np.frombuffer(x, dtype=dtype, count=count) for x in planes])
+
+        # The first plane's view is the base of the result, and keeps the
+        # frame alive.
+        first = np.frombuffer(planes[0], dtype=dtype, count=count)
+        return np.lib.stride_tricks.as_strided(
+            first, shape=(len(planes), count), strides=(stride, dtype.itemsize)
         )
+
+    def __dlpack_device__(self):
+        return (kCPU, 0)
+
+    def __dlpack__(self, *, stream: int | None = None):
+        """Export the whole frame as a 2D DLPack tensor, without copying.
+
+        The tensor has the shape :meth:`to_ndarray` returns. It is only
+        possible when the planes are evenly spaced in one buffer; otherwise
+        export each of :attr:`planes` instead.
+
+        """
+        if self.ptr.buf[0] == cython.NULL:
+            raise TypeError(
+                "DLPack export requires a refcounted AVFrame (frame.buf[0] is NULL)"
+            )
+
+        fmt: lib.AVSampleFormat = cython.cast(lib.AVSampleFormat, self.ptr.format)
+        itemsize: cython.int = lib.av_get_bytes_per_sample(fmt)
+        stride: cython.Py_ssize_t = self._plane_stride()
+        if stride < 0 or stride % itemsize:
+            raise BufferError(
+                "the planes of this frame are not evenly spaced in one buffer; "
+                "export each plane instead"
+            )
+
+        shape: int64_t[2]
+        strides: int64_t[2]
+        if self.format.is_planar:
+            shape[0] = self.layout.nb_channels
+            shape[1] = self.ptr.nb_samples
+        else:
+            shape[0] = 1
+            shape[1] = self.ptr.nb_samples * self.layout.nb_channels
+        strides[0] = stride // itemsize if stride else shape[1]
+        strides[1] = 1
+
+        return dlpack_capsule(self, 0, 2, shape, strides, sample_dl_dtype(fmt), kCPU, 0)
@@ -1,4 +1,5 @@
-from typing import Any
+from types import CapsuleType
+from typing import Any, Literal, overload
 
 import numpy as np
 
@@ -46,4 +47,18 @@ class AudioFrame(Frame):
         format: AudioFormat | str = "s16",
         layout: AudioLayout | str = "stereo",
     ) -> AudioFrame: ...
-    def to_ndarray(self) -> _SupportedNDarray: ...
+    @staticmethod
+    def from_numpy_buffer(
+        array: _SupportedNDarray,
+        format: AudioFormat | str = "s16",
+        layout: AudioLayout | str = "stereo",
+        rate: int | None = None,
+    ) -> AudioFrame: ...
+    @overload
+    def to_ndarray(self, copy: Literal[True] = True) -> _SupportedNDarray: ...
+    @overload
+    def to_ndarray(
+        self, copy: bool
+    ) -> _SupportedNDarray | tuple[_SupportedNDarray, ...]: ...
+    def __dlpack_device__(self) -> tuple[int, int]: ...
+    def __dlpack__(self, *, stream: int | None = None) -> CapsuleType: ...
@@ -1,5 +1,9 @@
-from av.plane cimport Plane
+cimport libav as lib
+
+from av.plane cimport DLDataType, Plane
 
 
 cdef class AudioPlane(Plane):
     cdef size_t _buffer_size(self)
+
+cdef DLDataType sample_dl_dtype(lib.AVSampleFormat format)
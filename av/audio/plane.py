@@ -1,5 +1,14 @@
 import cython
+import cython.cimports.libav as lib
 from cython.cimports.av.audio.frame import AudioFrame
+from cython.cimports.av.plane import (
+    dlpack_capsule,
+    kCPU,
+    kDLFloat,
+    kDLInt,
+    kDLUInt,
+)
+from cython.cimports.libc.stdint import int64_t
 
 
 @cython.final
@@ -16,3 +25,58 @@ class AudioPlane(Plane):
     def _buffer_size(self) -> cython.size_t:
         # Only the first linesize is ever populated, but it applies to every plane.
         return self.frame.ptr.linesize[0]
+
+    def __dlpack_device__(self):
+        return (kCPU, 0)
+
+    def __dlpack__(self, *, stream: int | None = None):
+        """Export this plane as a DLPack tensor, without copying.
+
+        A planar plane becomes a 1D ``(samples,)`` tensor, and the single plane
+        of a packed frame a 2D ``(samples, channels)`` one.
+
+        """
+        if self.frame.ptr.buf[0] == cython.NULL:
+            raise TypeError(
+                "DLPack export requires a refcounted AVFrame (frame.buf[0] is NULL)"
+            )
+
+        fmt: lib.AVSampleFormat = cython.cast(lib.AVSampleFormat, self.frame.ptr.format)
+        dtype: DLDataType = sample_dl_dtype(fmt)
+        shape: int64_t[2]
+        strides: int64_t[2]
+        ndim: cython.int
+
+        shape[0] = self.frame.ptr.nb_samples
+        strides[1] = 1
+        if lib.av_sample_fmt_is_planar(fmt):
+            ndim = 1
+            strides[0] = 1
+        else:
+            ndim = 2
+            shape[1] = self.frame.ptr.ch_layout.nb_channels
+            strides[0] = shape[1]
+
+        return dlpack_capsule(
+            self.frame, self.index, ndim, shape, strides, dtype, kCPU, 0
+        )
+
+
+@cython.cfunc
+def sample_dl_dtype(format: lib.AVSampleFormat) -> DLDataType:
+    packed: lib.AVSampleFormat = lib.av_get_packed_sample_fmt(format)
+    code: cython.uchar
+    if packed == lib.AV_SAMPLE_FMT_U8:
+        code = kDLUInt
+    elif packed in (
+        lib.AV_SAMPLE_FMT_S16,
+        lib.AV_SAMPLE_FMT_S32,
+        lib.AV_SAMPLE_FMT_S64,
+    ):
+        code = kDLInt
+    elif packed in (lib.AV_SAMPLE_FMT_FLT, lib.AV_SAMPLE_FMT_DBL):
+        code = kDLFloat
+    else:
+        raise NotImplementedError("unsupported sample format for DLPack export")
+
+    return DLDataType(code=code, bits=lib.av_get_bytes_per_sample(format) * 8, lanes=1)
@@ -1,3 +1,10 @@
+from types import CapsuleType
+
 from av.plane import Plane
 
-class AudioPlane(Plane): ...
+from .frame import AudioFrame
+
+class AudioPlane(Plane):
+    def __init__(self, frame: AudioFrame, index: int) -> None: ...
+    def __dlpack_device__(self) -> tuple[int, int]: ...
+    def __dlpack__(self, *, stream: int | None = None) -> CapsuleType: ...
@@ -1,12 +1,43 @@
+cimport libav as lib
+from libc.stdint cimport int64_t
+
+from av.audio.fifo cimport AudioFifo
 from av.audio.format cimport AudioFormat
 from av.audio.frame cimport AudioFrame
 from av.audio.layout cimport AudioLayout
 from av.filter.graph cimport Graph
 
 
+cdef extern from "libswresample/swresample.h" nogil:
+    cdef struct SwrContext:
+        pass
+
+    cdef int swr_alloc_set_opts2(
+        SwrContext **ps,
+        const lib.AVChannelLayout *out_ch_layout,
+        lib.AVSampleFormat out_sample_fmt,
+        int out_sample_rate,
+        const lib.AVChannelLayout *in_ch_layout,
+        lib.AVSampleFormat in_sample_fmt,
+        int in_sample_rate,
+        int log_offset,
+        void *log_ctx,
+    )
+    cdef int swr_init(SwrContext *s)
+    cdef void swr_free(SwrContext **s)
+    cdef int swr_convert_frame(
+        SwrContext *s, lib.AVFrame *output, const lib.AVFrame *input
+    )
+    cdef int64_t swr_next_pts(SwrContext *s, int64_t pts)
+
+
 cdef class AudioResampler:
     cdef AudioFrame template
     cdef Graph graph
+    cdef SwrContext *swr
+    cdef AudioFifo fifo
+    cdef int64_t fifo_pts
+    cdef readonly str backend
     cdef readonly AudioFormat format
     cdef readonly AudioLayout layout
     cdef readonly dict options
@@ -14,4 +45,9 @@ cdef class AudioResampler:
     cdef readonly unsigned int frame_size
     cdef readonly bint is_passthrough
 
+    cdef void _init_graph(self, AudioFrame frame)
+    cdef void _init_swr(self, AudioFrame frame)
+    cdef AudioFrame _convert(self, AudioFrame frame, AudioFrame out)
+    cdef list _rechunk(self, list frames, bint flush)
     cpdef list[AudioFrame] resample(self, AudioFrame)
+    cpdef int resample_into(self, AudioFrame frame, AudioFrame out)
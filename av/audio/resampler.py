@@ -1,15 +1,14 @@
-from errno import EAGAIN
-
 import cython
+from cython.cimports.av.audio.fifo import AudioFifo
+from cython.cimports.av.audio.frame import alloc_audio_frame
+from cython.cimports.av.error import err_check
 from cython.cimports.av.filter.graph import Graph
 
-from av.error import FFmpegError
-
 
 @cython.final
 @cython.cclass
 class AudioResampler:
-    """AudioResampler(format=None, layout=None, rate=None, frame_size=None, options=None)
+    """AudioResampler(format=None, layout=None, rate=None, frame_size=None, options=None, backend="filter")
 
     :param AudioFormat format: The target format, or string that parses to one
         (e.g. ``"s16"``).
@@ -21,11 +20,26 @@ class AudioResampler:
         ``aresample`` filter (e.g. ``{"resampler": "soxr", "precision": "28"}``).
         See the `FFmpeg resampler documentation
         <https://ffmpeg.org/ffmpeg-resampler.html>`_ for the full list.
+    :param str backend: ``"filter"`` (the default) converts through an
+        ``abuffer``/``aformat``/``abuffersink`` filter graph. ``"swr"`` drives a
+        ``SwrContext`` directly with ``swr_convert_frame()``, which skips the
+        graph and allows :meth:`resample_into`; ``options`` are set on the
+        context itself.
     """
 
     def __cinit__(
-        self, format=None, layout=None, rate=None, frame_size=None, options=None
+        self,
+        format=None,
+        layout=None,
+        rate=None,
+        frame_size=None,
+        options=None,
+        backend="filter",
     ):
+        if backend not in ("filter", "swr"):
+            raise ValueError(f"backend must be 'filter' or 'swr', not {backend!r}")
+        self.backend = backend
+
         if format is not None:
             self.format = (
                 format if isinstance(format, AudioFormat) else AudioFormat(format)
@@ -39,6 +53,10 @@ class AudioResampler:
         self.options = {str(k): str(v) for k, v in options.items()} if options else {}
         self.graph = None
 
+    def __dealloc__(self):
+        with cython.nogil:
+            swr_free(cython.address(self.swr))
+
     @cython.ccall
     def resample(self, frame: AudioFrame | None) -> list[AudioFrame]:
         """resample(frame)
@@ -52,7 +70,7 @@ class AudioResampler:
 
         """
         # We don't have any input, so don't bother even setting up.
-        if not self.graph and frame is None:
+        if not self.graph and self.swr == cython.NULL and frame is None:
             return []
 
         # Shortcut for passthrough.
@@ -60,7 +78,7 @@ class AudioResampler:
             return [frame]
 
         # Take source settings from the first frame.
-        if not self.graph:
+        if not self.graph and self.swr == cython.NULL:
             self.template = frame
 
             # Set some default descriptors.
@@ -78,43 +96,10 @@ class AudioResampler:
                 self.is_passthrough = True
                 return [frame]
 
-            # handle resampling with aformat filter
-            # (similar to configure_output_audio_filter from ffmpeg)
-            self.graph = Graph()
-            extra_args = {}
-            if frame.time_base is not None:
-                extra_args["time_base"] = f"{frame.time_base}"
-
-            abuffer = self.graph.add(
-                "abuffer",
-                sample_rate=f"{frame.sample_rate}",
-                sample_fmt=AudioFormat(frame.format).name,
-                channel_layout=frame.layout.name,
-                **extra_args,
-            )
-            aformat = self.graph.add(
-                "aformat",
-                sample_rates=f"{self.rate}",
-                sample_fmts=self.format.name,
-                channel_layouts=self.layout.name,
-            )
-            abuffersink = self.graph.add("abuffersink")
-
-            # When libswresample options are given, do the conversion with an
-            # explicit aresample filter (which owns the SwrContext) instead of
-            # relying on the one FFmpeg auto-inserts before aformat.
-            if self.options:
-                aresample = self.graph.add("aresample", **self.options)
-                abuffer.link_to(aresample)
-                aresample.link_to(aformat)
+            if self.backend == "swr":
+                self._init_swr(frame)
             else:
-                abuffer.link_to(aformat)
-
-            aformat.link_to(abuffersink)
-            self.graph.configure()
-
-            if self.frame_size > 0:
-                self.graph.set_audio_frame_size(self.frame_size)
+                self._init_graph(frame)
 
         if frame is not None:
             if (
@@ -124,17 +109,202 @@ class AudioResampler:
             ):
                 raise ValueError("Frame does not match AudioResampler setup.")
 
-        self.graph.push(frame)
+        output: list[AudioFrame]
+        out: AudioFrame
+        if self.swr != cython.NULL:
+            output = []
+            if frame is not None:
+                out = self._convert(frame, None)
+                if out.ptr.nb_samples:
+                    output.append(out)
+            else:
+                # Drain the delay line until swr has nothing left to give.
+                while True:
+                    out = self._convert(None, None)
+                    if not out.ptr.nb_samples:
+                        break
+                    output.append(out)
+            if self.frame_size:
+                output = self._rechunk(output, frame is None)
+            return output
+
+        return self.graph.push_pull(frame)
+
+    @cython.ccall
+    def resample_into(self, frame: AudioFrame | None, out: AudioFrame) -> cython.int:
+        """resample_into(frame, out)
+
+        Convert a :class:`~.AudioFrame` into an existing one, reusing its buffers
+        instead of allocating a new frame. Only for ``backend="swr"`` without a
+        ``frame_size``.
+
+        :param AudioFrame frame: The frame to convert or `None` to drain.
+        :param AudioFrame out: A frame of the target format and layout, such
+            as an earlier output that is no longer needed. It is filled with as
+            many samples as its buffers hold; the rest are kept for later calls.
+        :returns: The number of samples written to ``out``, 0 once drained.
+
+        """
+        if self.backend != "swr" or self.frame_size:
+            raise ValueError("resample_into() needs backend='swr' and no frame_size")
+        if out is None:
+            raise TypeError("resample_into() must be given an output AudioFrame")
+
+        if self.swr == cython.NULL:
+            if frame is None:
+                return 0
+            self.template = frame
+            self.format = self.format or frame.format
+            self.layout = self.layout or frame.layout
+            self.rate = self.rate or frame.sample_rate
+            self._init_swr(frame)
+        elif frame is not None and (
+            frame.format.sample_fmt != self.template.format.sample_fmt
+            or frame.layout != self.template.layout
+            or frame.sample_rate != self.template.rate
+        ):
+            raise ValueError("Frame does not match AudioResampler setup.")
+
+        if out.format.sample_fmt != self.format.sample_fmt or out.layout != self.layout:
+            raise ValueError("Output frame does not match AudioResampler setup.")
+
+        if out.ptr.buf[0] != cython.NULL:
+            err_check(lib.av_frame_make_writable(out.ptr))
+        self._convert(frame, out)
+        return out.ptr.nb_samples
+
+    @cython.cfunc
+    def _init_graph(self, frame: AudioFrame) -> cython.void:
+        # handle resampling with aformat filter
+        # (similar to configure_output_audio_filter from ffmpeg)
+        self.graph = Graph()
+        extra_args = {}
+        if frame.time_base is not None:
+            extra_args["time_base"] = f"{frame.time_base}"
+
+        abuffer = self.graph.add(
+            "abuffer",
+            sample_rate=f"{frame.sample_rate}",
+            sample_fmt=AudioFormat(frame.format).name,
+            channel_layout=frame.layout.name,
+            **extra_args,
+        )
+        aformat = self.graph.add(
+            "aformat",
+            sample_rates=f"{self.rate}",
+            sample_fmts=self.format.name,
+            channel_layouts=self.layout.name,
+        )
+        abuffersink = self.graph.add("abuffersink")
+
+        # When libswresample options are given, do the conversion with an
+        # explicit aresample filter (which owns the SwrContext) instead of
+        # relying on the one FFmpeg auto-inserts before aformat.
+        if self.options:
+            aresample = self.graph.add("aresample", **self.options)
+            abuffer.link_to(aresample)
+            aresample.link_to(aformat)
+        else:
+            abuffer.link_to(aformat)
+
+        aformat.link_to(abuffersink)
+        self.graph.configure()
+
+        if self.frame_size > 0:
+            self.graph.set_audio_frame_size(self.frame_size)
+
+    @cython.cfunc
+    def _init_swr(self, frame: AudioFrame) -> cython.void:
+        err_check(
+            swr_alloc_set_opts2(
+                cython.address(self.swr),
+                cython.address(self.layout.layout),
+                self.format.sample_fmt,
+                self.rate,
+                cython.address(frame.ptr.ch_layout),
+                cython.cast(lib.AVSampleFormat, frame.ptr.format),
+                frame.ptr.sample_rate,
+                0,
+                cython.NULL,
+            )
+        )
+
+        ret: cython.int
+        for key, value in self.options.items():
+            ret = lib.av_opt_set(self.swr, key, value, 0)
+            if ret == lib.AVERROR_OPTION_NOT_FOUND:
+                raise ValueError(f"unused config: {key}")
+            err_check(ret)
+
+        err_check(swr_init(self.swr))
+
+    @cython.cfunc
+    def _convert(self, frame: AudioFrame | None, out: AudioFrame | None) -> AudioFrame:
+        # Work out the output timestamp the way the aresample filter does:
+        # swr tracks it in units of 1 / (in_rate * out_rate), and extrapolates
+        # from the samples it has seen when the input has none.
+        in_rate: int64_t = self.template.ptr.sample_rate
+        in_pts: int64_t = lib.AV_NOPTS_VALUE
+        if (
+            frame is not None
+            and frame.ptr.pts != lib.AV_NOPTS_VALUE
+            and frame._time_base.num
+        ):
+            in_pts = lib.av_rescale(
+                frame.ptr.pts,
+                frame._time_base.num * in_rate * self.rate,
+                frame._time_base.den,
+            )
+        out_pts: int64_t = swr_next_pts(self.swr, in_pts)
+
+        if out is None:
+            out = alloc_audio_frame()
+            out.ptr.format = self.format.sample_fmt
+            out.ptr.ch_layout = self.layout.layout
+        else:
+            # Let swr size the output from the buffers it already has.
+            out.ptr.nb_samples = 0
+        out.ptr.sample_rate = self.rate
 
-        output: list[AudioFrame] = []
+        ret: cython.int
+        src: cython.pointer[lib.AVFrame] = (
+            frame.ptr if frame is not None else cython.NULL
+        )
+        with cython.nogil:
+            ret = swr_convert_frame(self.swr, out.ptr, src)
+        err_check(ret)
+
+        out._init_user_attributes()
+        out._time_base.num = 1
+        out._time_base.den = self.rate
+        out.ptr.pts = (
+            (out_pts + in_rate // 2) // in_rate
+            if out_pts >= 0
+            else -((in_rate // 2 - out_pts) // in_rate)
+        )
+        return out
+
+    @cython.cfunc
+    def _rechunk(self, frames: list, flush: cython.bint) -> list:
+        # Cut the converted frames to frame_size samples. The FIFO checks
+        # timestamp continuity, which swr already guarantees, so feed it frames
+        # without any and count from the first one instead.
+        frame: AudioFrame
+        if self.fifo is None:
+            self.fifo = AudioFifo()
+        for frame in frames:
+            if not self.fifo.samples_written:
+                self.fifo_pts = frame.ptr.pts
+            frame.ptr.pts = lib.AV_NOPTS_VALUE
+            self.fifo.write(frame)
+
+        output: list = []
+        pts: int64_t
         while True:
-            try:
-                output.append(self.graph.pull())
-            except EOFError:
+            pts = self.fifo_pts + self.fifo.samples_read
+            frame = self.fifo.read(self.frame_size, partial=flush)
+            if frame is None:
                 break
-            except FFmpegError as e:
-                if e.errno != EAGAIN:
-                    raise
-                break
-
+            frame.ptr.pts = pts
+            output.append(frame)
         return output
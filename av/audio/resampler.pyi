@@ -1,3 +1,5 @@
+from typing import Literal
+
 from av.filter.graph import Graph
 
 from .format import AudioFormat
@@ -11,6 +13,8 @@ class AudioResampler:
     layout: AudioLayout
     options: dict[str, str]
     graph: Graph | None
+    backend: Literal["filter", "swr"]
+    is_passthrough: bool
 
     def __init__(
         self,
@@ -19,5 +23,7 @@ class AudioResampler:
         rate: int | None = None,
         frame_size: int | None = None,
         options: dict[str, str] | None = None,
+        backend: Literal["filter", "swr"] = "filter",
     ) -> None: ...
     def resample(self, frame: AudioFrame | None) -> list[AudioFrame]: ...
+    def resample_into(self, frame: AudioFrame | None, out: AudioFrame) -> int: ...
@@ -0,0 +1,258 @@
+import itertools
+
+import cython
+from cython.cimports.av.audio.frame import AudioFrame
+from cython.cimports.av.audio.resampler import AudioResampler
+from cython.cimports.av.audio.stream import AudioStream
+from cython.cimports.av.codec.context import CodecContext
+from cython.cimports.av.container.input import InputContainer
+from cython.cimports.libc.stdint import int64_t
+
+from av.audio.frame import format_dtypes
+
+# Extra audio decoded ahead of each region, on top of the codec's own pre-roll,
+# so decoders that need a few packets of history (e.g. the MP3 bit reservoir)
+# have settled by the first sample we keep.
+_SEEK_MARGIN = 0.1
+
+
+def extract_segments(
+    file,
+    ranges,
+    rate=None,
+    layout=None,
+    format="fltp",
+    *,
+    stream=None,
+    merge_gap=1.0,
+    options=None,
+):
+    """extract_segments(file, ranges, rate=None, layout=None, format="fltp", *, stream=None, merge_gap=1.0, options=None)
+
+    Cut many sample-accurate segments out of an audio stream.
+
+    The ranges are sorted and grouped into regions, joining any that overlap
+    or are less than ``merge_gap`` seconds apart. Each region is reached with
+    one seek, decoded once, and converted with a single ``swr``
+    :class:`.AudioResampler`, and every segment inside it is copied out of the
+    same frames. The position of the first frame after the seek is taken from
+    its ``pts``, and the seek starts early enough to cover the decoder's
+    ``seek_preroll`` and ``initial_padding``, and again from further back if
+    it still lands past the region's start, so segments start and end on
+    exact samples.
+
+    :param file: Anything :func:`av.open` accepts, or an open
+        :class:`.InputContainer`, which is left open.
+    :param ranges: ``(start, end)`` pairs in seconds from the start of the
+        stream. They may overlap and come in any order.
+    :param int rate: Target sample rate; defaults to the stream's.
+    :param layout: Target channel layout; defaults to the stream's.
+    :param format: Target sample format; defaults to ``"fltp"``.
+    :param stream: The :class:`.AudioStream` to read, defaulting to the first.
+    :param float merge_gap: Gaps shorter than this many seconds are decoded
+        through rather than seeked over.
+    :param dict options: Passed to :func:`av.open` when ``file`` is not open.
+    :return: One NumPy array of shape ``(channels, samples)`` per range, in
+        the order given. A segment that runs past the end of the stream is
+        cut short.
+
+    """
+    ranges = [(float(start), float(end)) for start, end in ranges]
+    for start, end in ranges:
+        if start < 0 or end < start:
+            raise ValueError(f"invalid range ({start}, {end})")
+    if merge_gap < 0:
+        raise ValueError("merge_gap must not be negative")
+
+    container: InputContainer
+    owned: cython.bint = not isinstance(file, InputContainer)
+    if owned:
+        from av.container.core import open
+
+        container = open(file, "r", options=options)
+    else:
+        container = file
+
+    try:
+        if stream is None:
+            if not container.streams.audio:
+                raise ValueError("input has no audio stream")
+            stream = container.streams.audio[0]
+
+        results: list = [None] * len(ranges)
+        order = sorted(range(len(ranges)), key=lambda i: ranges[i])
+        region: list = []
+        region_end = 0.0
+        for i in order:
+            start, end = ranges[i]
+            if region and start > region_end + merge_gap:
+                _extract_region(
+                    container, stream, ranges, region, results, rate, layout, format
+                )
+                region = []
+            if not region or end > region_end:
+                region_end = end
+            region.append(i)
+        if region:
+            _extract_region(
+                container, stream, ranges, region, results, rate, layout, format
+            )
+        return results
+    finally:
+        if owned:
+            container.close()
+
+
+@cython.cfunc
+def _extract_region(
+    container: InputContainer,
+    stream: AudioStream,
+    ranges: list,
+    region: list,
+    results: list,
+    rate,
+    layout,
+    format,
+):
+    import numpy as np
+
+    codec_context: CodecContext = stream.codec_context
+    in_rate: cython.int = codec_context.ptr.sample_rate
+    out_rate: int64_t = rate or in_rate
+    origin = stream.start_time * stream.time_base if stream.start_time else 0
+
+    # Segment bounds in samples at the output rate, sorted by start.
+    nb: cython.Py_ssize_t = len(region)
+    starts: list = [round(ranges[i][0] * out_rate) for i in region]
+    ends: list = [round(ranges[i][1] * out_rate) for i in region]
+    written: list
+    arrays: list
+
+    preroll = (
+        max(codec_context.ptr.seek_preroll, codec_context.ptr.initial_padding) / in_rate
+        + _SEEK_MARGIN
+    )
+
+    dtype = None
+    channels: cython.int = 0
+    late: int64_t
+    k: cython.Py_ssize_t
+    while True:
+        written = [0] * nb
+        arrays = [None] * nb
+        seek_to = origin + starts[0] / out_rate - preroll
+        if seek_to > origin:
+            container.seek(int(seek_to / stream.time_base), stream=stream)
+        else:
+            container.seek(stream.start_time or 0, stream=stream)
+
+        late, dtype, channels = _decode_region(
+            container,
+            stream,
+            origin,
+            out_rate,
+            starts,
+            ends,
+            arrays,
+            written,
+            AudioResampler(format, layout, rate, backend="swr"),
+            seek_to > origin,
+        )
+        if not late:
+            break
+        # The seek landed inside the region (a coarse index, or a decoder
+        # that needs more history): go back further and decode it again.
+        preroll = max(2 * preroll, preroll + late / out_rate)
+
+    for k in range(nb):
+        if arrays[k] is None:
+            arrays[k] = np.zeros((channels, 0), dtype or np.float32)
+        elif written[k] < ends[k] - starts[k]:
+            arrays[k] = arrays[k][:, : written[k]]
+        results[region[k]] = arrays[k]
+
+
+@cython.cfunc
+def _decode_region(
+    container: InputContainer,
+    stream: AudioStream,
+    origin,
+    out_rate: int64_t,
+    starts: list,
+    ends: list,
+    arrays: list,
+    written: list,
+    resampler: AudioResampler,
+    retry: cython.bint,
+) -> tuple:
+    """Decode from the current position into ``arrays``.
+
+    Returns how many samples past the first segment's start the first frame
+    landed, or 0, along with the dtype and channel count. With ``retry``,
+    nothing is decoded when it landed late; otherwise the seek was to the
+    start of the stream, and there is no audio before that frame to miss.
+    """
+    import numpy as np
+
+    nb: cython.Py_ssize_t = len(starts)
+    region_end: int64_t = max(ends)
+    dtype = None
+    planar: cython.bint = False
+    channels: cython.int = 0
+    position: int64_t = 0
+    anchored: cython.bint = False
+    first: cython.Py_ssize_t = 0
+    k: cython.Py_ssize_t
+    n: int64_t
+    lo: int64_t
+    hi: int64_t
+    frame: AudioFrame
+
+    for decoded in itertools.chain(container.decode(stream), [None]):
+        for frame in resampler.resample(decoded):
+            if frame is None:
+                continue
+
+            # Place the first frame after the seek by its timestamp, and count
+            # samples from there so consecutive frames never gap or overlap.
+            if not anchored:
+                if frame.pts is None:
+                    raise ValueError("cannot place audio frames without a pts")
+                position = round((frame.time - origin) * out_rate)
+                channels = frame.layout.nb_channels
+                planar = frame.format.is_planar
+                dtype = np.dtype(format_dtypes[frame.format.name])
+                anchored = True
+                if retry and position > starts[0]:
+                    return position - starts[0], dtype, channels
+
+            n = frame.ptr.nb_samples
+            if position + n > starts[first]:
+                data = frame.to_ndarray()
+                if not planar:
+                    data = data.reshape(-1, channels).T
+
+                for k in range(first, nb):
+                    if starts[k] >= position + n:
+                        break
+                    if ends[k] <= position:
+                        continue
+                    if arrays[k] is None:
+                        arrays[k] = np.zeros((channels, ends[k] - starts[k]), dtype)
+                    lo = max(starts[k], position)
+                    hi = min(ends[k], position + n)
+                    arrays[k][:, lo - starts[k] : hi - starts[k]] = data[
+                        :, lo - position : hi - position
+                    ]
+                    written[k] = hi - starts[k]
+
+                # Segments that are complete never need looking at again.
+                while first < nb - 1 and ends[first] <= position + n:
+                    first += 1
+
+            position += n
+
+        if position >= region_end:
+            break
+
+    return 0, dtype, channels
@@ -0,0 +1,20 @@
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+from .format import AudioFormat
+from .layout import AudioLayout
+from .stream import AudioStream
+
+def extract_segments(
+    file: Any,
+    ranges: Iterable[tuple[float, float]],
+    rate: int | None = None,
+    layout: AudioLayout | str | None = None,
+    format: AudioFormat | str = "fltp",
+    *,
+    stream: AudioStream | None = None,
+    merge_gap: float = 1.0,
+    options: dict[str, str] | None = None,
+) -> list[np.ndarray[Any, Any]]: ...
@@ -6,4 +6,5 @@ from .frame cimport AudioFrame
 
 cdef class AudioStream(Stream):
     cpdef encode(self, AudioFrame frame=?)
+    cpdef int encode_into(self, AudioFrame frame, list packets)
     cpdef decode(self, Packet packet=?)
@@ -46,6 +46,24 @@ class AudioStream(Stream):
 
         return packets
 
+    @cython.ccall
+    def encode_into(self, frame: AudioFrame | None, packets: list) -> cython.int:
+        """
+        Encode an :class:`.AudioFrame`, appending the packets to ``packets``.
+
+        :return: The number of packets appended.
+
+        .. seealso:: This is mostly a passthrough to :meth:`.CodecContext.encode_into`.
+        """
+        self._assert_has_codec_context(lib.AVERROR_ENCODER_NOT_FOUND)
+        start: cython.Py_ssize_t = len(packets)
+        count: cython.int = self.codec_context.encode_into(frame, packets)
+        packet: Packet
+        for packet in packets[start:]:
+            packet._stream = self
+            packet.ptr.stream_index = self.ptr.index
+        return count
+
     @cython.ccall
     def decode(self, packet: Packet | None = None):
         """
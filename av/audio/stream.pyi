@@ -19,6 +19,7 @@ class _Layout:
 class AudioStream(Stream):
     codec_context: AudioCodecContext
     def encode(self, frame: AudioFrame | None = None) -> list[Packet]: ...
+    def encode_into(self, frame: AudioFrame | None, packets: list[Packet]) -> int: ...
     def decode(self, packet: Packet | None = None) -> list[AudioFrame]: ...
 
     # From codec context
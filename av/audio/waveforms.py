@@ -0,0 +1,242 @@
+import itertools
+import math
+
+import cython
+from cython.cimports import libav as lib
+from cython.cimports.av.audio.frame import AudioFrame
+from cython.cimports.av.audio.resampler import AudioResampler
+from cython.cimports.av.audio.stream import AudioStream
+from cython.cimports.av.container.input import InputContainer
+from cython.cimports.libc.math import INFINITY
+from cython.cimports.libc.stdint import int64_t
+
+
+def waveform_dtype():
+    """The NumPy structured dtype of :func:`waveform` buckets."""
+    import numpy as np
+
+    return np.dtype([("min", "float32"), ("max", "float32"), ("rms", "float32")])
+
+
+def waveform(
+    file,
+    buckets=None,
+    samples_per_bucket=None,
+    *,
+    stream=None,
+    levels=None,
+    options=None,
+):
+    """waveform(file, buckets=None, samples_per_bucket=None, *, stream=None, levels=None, options=None)
+
+    Summarise an audio stream for drawing its waveform.
+
+    Every sample is decoded, converted to float, and reduced to the minimum,
+    maximum, and RMS of each channel over consecutive buckets. The reduction
+    runs in C without the GIL, so no per-frame array is ever built.
+
+    Exactly one of ``buckets`` or ``samples_per_bucket`` must be given. The
+    last bucket holds whatever samples are left, and may be shorter.
+
+    :param file: Anything :func:`av.open` accepts, an open
+        :class:`.InputContainer`, which is left open, or an
+        :class:`.AudioStream` of one.
+    :param int buckets: Roughly how many buckets to produce, spread over the
+        duration the container reports.
+    :param int samples_per_bucket: How many samples make a bucket.
+    :param stream: The :class:`.AudioStream` to read, defaulting to the first.
+    :param int levels: Also produce coarser zoom levels in the same pass, each
+        merging pairs of buckets of the one before. A list of ``levels``
+        arrays, finest first, is returned instead of a single array.
+    :param dict options: Passed to :func:`av.open` when ``file`` is not open.
+    :return: A structured array of :func:`waveform_dtype` with shape
+        ``(channels, buckets)``, or a list of them.
+
+    """
+    if (buckets is None) == (samples_per_bucket is None):
+        raise ValueError("exactly one of buckets or samples_per_bucket must be given")
+    if buckets is not None and buckets < 1:
+        raise ValueError("buckets must be positive")
+    if samples_per_bucket is not None and samples_per_bucket < 1:
+        raise ValueError("samples_per_bucket must be positive")
+    if levels is not None and levels < 1:
+        raise ValueError("levels must be positive")
+
+    container: InputContainer
+    owned: cython.bint = False
+    if isinstance(file, AudioStream):
+        stream = file
+        container = file.container
+    elif isinstance(file, InputContainer):
+        container = file
+    else:
+        from av.container.core import open
+
+        container = open(file, "r", options=options)
+        owned = True
+
+    try:
+        if stream is None:
+            if not container.streams.audio:
+                raise ValueError("input has no audio stream")
+            stream = container.streams.audio[0]
+
+        if samples_per_bucket is None:
+            samples_per_bucket = max(
+                1, math.ceil(_duration_samples(container, stream) / buckets)
+            )
+        level, counts = _reduce(container, stream, samples_per_bucket)
+    finally:
+        if owned:
+            container.close()
+
+    if levels is None:
+        return level
+
+    out: list = [level]
+    while len(out) < levels:
+        level, counts = _merge_pairs(level, counts)
+        out.append(level)
+    return out
+
+
+@cython.cfunc
+def _duration_samples(container: InputContainer, stream: AudioStream) -> int64_t:
+    rate = stream.codec_context.sample_rate
+    if stream.duration:
+        return int(stream.duration * stream.time_base * rate)
+    if container.duration:
+        return int(container.duration * rate / lib.AV_TIME_BASE)
+    raise ValueError("duration is unknown; pass samples_per_bucket instead")
+
+
+@cython.cfunc
+def _reduce(container: InputContainer, stream: AudioStream, per_bucket: int64_t):
+    import numpy as np
+
+    resampler: AudioResampler = AudioResampler(format="fltp", backend="swr")
+    frame: AudioFrame
+    ptr: cython.pointer[lib.AVFrame]
+    data: cython.pointer[cython.float]
+
+    channels: cython.int = 0
+    capacity: cython.Py_ssize_t = 0
+    mins_arr = maxs_arr = sums_arr = None
+    mins: cython.float[:, ::1]
+    maxs: cython.float[:, ::1]
+    sums: cython.double[:, ::1]
+    # The running bucket of each channel.
+    acc_min_arr = acc_max_arr = acc_sum_arr = None
+    acc_min: cython.float[::1]
+    acc_max: cython.float[::1]
+    acc_sum: cython.double[::1]
+
+    nb_buckets: cython.Py_ssize_t = 0
+    filled: int64_t = 0
+    b: cython.Py_ssize_t
+    f: int64_t
+    n: cython.int
+    ch: cython.int
+    i: cython.int
+    v: cython.float
+    lo: cython.float
+    hi: cython.float
+    sq: cython.double
+
+    for decoded in itertools.chain(container.decode(stream), [None]):
+        for frame in resampler.resample(decoded):
+            if frame is None:
+                continue
+            ptr = frame.ptr
+            n = ptr.nb_samples
+
+            if mins_arr is None:
+                channels = ptr.ch_layout.nb_channels
+                acc_min_arr = np.full(channels, np.inf, dtype=np.float32)
+                acc_max_arr = np.full(channels, -np.inf, dtype=np.float32)
+                acc_sum_arr = np.zeros(channels, dtype=np.float64)
+                acc_min, acc_max, acc_sum = acc_min_arr, acc_max_arr, acc_sum_arr
+
+            # Make room for every bucket this frame can complete, and one more
+            # for a trailing partial bucket.
+            if nb_buckets + (filled + n) // per_bucket + 1 > capacity:
+                capacity = max(
+                    2 * capacity, nb_buckets + (filled + n) // per_bucket + 1, 64
+                )
+                if mins_arr is None:
+                    mins_arr = np.empty((capacity, channels), dtype=np.float32)
+                    maxs_arr = np.empty((capacity, channels), dtype=np.float32)
+                    sums_arr = np.empty((capacity, channels), dtype=np.float64)
+                else:
+                    mins_arr = np.resize(mins_arr, (capacity, channels))
+                    maxs_arr = np.resize(maxs_arr, (capacity, channels))
+                    sums_arr = np.resize(sums_arr, (capacity, channels))
+                mins, maxs, sums = mins_arr, maxs_arr, sums_arr
+
+            with cython.nogil:
+                # Every channel crosses bucket boundaries at the same samples,
+                # so each walks its plane from the same starting state.
+                for ch in range(channels):
+                    data = cython.cast(
+                        cython.pointer[cython.float], ptr.extended_data[ch]
+                    )
+                    b = nb_buckets
+                    f = filled
+                    lo = acc_min[ch]
+                    hi = acc_max[ch]
+                    sq = acc_sum[ch]
+                    for i in range(n):
+                        v = data[i]
+                        if v < lo:
+                            lo = v
+                        if v > hi:
+                            hi = v
+                        sq += v * v
+                        f += 1
+                        if f == per_bucket:
+                            mins[b, ch] = lo
+                            maxs[b, ch] = hi
+                            sums[b, ch] = sq
+                            b += 1
+                            f = 0
+                            lo = INFINITY
+                            hi = -INFINITY
+                            sq = 0
+                    acc_min[ch] = lo
+                    acc_max[ch] = hi
+                    acc_sum[ch] = sq
+                if channels:
+                    nb_buckets = b
+                    filled = f
+
+    if mins_arr is None:
+        return np.empty((0, 0), dtype=waveform_dtype()), np.empty(0)
+
+    counts = np.full(nb_buckets, per_bucket, dtype=np.float64)
+    if filled:
+        mins_arr[nb_buckets] = acc_min_arr
+        maxs_arr[nb_buckets] = acc_max_arr
+        sums_arr[nb_buckets] = acc_sum_arr
+        counts = np.append(counts, filled)
+        nb_buckets += 1
+
+    out = np.empty((channels, nb_buckets), dtype=waveform_dtype())
+    out["min"] = mins_arr[:nb_buckets].T
+    out["max"] = maxs_arr[:nb_buckets].T
+    out["rms"] = np.sqrt(sums_arr[:nb_buckets] / counts[:, None]).T
+    # The bucket sizes let coarser levels weight the RMS correctly.
+    return out, counts
+
+
+def _merge_pairs(level, counts):
+    import numpy as np
+
+    starts = np.arange(0, level.shape[1], 2)
+    merged_counts = np.add.reduceat(counts, starts) if len(starts) else counts
+    out = np.empty((level.shape[0], len(starts)), dtype=waveform_dtype())
+    if len(starts):
+        out["min"] = np.minimum.reduceat(level["min"], starts, axis=1)
+        out["max"] = np.maximum.reduceat(level["max"], starts, axis=1)
+        energy = level["rms"].astype(np.float64) ** 2 * counts
+        out["rms"] = np.sqrt(np.add.reduceat(energy, starts, axis=1) / merged_counts)
+    return out, merged_counts
@@ -0,0 +1,27 @@
+from typing import Any, overload
+
+import numpy as np
+
+from .stream import AudioStream
+
+def waveform_dtype() -> np.dtype[np.void]: ...
+@overload
+def waveform(
+    file: Any,
+    buckets: int | None = None,
+    samples_per_bucket: int | None = None,
+    *,
+    stream: AudioStream | None = None,
+    levels: None = None,
+    options: dict[str, str] | None = None,
+) -> np.ndarray[Any, np.dtype[np.void]]: ...
+@overload
+def waveform(
+    file: Any,
+    buckets: int | None = None,
+    samples_per_bucket: int | None = None,
+    *,
+    stream: AudioStream | None = None,
+    levels: int,
+    options: dict[str, str] | None = None,
+) -> list[np.ndarray[Any, np.dtype[np.void]]]: ...
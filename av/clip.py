@@ -0,0 +1,352 @@
+import itertools
+from fractions import Fraction
+
+import cython
+from cython.cimports import libav as lib
+from cython.cimports.av.codec.context import CodecContext
+from cython.cimports.av.container.input import InputContainer
+from cython.cimports.av.container.output import OutputContainer
+from cython.cimports.av.packet import Packet
+from cython.cimports.av.stream import Stream
+from cython.cimports.av.video.frame import VideoFrame
+
+from av.bitstream import BitStreamFilterContext
+from av.codec.codec import Codec
+
+# Codecs whose parameter sets live in the extradata of MP4-style containers,
+# with the offset of the byte giving the NAL length size there.
+_length_size_offsets = {"h264": 4, "hevc": 21}
+
+
+def extract(
+    source,
+    start,
+    end,
+    output,
+    *,
+    stream=None,
+    audio=True,
+    format=None,
+    options=None,
+):
+    """extract(source, start, end, output, *, stream=None, audio=True, format=None, options=None)
+
+    Cut a clip out of a video with as little re-encoding as possible.
+
+    Only the partial GOPs at the two ends of the clip are decoded and
+    re-encoded; every whole GOP in between is copied packet for packet. The
+    re-encoded frames use the source's codec, size, pixel format, time base,
+    bit rate, and colour properties, and carry their own parameter sets
+    in-band; for H.264 and HEVC in MP4-style packaging, the first copied
+    keyframe gets the source's parameter sets back in-band too, so decoders
+    switch cleanly at every boundary. Timestamps are shifted so the clip
+    starts at zero, with the decoding timestamps of the re-encoded head moved
+    back far enough to stay below those of the copied packets.
+
+    Audio is copied for the packets that start inside the clip. Other
+    streams are dropped.
+
+    GOPs are assumed to be closed, as most encoders make them by default.
+
+    :param source: Anything :func:`av.open` accepts, or an open
+        :class:`.InputContainer`, which is left open.
+    :param float start: Start of the clip in seconds of presentation time.
+    :param float end: End of the clip, exclusive.
+    :param output: Anything :func:`av.open` accepts for writing, or an open
+        :class:`.OutputContainer`, which is left open.
+    :param stream: The :class:`.VideoStream` to cut, defaulting to the first.
+    :param bool audio: Whether to copy the audio streams.
+    :param str format: Passed to :func:`av.open` when ``output`` is not open.
+    :param dict options: Codec options for re-encoding the ends.
+
+    """
+    if end <= start or start < 0:
+        raise ValueError(f"invalid clip ({start}, {end})")
+
+    from av.container.core import open
+
+    input_: InputContainer
+    owned_input: cython.bint = not isinstance(source, InputContainer)
+    output_: OutputContainer
+    owned_output: cython.bint = not isinstance(output, OutputContainer)
+
+    input_ = open(source, "r") if owned_input else source
+    try:
+        if stream is None:
+            if not input_.streams.video:
+                raise ValueError("input has no video stream")
+            stream = input_.streams.video[0]
+        output_ = open(output, "w", format=format) if owned_output else output
+        try:
+            _Clipper(input_, stream, output_, start, end, audio, options).run()
+        finally:
+            if owned_output:
+                output_.close()
+    finally:
+        if owned_input:
+            input_.close()
+
+
+class _Clipper:
+    def __init__(self, input_, stream, output, start, end, audio, options):
+        self.input = input_
+        self.stream = stream
+        self.output = output
+        self.options = dict(options or {})
+
+        tb = _fraction(stream.time_base)
+        self.start_pts = round(Fraction(start) / tb)
+        self.end_pts = round(Fraction(end) / tb)
+        self.start = start
+        self.end = end
+
+        self.out_video = output.add_stream_from_template(stream, opaque=True)
+        self.audio = {}
+        if audio:
+            for s in input_.streams.audio:
+                self.audio[s.index] = (s, output.add_stream_from_template(s))
+
+        # MP4-style H.264/HEVC: packets hold length-prefixed NAL units and the
+        # parameter sets live only in the extradata.
+        self.length_size = 0
+        codec_ctx: CodecContext = stream.codec_context
+        name = lib.avcodec_get_name(stream.ptr.codecpar.codec_id)
+        self.codec_name = name
+        extradata = codec_ctx.extradata
+        offset = _length_size_offsets.get(name)
+        if offset is not None and extradata and extradata[0] == 1:
+            self.length_size = (extradata[offset] & 3) + 1
+
+        # Whether the next copied keyframe follows re-encoded frames.
+        self.after_encode = False
+
+    def run(self):
+        input_ = self.input
+        stream = self.stream
+        input_.seek(self.start_pts, stream=stream)
+
+        gop: list = []
+        head: cython.bint = True
+        video_done: cython.bint = False
+        audio_left = set(self.audio)
+        packet: Packet
+
+        streams = [stream] + [s for s, _ in self.audio.values()]
+        for packet in input_.demux(streams):
+            if packet.ptr.stream_index != stream.ptr.index:
+                self.copy_audio(packet, audio_left)
+                if video_done and not audio_left:
+                    break
+                continue
+            if video_done or packet.ptr.size == 0:
+                continue
+            if packet.ptr.pts == lib.AV_NOPTS_VALUE:
+                continue
+
+            pts = packet.ptr.pts
+            dts = packet.ptr.dts if packet.ptr.dts != lib.AV_NOPTS_VALUE else pts
+            keyframe = packet.is_keyframe
+
+            if head:
+                if keyframe and self.start_pts <= pts < self.end_pts:
+                    # The first keyframe inside the clip: re-encode up to it,
+                    # shifting decoding timestamps below those it starts.
+                    self.encode(gop, self.start_pts, pts, pts - dts)
+                    gop = [packet]
+                    head = False
+                elif dts >= self.end_pts:
+                    self.encode(gop, self.start_pts, self.end_pts, 0)
+                    gop = []
+                    video_done = True
+                elif keyframe and pts < self.start_pts:
+                    # Closed GOPs: nothing before this keyframe is needed.
+                    gop = [packet]
+                else:
+                    gop.append(packet)
+            elif keyframe and pts < self.end_pts:
+                self.copy(gop)
+                gop = [packet]
+            elif keyframe or dts >= self.end_pts:
+                self.finish(gop)
+                gop = []
+                video_done = True
+            else:
+                gop.append(packet)
+
+            if video_done and not audio_left:
+                break
+
+        if not video_done:
+            if head:
+                self.encode(gop, self.start_pts, self.end_pts, 0)
+            else:
+                self.finish(gop)
+
+    def copy_audio(self, packet: Packet, audio_left: set):
+        if packet.ptr.pts == lib.AV_NOPTS_VALUE or packet.ptr.size == 0:
+            return
+        in_stream, out_stream = self.audio[packet.ptr.stream_index]
+        tb = _fraction(in_stream.time_base)
+        time = packet.ptr.pts * tb
+        if time >= self.end:
+            audio_left.discard(packet.ptr.stream_index)
+            return
+        if time < self.start:
+            return
+
+        offset = round(Fraction(self.start) / tb)
+        packet.ptr.pts -= offset
+        if packet.ptr.dts != lib.AV_NOPTS_VALUE:
+            packet.ptr.dts -= offset
+        packet.stream = out_stream
+        self.output.mux_one(packet)
+
+    def finish(self, gop: list):
+        """Write the last GOP: copied if it ends inside the clip, else
+        re-encoded up to the end."""
+        if not gop:
+            return
+        if max(p.pts for p in gop) < self.end_pts:
+            self.copy(gop)
+        else:
+            first: Packet = gop[0]
+            self.encode(gop, first.ptr.pts, self.end_pts, 0)
+
+    def copy(self, gop: list):
+        packet: Packet
+        first: cython.bint = True
+        for packet in gop:
+            if first and self.after_encode and self.length_size:
+                packet = self.with_parameter_sets(packet)
+            first = False
+            packet.ptr.pts -= self.start_pts
+            if packet.ptr.dts != lib.AV_NOPTS_VALUE:
+                packet.ptr.dts -= self.start_pts
+            packet.stream = self.out_video
+            self.output.mux_one(packet)
+        self.after_encode = False
+
+    def encode(self, gop: list, lo, hi, dts_shift):
+        """Decode ``gop`` and re-encode its frames with ``lo <= pts < hi``."""
+        if not gop:
+            return
+
+        decoder: CodecContext = self.stream.codec_context
+        frames: list = []
+        frame: VideoFrame
+        packet: Packet
+        for packet in itertools.chain(gop, [None]):
+            for frame in decoder.decode(packet):
+                if frame.ptr.pts != lib.AV_NOPTS_VALUE and lo <= frame.ptr.pts < hi:
+                    frames.append(frame)
+        decoder.flush_buffers()
+        if not frames:
+            return
+
+        encoder: CodecContext = self.make_encoder(frames[0])
+        shift = 0
+        if dts_shift:
+            # Round up, so the shift is never less than the copied packets'.
+            shift = -(
+                -dts_shift
+                * _fraction(self.stream.time_base)
+                // _fraction(encoder.time_base)
+            )
+
+        for frame in itertools.chain(frames, [None]):
+            if frame is not None:
+                frame.ptr.pts -= self.start_pts
+                frame.ptr.pict_type = lib.AV_PICTURE_TYPE_NONE
+            for packet in encoder.encode(frame):
+                if self.length_size:
+                    packet = _with_data(
+                        packet, _length_prefixed(bytes(packet), self.length_size)
+                    )
+                if packet.ptr.dts != lib.AV_NOPTS_VALUE:
+                    packet.ptr.dts -= shift
+                packet.stream = self.out_video
+                self.output.mux_one(packet)
+        self.after_encode = True
+
+    def make_encoder(self, frame: VideoFrame):
+        stream: Stream = self.stream
+        decoder: CodecContext = stream.codec_context
+        codec = Codec(self.codec_name, "w")
+        encoder: CodecContext = CodecContext.create(codec, "w")
+
+        formats = [f.name for f in codec.video_formats or ()]
+        fmt = frame.format.name
+        encoder.pix_fmt = fmt if not formats or fmt in formats else formats[0]
+        encoder.width = frame.width
+        encoder.height = frame.height
+
+        rate = stream.average_rate or stream.guessed_rate
+        if rate:
+            encoder.framerate = rate
+        tb = _fraction(stream.time_base)
+        if tb.denominator > 65535 and rate:
+            # Some encoders, such as mpeg4, cannot store finer time bases.
+            tb = 1 / _fraction(rate)
+        encoder.time_base = tb
+
+        d: cython.pointer[lib.AVCodecContext] = encoder.ptr
+        s: cython.pointer[lib.AVCodecContext] = decoder.ptr
+        d.bit_rate = s.bit_rate
+        d.sample_aspect_ratio = s.sample_aspect_ratio
+        d.color_primaries = s.color_primaries
+        d.color_trc = s.color_trc
+        d.colorspace = s.colorspace
+        d.color_range = s.color_range
+        d.chroma_sample_location = s.chroma_sample_location
+        # One keyframe, no reordering: a boundary segment is a single GOP
+        # whose decoding order matches its presentation order.
+        d.gop_size = 1 << 16
+        d.max_b_frames = 0
+
+        encoder.options.update(self.options)
+        return encoder
+
+    def with_parameter_sets(self, packet: Packet) -> Packet:
+        # The annexb filter puts the extradata's parameter sets in front of a
+        # keyframe; convert back to the length-prefixed form of the rest.
+        bsf = BitStreamFilterContext(f"{self.codec_name}_mp4toannexb", self.stream)
+        out = bsf.filter(packet) + bsf.filter(None)
+        if len(out) != 1:
+            return packet
+        return _with_data(packet, _length_prefixed(bytes(out[0]), self.length_size))
+
+
+def _fraction(rational):
+    return Fraction(rational.numerator, rational.denominator)
+
+
+def _split_annexb(data):
+    """Split an Annex B byte stream into NAL units, without start codes."""
+    nals = []
+    i = data.find(b"\x00\x00\x01")
+    while i >= 0:
+        begin = i + 3
+        i = data.find(b"\x00\x00\x01", begin)
+        end = len(data) if i < 0 else i
+        # A four-byte start code leaves a zero at the end of the unit before.
+        while end > begin and data[end - 1] == 0 and i >= 0:
+            end -= 1
+        nals.append(data[begin:end])
+    return nals
+
+
+def _length_prefixed(data, size):
+    if not data.startswith((b"\x00\x00\x01", b"\x00\x00\x00\x01")):
+        return data
+    return b"".join(len(n).to_bytes(size, "big") + n for n in _split_annexb(data))
+
+
+@cython.cfunc
+def _with_data(packet: Packet, data) -> Packet:
+    out: Packet = Packet(data)
+    out.ptr.pts = packet.ptr.pts
+    out.ptr.dts = packet.ptr.dts
+    out.ptr.duration = packet.ptr.duration
+    out.ptr.flags = packet.ptr.flags
+    out.ptr.time_base = packet.ptr.time_base
+    return out
@@ -0,0 +1,15 @@
+from typing import Any
+
+from .video.stream import VideoStream
+
+def extract(
+    source: Any,
+    start: float,
+    end: float,
+    output: Any,
+    *,
+    stream: VideoStream | None = None,
+    audio: bool = True,
+    format: str | None = None,
+    options: dict[str, str] | None = None,
+) -> None: ...
@@ -352,6 +352,16 @@ class Codec:
         """
         return bool(self.ptr.capabilities & lib.AV_CODEC_CAP_DELAY)
 
+    @property
+    def max_lowres(self):
+        """
+        Maximum value of the ``lowres`` decoder option, which decodes at
+        ``1 / 2**lowres`` of the coded size. ``0`` if the decoder cannot.
+
+        :rtype: int
+        """
+        return self.ptr.max_lowres
+
 
 @cython.cfunc
 def get_codec_names():
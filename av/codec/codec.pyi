@@ -101,6 +101,8 @@ class Codec:
     def experimental(self) -> bool: ...
     @property
     def delay(self) -> bool: ...
+    @property
+    def max_lowres(self) -> int: ...
     def __init__(self, name: str, mode: Literal["r", "w"] = "r") -> None: ...
     @overload
     def create(self, kind: Literal["video"]) -> VideoCodecContext: ...
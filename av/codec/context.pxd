@@ -13,6 +13,7 @@ cdef class CodecContext:
     # scalars, so there are no padding holes between them.
     cdef lib.AVCodecContext *ptr
     cdef lib.AVCodecParserContext *parser
+    cdef lib.AVPacket *_recv_scratch  # avcodec_receive_packet() target
     cdef public dict options
     cdef HWAccel hwaccel_ctx
     cdef Frame _next_frame
@@ -27,6 +28,7 @@ cdef class CodecContext:
 
     cpdef open(self, bint strict=?)
     cpdef encode(self, Frame frame=?)
+    cpdef int encode_into(self, Frame frame, list packets)
     cpdef decode(self, Packet packet=?)
     cdef _decode(self, Packet packet)
     cpdef flush_buffers(self)
@@ -48,3 +50,4 @@ cdef class CodecContext:
     cdef Frame _alloc_next_frame(self)
 
 cdef CodecContext wrap_codec_context(lib.AVCodecContext*, const lib.AVCodec*, HWAccel hwaccel)
+cdef void copy_encoder_settings(CodecContext src, CodecContext dst)
@@ -58,6 +58,43 @@ def wrap_codec_context(
     return py_ctx
 
 
+@cython.cfunc
+def copy_encoder_settings(src: CodecContext, dst: CodecContext) -> cython.void:
+    """Copy the settings an encoder is opened with from ``src`` to ``dst``."""
+    s: cython.pointer[lib.AVCodecContext] = src.ptr
+    d: cython.pointer[lib.AVCodecContext] = dst.ptr
+
+    d.width = s.width
+    d.height = s.height
+    d.pix_fmt = s.pix_fmt
+    d.time_base = s.time_base
+    d.framerate = s.framerate
+    d.sample_aspect_ratio = s.sample_aspect_ratio
+    d.color_primaries = s.color_primaries
+    d.color_trc = s.color_trc
+    d.colorspace = s.colorspace
+    d.color_range = s.color_range
+    d.chroma_sample_location = s.chroma_sample_location
+
+    d.bit_rate = s.bit_rate
+    d.bit_rate_tolerance = s.bit_rate_tolerance
+    d.rc_max_rate = s.rc_max_rate
+    d.rc_buffer_size = s.rc_buffer_size
+    d.global_quality = s.global_quality
+    d.compression_level = s.compression_level
+    d.qmin = s.qmin
+    d.qmax = s.qmax
+    d.gop_size = s.gop_size
+    d.max_b_frames = s.max_b_frames
+    d.flags = s.flags
+    d.flags2 = s.flags2
+    d.profile = s.profile
+    d.level = s.level
+
+    d.thread_type = s.thread_type
+    d.thread_count = s.thread_count
+
+
 class ThreadType(Flag):
     NONE = 0
     FRAME: "Decode more than one frame at once" = lib.FF_THREAD_FRAME
@@ -445,6 +482,8 @@ class CodecContext:
             lib.avcodec_free_context(cython.address(self.ptr))
         if self.parser:
             lib.av_parser_close(self.parser)
+        if self._recv_scratch:
+            lib.av_packet_free(cython.address(self._recv_scratch))
 
     def __repr__(self):
         _type = self.type or "<notype>"
@@ -654,18 +693,25 @@ class CodecContext:
 
     @cython.cfunc
     def _recv_packet(self):
-        packet: Packet = Packet()
-        res: cython.int
+        # Receive into a scratch packet, so that the EAGAIN lookahead encoders
+        # return for most frames costs no allocation; a Packet is only made
+        # when there is one.
+        if self._recv_scratch == cython.NULL:
+            self._recv_scratch = lib.av_packet_alloc()
+            if self._recv_scratch == cython.NULL:
+                raise MemoryError("Could not allocate AVPacket")
 
+        res: cython.int
         with cython.nogil:
-            res = lib.avcodec_receive_packet(self.ptr, packet.ptr)
+            res = lib.avcodec_receive_packet(self.ptr, self._recv_scratch)
 
         if res == -EAGAIN or res == lib.AVERROR_EOF:
             return
 
         err_check(res, "avcodec_receive_packet()")
-        if not res:
-            return packet
+        packet: Packet = Packet.__new__(Packet)
+        lib.av_packet_move_ref(packet.ptr, self._recv_scratch)
+        return packet
 
     @cython.cfunc
     def _prepare_and_time_rebase_frames_for_encode(self, frame: Frame):
@@ -698,12 +744,36 @@ class CodecContext:
     @cython.ccall
     def encode(self, frame: Frame | None = None):
         """Encode a list of :class:`.Packet` from the given :class:`.Frame`."""
-        res = []
+        res: list = []
+        self.encode_into(frame, res)
+        return res
+
+    @cython.ccall
+    def encode_into(self, frame: Frame | None, packets: list) -> cython.int:
+        """encode_into(frame, packets)
+
+        Like :meth:`encode`, but append the packets to a list the caller owns,
+        such as one reused across frames, rather than returning a new one.
+
+        :return: The number of packets appended.
+        """
+        count: cython.int = 0
+        res: cython.int
+        packet: Packet
         for frame in self._prepare_and_time_rebase_frames_for_encode(frame):
-            for packet in self._send_frame_and_recv(frame):
+            with cython.nogil:
+                res = lib.avcodec_send_frame(
+                    self.ptr, frame.ptr if frame is not None else cython.NULL
+                )
+            err_check(res, "avcodec_send_frame()")
+
+            packet = self._recv_packet()
+            while packet is not None:
                 self._setup_encoded_packet(packet)
-                res.append(packet)
-        return res
+                packets.append(packet)
+                count += 1
+                packet = self._recv_packet()
+        return count
 
     def encode_lazy(self, frame: Frame | None = None):
         for frame in self._prepare_and_time_rebase_frames_for_encode(frame):
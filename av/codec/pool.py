@@ -0,0 +1,217 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import cython
+from cython.cimports import libav as lib
+from cython.cimports.av.audio.codeccontext import AudioCodecContext
+from cython.cimports.av.codec.context import CodecContext
+from cython.cimports.av.container.output import OutputContainer
+
+from av.codec.codec import Codec
+
+
+class EncoderPool:
+    """EncoderPool(max_idle=4)
+
+    Keep opened encoders for many short encodes with the same settings.
+
+    Creating an encoder, parsing its options and opening it costs far more
+    than encoding a thumbnail or a two-second clip. The pool opens an encoder
+    for each distinct combination of codec, options and settings the first
+    time it is asked for one, and hands it out again once it is released.
+
+    On :meth:`release`, an encoder that supports it (see
+    :attr:`.Capabilities.encoder_flush`) is reset with
+    :meth:`.CodecContext.flush_buffers` and kept; any other is freed, and a
+    replacement is opened on a background thread, which the next
+    :meth:`acquire` waits for only if it is not ready yet. Release an encoder
+    only once its last packets are written, and do not change its settings
+    while it is checked out, since it goes back to the pool under the
+    settings it was acquired with.
+
+    The pool may be shared between threads; each encoder is only ever checked
+    out to one caller at a time.
+
+    :param int max_idle: How many released encoders to keep for each set of
+        settings. Others are freed.
+
+    ::
+
+        pool = EncoderPool()
+
+        def preview(frames, file):
+            output = av.open(file, "w", format="webp")
+            stream = pool.add_stream(output, "libwebp", width=320, height=180)
+            try:
+                with output:
+                    for frame in frames:
+                        output.mux(stream.encode(frame))
+                    output.mux(stream.encode(None))
+            finally:
+                # The container is closed, whether or not encoding succeeded.
+                pool.release(stream.codec_context)
+
+    """
+
+    def __init__(self, max_idle=4):
+        if max_idle < 0:
+            raise ValueError("max_idle must not be negative")
+        self.max_idle = max_idle
+        self._idle = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+        self._opener = None
+
+    def acquire(self, codec, rate=None, options=None, *, global_header=False, **kwargs):
+        """acquire(codec, rate=None, options=None, *, global_header=False, **kwargs)
+
+        Check out an open encoder, opening a new one if none is idle.
+
+        Video encoders default to ``yuv420p`` at 24 frames per second, and
+        audio encoders to stereo in the codec's first sample format, as with
+        :meth:`.OutputContainer.add_stream`.
+
+        :param codec: The name of the encoder, or a :class:`.Codec`.
+        :param rate: The frame rate of video, or the sample rate of audio.
+        :param dict options: Codec options.
+        :param bool global_header: Open the encoder with
+            ``AV_CODEC_FLAG_GLOBAL_HEADER``, as formats such as MP4 want.
+        :param \\**kwargs: Set attributes of the encoder before it is opened,
+            such as ``width``, ``height``, ``pix_fmt`` or ``time_base``.
+        :rtype: CodecContext
+        """
+        name = codec.name if isinstance(codec, Codec) else codec
+        key = (
+            name,
+            rate,
+            tuple(sorted((options or {}).items())),
+            bool(global_header),
+            tuple(sorted(kwargs.items())),
+        )
+
+        ctx = None
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                # Rather an encoder that is ready than one still opening.
+                i = len(idle) - 1
+                while i > 0 and isinstance(idle[i], Future) and not idle[i].done():
+                    i -= 1
+                ctx = idle.pop(i)
+        if isinstance(ctx, Future):
+            try:
+                ctx = ctx.result()
+            except Exception:
+                # Open it here instead, so the caller gets the error.
+                ctx = None
+        if ctx is None:
+            ctx = _open_encoder(key)
+        with self._lock:
+            self._keys[ctx] = key
+        return ctx
+
+    def add_stream(self, container, codec, rate=None, options=None, **kwargs):
+        """add_stream(container, codec, rate=None, options=None, **kwargs)
+
+        Check out an encoder as with :meth:`acquire` and add a stream that
+        encodes with it to ``container``, through
+        :meth:`.OutputContainer.add_stream_from_context`.
+
+        The encoder gets a global header if the container's format wants one.
+        Release :attr:`~.Stream.codec_context` once the container is closed.
+
+        :rtype: Stream
+        """
+        output: OutputContainer = container
+        ctx = self.acquire(
+            codec,
+            rate,
+            options,
+            global_header=bool(output.ptr.oformat.flags & lib.AVFMT_GLOBALHEADER),
+            **kwargs,
+        )
+        try:
+            return output.add_stream_from_context(ctx)
+        except Exception:
+            self.release(ctx)
+            raise
+
+    def release(self, codec_context):
+        """release(codec_context)
+
+        Return an encoder from :meth:`acquire` to the pool.
+        """
+        with self._lock:
+            key = self._keys.pop(codec_context, None)
+            keep = key is not None and len(self._idle.get(key, ())) < self.max_idle
+        if key is None:
+            raise ValueError("codec context is not checked out from this pool")
+        if not keep:
+            return
+
+        ctx: CodecContext = codec_context
+        audio: AudioCodecContext
+        if ctx.ptr.codec.capabilities & lib.AV_CODEC_CAP_ENCODER_FLUSH:
+            ctx.flush_buffers()
+            # Frames without a pts are numbered from here.
+            ctx.ptr.frame_num = 0
+            if isinstance(ctx, AudioCodecContext):
+                # It holds the samples and timestamps of the last encode.
+                audio = ctx
+                audio.resampler = None
+            replacement = ctx
+        else:
+            replacement = None
+
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) >= self.max_idle:
+                return
+            if replacement is None:
+                if self._opener is None:
+                    self._opener = ThreadPoolExecutor(
+                        1, thread_name_prefix="EncoderPool"
+                    )
+                replacement = self._opener.submit(_open_encoder, key)
+            idle.append(replacement)
+
+    def clear(self):
+        """Free every idle encoder."""
+        with self._lock:
+            for idle in self._idle.values():
+                for ctx in idle:
+                    if isinstance(ctx, Future):
+                        ctx.cancel()
+            self._idle.clear()
+
+    def __len__(self):
+        """The number of idle encoders, counting those still being opened."""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+
+def _open_encoder(key):
+    name, rate, options, global_header, settings = key
+
+    codec = Codec(name, "w")
+    ctx: CodecContext = CodecContext.create(codec, "w")
+    if codec.type == "video":
+        formats = [f.name for f in codec.video_formats or ()]
+        ctx.pix_fmt = "yuv420p" if not formats or "yuv420p" in formats else formats[0]
+        ctx.framerate = rate or 24
+    elif codec.type == "audio":
+        formats = codec.audio_formats
+        if formats:
+            ctx.format = formats[0]
+        ctx.sample_rate = rate or 48000
+        ctx.layout = "stereo"
+    else:
+        raise ValueError(f"cannot encode {codec.type} streams")
+
+    if global_header:
+        ctx.ptr.flags |= lib.AV_CODEC_FLAG_GLOBAL_HEADER
+    for k, v in settings:
+        setattr(ctx, k, v)
+    ctx.options = dict(options)
+    ctx.open()
+    return ctx
@@ -0,0 +1,31 @@
+from typing import Any
+
+from av.codec.codec import Codec
+from av.codec.context import CodecContext
+from av.container import OutputContainer
+from av.stream import Stream
+
+class EncoderPool:
+    max_idle: int
+
+    def __init__(self, max_idle: int = 4) -> None: ...
+    def acquire(
+        self,
+        codec: str | Codec,
+        rate: Any = None,
+        options: dict[str, str] | None = None,
+        *,
+        global_header: bool = False,
+        **kwargs: Any,
+    ) -> CodecContext: ...
+    def add_stream(
+        self,
+        container: OutputContainer,
+        codec: str | Codec,
+        rate: Any = None,
+        options: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Stream: ...
+    def release(self, codec_context: CodecContext) -> None: ...
+    def clear(self) -> None: ...
+    def __len__(self) -> int: ...
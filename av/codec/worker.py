@@ -0,0 +1,134 @@
+import queue
+import threading
+
+
+class EncoderWorker:
+    """EncoderWorker(stream, container=None, maxsize=8)
+
+    Encode frames for a stream on a background thread.
+
+    :meth:`submit` hands a frame to the worker and returns as soon as there is
+    room in its queue, so the caller can produce the next frame while the
+    previous ones are reformatted and encoded. FFmpeg releases the GIL for
+    both, so the two genuinely overlap.
+
+    The worker never muxes itself, since a container may only be written from
+    one thread at a time. With a ``container``, the packets that are ready are
+    muxed on the caller's thread whenever it calls :meth:`submit` or
+    :meth:`close`; without one, collect them with :meth:`packets`.
+
+    A frame must not be modified once it has been submitted.
+
+    While the worker runs, its thread is the only one that touches the
+    stream's codec context; the caller's thread only submits frames and
+    muxes packets. Writing the container's header reads that context, so
+    with a ``container`` it is written before the thread starts, which means
+    every stream must have been added by then. Without one, call
+    :meth:`.OutputContainer.start_encoding` before creating the worker if
+    its packets are muxed while it runs.
+
+    :param stream: The output stream to encode for.
+    :param container: The :class:`.OutputContainer` to mux into, if any.
+    :param int maxsize: How many frames may wait to be encoded before
+        :meth:`submit` blocks.
+
+    ::
+
+        with EncoderWorker(stream, container) as worker:
+            for frame in render():
+                worker.submit(frame)
+
+    """
+
+    def __init__(self, stream, container=None, maxsize=8):
+        self.stream = stream
+        self.container = container
+        self._frames = queue.Queue(maxsize)
+        self._packets = queue.SimpleQueue()
+        self._error = None
+        self._closed = False
+        if container is not None:
+            container.start_encoding()
+        self._thread = threading.Thread(
+            target=self._run, name=f"EncoderWorker-{stream.index}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        frame = True
+        try:
+            while frame is not None:
+                frame = self._frames.get()
+                for packet in self.stream.encode(frame):
+                    self._packets.put(packet)
+        except BaseException as e:
+            self._error = e
+            # Keep taking frames so that a submit() blocked on a full queue
+            # wakes up and sees the error.
+            while frame is not None:
+                frame = self._frames.get()
+
+    def _check(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _deliver(self):
+        packets = self.packets()
+        if self.container is None:
+            return packets
+        for packet in packets:
+            self.container.mux_one(packet)
+        return []
+
+    def submit(self, frame):
+        """Queue a frame to be encoded, blocking while the queue is full.
+
+        Raises any error the worker has hit since the last call.
+        """
+        if self._closed:
+            raise ValueError("EncoderWorker is closed")
+        if frame is None:
+            raise ValueError("use close() to flush the encoder")
+        self._check()
+        self._frames.put(frame)
+        self._deliver()
+
+    def packets(self):
+        """Take the packets encoded so far without waiting.
+
+        :rtype: list[Packet]
+        """
+        packets = []
+        while True:
+            try:
+                packets.append(self._packets.get_nowait())
+            except queue.Empty:
+                return packets
+
+    def close(self):
+        """Flush the encoder and wait for the worker to finish.
+
+        :return: The packets not yet collected, or ``[]`` when muxing into a
+            container, in which case they have been muxed.
+        :rtype: list[Packet]
+        """
+        if self._closed:
+            return []
+        self._closed = True
+        self._frames.put(None)
+        self._thread.join()
+        self._check()
+        return self._deliver()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif not self._closed:
+            # Stop the thread, but let the original exception propagate.
+            self._closed = True
+            self._frames.put(None)
+            self._thread.join()
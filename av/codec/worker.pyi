@@ -0,0 +1,27 @@
+from types import TracebackType
+
+from av.container import OutputContainer
+from av.frame import Frame
+from av.packet import Packet
+from av.stream import Stream
+
+class EncoderWorker:
+    stream: Stream
+    container: OutputContainer | None
+
+    def __init__(
+        self,
+        stream: Stream,
+        container: OutputContainer | None = None,
+        maxsize: int = 8,
+    ) -> None: ...
+    def submit(self, frame: Frame) -> None: ...
+    def packets(self) -> list[Packet]: ...
+    def close(self) -> list[Packet]: ...
+    def __enter__(self) -> EncoderWorker: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
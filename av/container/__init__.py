@@ -1,3 +1,6 @@
+from .concat import concat
 from .core import Container, Flags, open
 from .input import InputContainer as InputContainer
 from .output import OutputContainer as OutputContainer
+from .segmented import Segment as Segment
+from .segmented import SegmentedOutput as SegmentedOutput
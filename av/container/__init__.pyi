@@ -1,3 +1,5 @@
+from .concat import *
 from .core import *
 from .input import *
 from .output import *
+from .segmented import *
@@ -0,0 +1,18 @@
+cimport libav as lib
+from libc.stdint cimport int64_t
+
+from av.packet cimport Packet
+from av.stream cimport Stream
+
+
+cdef class _Track:
+    cdef Stream stream
+    cdef tuple signature
+    cdef lib.AVRational time_base
+    cdef int64_t shift
+    cdef int64_t last_dts
+    cdef int64_t end
+    cdef int64_t step
+    cdef bint started
+
+    cdef void retime(self, Packet packet)
@@ -0,0 +1,334 @@
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+import cython
+from cython.cimports import libav as lib
+from cython.cimports.av.container.input import InputContainer
+from cython.cimports.av.container.output import OutputContainer
+from cython.cimports.av.packet import Packet
+from cython.cimports.av.stream import Stream
+from cython.cimports.libc.stdint import int64_t
+
+# The stream types that are copied; data and attachment streams are dropped.
+_copied_types = ("video", "audio", "subtitle")
+
+# What must match between inputs, in the order of _Track.signature.
+_signature_fields = (
+    "type",
+    "codec",
+    "format",
+    "width",
+    "height",
+    "sample rate",
+    "channels",
+    "extradata",
+)
+
+# How many packets are handed to OutputContainer.mux() at once.
+_batch_size = 64
+
+
+def concat(inputs, output, *, format=None, prefetch=False):
+    """concat(inputs, output, *, format=None, prefetch=False)
+
+    Join inputs end to end into one output without re-encoding.
+
+    The audio, video, and subtitle streams of the first input become the
+    streams of the output, and every later input must have the same streams
+    in the same order, with the same codec parameters: codec, pixel or sample
+    format, size, sample rate, channels and extradata. Anything else raises
+    :class:`ValueError` before a packet of that input is written.
+
+    Each input is placed where the previous one ends, which is the latest
+    end of any of its packets, and is rebased from its own start, so
+    timestamps run on without a gap whatever each input started at. Packets
+    are rescaled to the time base of the first input's streams, so inputs
+    may use different time bases. Packets an input's edit list marks for
+    discarding, such as audio encoder priming, are dropped from every input
+    but the first, where they would overlap the end of the previous one;
+    such an input starts at the earliest packet that is kept.
+
+    Inputs are opened one at a time and their packets copied as they are
+    read, so memory use does not grow with the number or length of inputs.
+
+    :param inputs: An iterable of anything :func:`av.open` accepts, or of
+        open :class:`.InputContainer`, which are left open. Inputs are opened
+        as they are reached, so this can be a generator.
+    :param output: Anything :func:`av.open` accepts for writing, or an open
+        :class:`.OutputContainer`, which is left open.
+    :param str format: Passed to :func:`av.open` when ``output`` is not open.
+    :param bool prefetch: Open the next input on a background thread while
+        the current one is copied, hiding the cost of probing it.
+
+    ::
+
+        av.concat(sorted(glob.glob("chunks/*.ts")), "recording.mp4", prefetch=True)
+
+    """
+    from av.container.core import open
+
+    output_: OutputContainer
+    owned_output: cython.bint = not isinstance(output, OutputContainer)
+    output_ = open(output, "w", format=format) if owned_output else output
+    try:
+        _concat(iter(inputs), output_, prefetch)
+    finally:
+        if owned_output:
+            output_.close()
+
+
+def _open_input(source):
+    if isinstance(source, InputContainer):
+        return source, False
+
+    from av.container.core import open
+
+    return open(source, "r"), True
+
+
+def _concat(inputs, output: OutputContainer, prefetch):
+    pool = ThreadPoolExecutor(1, thread_name_prefix="concat") if prefetch else None
+    source = next(inputs, None)
+    # A future opening the next input when prefetching, or the input itself.
+    upcoming = None
+    if source is not None:
+        upcoming = pool.submit(_open_input, source) if pool is not None else source
+
+    tracks: list = None
+    track: _Track
+    offset = Fraction(0)
+    index: cython.Py_ssize_t = 0
+    try:
+        while upcoming is not None:
+            if pool is not None:
+                input_, owned = upcoming.result()
+            else:
+                input_, owned = _open_input(upcoming)
+            upcoming = None
+            try:
+                source = next(inputs, None)
+                if source is not None:
+                    upcoming = (
+                        pool.submit(_open_input, source) if pool is not None else source
+                    )
+
+                streams = [s for s in input_.streams if s.type in _copied_types]
+                if tracks is None:
+                    if not streams:
+                        raise ValueError("first input has nothing to copy")
+                    tracks = [
+                        _Track(s, output.add_stream_from_template(s, opaque=True))
+                        for s in streams
+                    ]
+                else:
+                    _check_compatible(index, tracks, streams)
+
+                _copy(input_, streams, tracks, output, offset, index == 0)
+                for track in tracks:
+                    offset = max(offset, track.end_time())
+            finally:
+                if owned:
+                    input_.close()
+            index += 1
+    finally:
+        if pool is not None:
+            if upcoming is not None and not upcoming.cancel():
+                # Already opening; close it once it is open.
+                try:
+                    input_, owned = upcoming.result()
+                    if owned:
+                        input_.close()
+                except Exception:
+                    pass
+            pool.shutdown()
+
+
+def _check_compatible(index, tracks: list, streams: list):
+    if len(streams) != len(tracks):
+        raise ValueError(
+            f"input {index} has {len(streams)} streams to copy, "
+            f"but the first has {len(tracks)}"
+        )
+    track: _Track
+    for i, (track, stream) in enumerate(zip(tracks, streams)):
+        signature = _signature(stream)
+        for name, a, b in zip(_signature_fields, track.signature, signature):
+            if a != b:
+                raise ValueError(
+                    f"stream {i} of input {index} does not match the first input: "
+                    f"its {name} differs"
+                )
+
+
+@cython.cfunc
+def _signature(stream: Stream) -> tuple:
+    par: cython.pointer[lib.AVCodecParameters] = stream.ptr.codecpar
+    extradata = (
+        par.extradata[: par.extradata_size] if par.extradata != cython.NULL else b""
+    )
+    return (
+        par.codec_type,
+        par.codec_id,
+        par.format,
+        par.width,
+        par.height,
+        par.sample_rate,
+        par.ch_layout.nb_channels,
+        extradata,
+    )
+
+
+@cython.cfunc
+def _copy(
+    input_: InputContainer,
+    streams: list,
+    tracks: list,
+    output: OutputContainer,
+    offset,
+    first: cython.bint,
+) -> cython.void:
+    by_index: dict = {}
+    stream: Stream
+    track: _Track
+    for stream, track in zip(streams, tracks):
+        by_index[stream.ptr.index] = track
+
+    # Later inputs are rebased from their first kept packet, since their start
+    # time counts the packets dropped below. Packets are held back until every
+    # stream has had one, as the earliest need not come first.
+    pending: list = None
+    waiting: set = None
+    if first:
+        _begin(tracks, offset, input_.start_time or 0)
+    else:
+        pending = []
+        waiting = set(by_index)
+
+    packet: Packet
+    held: Packet
+    packets: list = []
+    for packet in input_.demux(streams):
+        if packet.ptr.size == 0:
+            continue
+        if not first and packet.ptr.flags & lib.AV_PKT_FLAG_DISCARD:
+            continue
+        if pending is not None:
+            pending.append(packet)
+            waiting.discard(packet.ptr.stream_index)
+            if waiting and len(pending) < _batch_size:
+                continue
+            _begin(tracks, offset, _first_time(pending, input_))
+            for held in pending:
+                _add(by_index, held, packets, output)
+            pending = None
+            continue
+        _add(by_index, packet, packets, output)
+
+    if pending:
+        _begin(tracks, offset, _first_time(pending, input_))
+        for held in pending:
+            _add(by_index, held, packets, output)
+    if packets:
+        output.mux(packets)
+
+
+@cython.cfunc
+def _begin(tracks: list, offset, start) -> cython.void:
+    track: _Track
+    for track in tracks:
+        track.begin(offset, start)
+
+
+@cython.cfunc
+def _first_time(packets: list, input_: InputContainer):
+    """The earliest timestamp of ``packets``, in ``AV_TIME_BASE`` units."""
+    us: lib.AVRational
+    us.num = 1
+    us.den = lib.AV_TIME_BASE
+    packet: Packet
+    ts: int64_t
+    start = None
+    for packet in packets:
+        ts = packet.ptr.pts if packet.ptr.pts != lib.AV_NOPTS_VALUE else packet.ptr.dts
+        if ts == lib.AV_NOPTS_VALUE:
+            continue
+        ts = lib.av_rescale_q(ts, packet.ptr.time_base, us)
+        if start is None or ts < start:
+            start = ts
+    if start is None:
+        return input_.start_time or 0
+    return start
+
+
+@cython.cfunc
+def _add(
+    by_index: dict, packet: Packet, packets: list, output: OutputContainer
+) -> cython.void:
+    track: _Track = by_index[packet.ptr.stream_index]
+    track.retime(packet)
+    packet._stream = track.stream
+    packet.ptr.stream_index = track.stream.ptr.index
+    packets.append(packet)
+    if len(packets) >= _batch_size:
+        output.mux(packets)
+        packets.clear()
+
+
+@cython.final
+@cython.cclass
+class _Track:
+    """Places one output stream's packets on the joined timeline.
+
+    Timestamps are kept in the time base of the first input's stream. Each
+    input is shifted so that its start lands on the running offset, and
+    decoding timestamps are nudged forward where a boundary would otherwise
+    repeat one, which muxers reject.
+    """
+
+    def __init__(self, template: Stream, stream: Stream):
+        self.stream = stream
+        self.signature = _signature(template)
+        self.time_base = template.ptr.time_base
+        self.shift = 0
+        self.last_dts = 0
+        self.end = 0
+        self.step = 0
+        self.started = False
+
+    def begin(self, offset, start):
+        tb = Fraction(self.time_base.num, self.time_base.den)
+        us: lib.AVRational
+        us.num = 1
+        us.den = lib.AV_TIME_BASE
+        self.shift = round(offset / tb) - lib.av_rescale_q(start, us, self.time_base)
+
+    def end_time(self):
+        return Fraction(self.end * self.time_base.num, self.time_base.den)
+
+    @cython.cfunc
+    def retime(self, packet: Packet) -> cython.void:
+        pkt: cython.pointer[lib.AVPacket] = packet.ptr
+        src: lib.AVRational = pkt.time_base
+
+        if pkt.pts != lib.AV_NOPTS_VALUE:
+            pkt.pts = lib.av_rescale_q(pkt.pts, src, self.time_base) + self.shift
+        if pkt.dts != lib.AV_NOPTS_VALUE:
+            pkt.dts = lib.av_rescale_q(pkt.dts, src, self.time_base) + self.shift
+        pkt.duration = lib.av_rescale_q(pkt.duration, src, self.time_base)
+        pkt.time_base = self.time_base
+
+        if pkt.dts != lib.AV_NOPTS_VALUE:
+            if self.started and pkt.dts <= self.last_dts:
+                pkt.dts = self.last_dts + 1
+            if pkt.pts != lib.AV_NOPTS_VALUE and pkt.pts < pkt.dts:
+                pkt.pts = pkt.dts
+            self.last_dts = pkt.dts
+            self.started = True
+
+        end: int64_t
+        if pkt.pts != lib.AV_NOPTS_VALUE:
+            if pkt.duration > 0:
+                self.step = pkt.duration
+            end = pkt.pts + (pkt.duration if pkt.duration > 0 else self.step)
+            if end > self.end:
+                self.end = end
@@ -0,0 +1,9 @@
+from typing import Any, Iterable
+
+def concat(
+    inputs: Iterable[Any],
+    output: Any,
+    *,
+    format: str | None = None,
+    prefetch: bool = False,
+) -> None: ...
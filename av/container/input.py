@@ -1,12 +1,17 @@
+import itertools
+
 import cython
 from cython.cimports.av.codec.context import CodecContext, wrap_codec_context
 from cython.cimports.av.container.streams import StreamContainer
 from cython.cimports.av.dictionary import Dictionary
+from cython.cimports.av.error import err_check
+from cython.cimports.av.frame import Frame
 from cython.cimports.av.packet import Packet
 from cython.cimports.av.stream import Stream, wrap_stream
 from cython.cimports.av.utils import avdict_to_dict
 from cython.cimports.libc.stdint import int64_t, uint8_t
 from cython.cimports.libc.stdlib import free, malloc
+from cython.cimports.libc.string import memcpy
 
 
 @cython.cfunc
@@ -243,6 +248,129 @@ class InputContainer(Container):
             if read_packet != cython.NULL:
                 lib.av_packet_free(cython.address(read_packet))
 
+    def packet_table(self, *args, **kwargs):
+        """packet_table(streams=None, video=None, audio=None, subtitles=None, data=None)
+
+        Demux the given set of :class:`.Stream` into a NumPy structured array,
+        with one row per packet and no :class:`.Packet` objects created::
+
+            table = container.packet_table(video=0)
+            keyframes = table["pts"][table["is_keyframe"]]
+
+        The fields are ``stream`` (the stream index), ``pts``, ``dts`` and
+        ``duration`` in the stream's :attr:`~.Stream.time_base`, ``pos`` (the
+        byte offset in the file), ``size`` and ``is_keyframe``. Unknown
+        timestamps are ``AV_NOPTS_VALUE`` (the smallest ``int64``), and an
+        unknown ``pos`` is ``-1``.
+
+        Reading starts at the current position, and leaves the container at
+        its end; :meth:`seek` back to decode afterwards.
+
+        .. seealso:: :meth:`.StreamContainer.get` for the interpretation of
+            the arguments.
+
+        """
+        self._assert_open()
+
+        import numpy as np
+
+        streams: list[Stream] = self.streams.get(*args, **kwargs)
+        nb_streams: cython.uint = self.ptr.nb_streams
+        include_stream: cython.pointer[uint8_t] = cython.NULL
+        read_packet: cython.pointer[lib.AVPacket] = cython.NULL
+
+        capacity: cython.Py_ssize_t = 4096
+        n: cython.Py_ssize_t = 0
+        columns = {
+            "stream": np.empty(capacity, dtype=np.int32),
+            "pts": np.empty(capacity, dtype=np.int64),
+            "dts": np.empty(capacity, dtype=np.int64),
+            "duration": np.empty(capacity, dtype=np.int64),
+            "pos": np.empty(capacity, dtype=np.int64),
+            "size": np.empty(capacity, dtype=np.int32),
+            "is_keyframe": np.empty(capacity, dtype=np.uint8),
+        }
+        stream_col: cython.int[::1] = columns["stream"]
+        pts_col: int64_t[::1] = columns["pts"]
+        dts_col: int64_t[::1] = columns["dts"]
+        duration_col: int64_t[::1] = columns["duration"]
+        pos_col: int64_t[::1] = columns["pos"]
+        size_col: cython.int[::1] = columns["size"]
+        keyframe_col: cython.uchar[::1] = columns["is_keyframe"]
+
+        i: cython.uint
+        ret: cython.int
+        timed: cython.bint = self.read_timeout is not None
+
+        self.set_timeout(self.read_timeout)
+        try:
+            if nb_streams:
+                include_stream = cython.cast(
+                    cython.pointer[uint8_t],
+                    malloc(nb_streams * cython.sizeof(uint8_t)),
+                )
+                if include_stream == cython.NULL:
+                    raise MemoryError()
+                for i in range(nb_streams):
+                    include_stream[i] = 0
+                for stream in streams:
+                    i = stream.index
+                    if i >= nb_streams:
+                        raise ValueError(f"stream index {i} out of range")
+                    include_stream[i] = 1
+
+                with cython.nogil:
+                    read_packet = lib.av_packet_alloc()
+                if read_packet == cython.NULL:
+                    raise MemoryError("Could not allocate packet")
+
+            while read_packet != cython.NULL:
+                if timed:
+                    self.start_timeout()
+                with cython.nogil:
+                    lib.av_packet_unref(read_packet)
+                    ret = lib.av_read_frame(self.ptr, read_packet)
+                if ret == lib.AVERROR_EOF:
+                    break
+                self.err_check(ret)
+
+                # Streams appearing mid-file (AVFMTCTX_NOHEADER) were never
+                # selected; see demux().
+                i = read_packet.stream_index
+                if i >= nb_streams or not include_stream[i]:
+                    continue
+
+                if n == capacity:
+                    capacity *= 2
+                    for name in list(columns):
+                        columns[name] = np.resize(columns[name], capacity)
+                    stream_col = columns["stream"]
+                    pts_col = columns["pts"]
+                    dts_col = columns["dts"]
+                    duration_col = columns["duration"]
+                    pos_col = columns["pos"]
+                    size_col = columns["size"]
+                    keyframe_col = columns["is_keyframe"]
+
+                stream_col[n] = read_packet.stream_index
+                pts_col[n] = read_packet.pts
+                dts_col[n] = read_packet.dts
+                duration_col[n] = read_packet.duration
+                pos_col[n] = read_packet.pos
+                size_col[n] = read_packet.size
+                keyframe_col[n] = (read_packet.flags & lib.AV_PKT_FLAG_KEY) != 0
+                n += 1
+        finally:
+            self.set_timeout(None)
+            free(include_stream)
+            if read_packet != cython.NULL:
+                lib.av_packet_free(cython.address(read_packet))
+
+        table = np.empty(n, dtype=packet_table_dtype())
+        for name, column in columns.items():
+            table[name] = column[:n]
+        return table
+
     def decode(self, *args, **kwargs):
         """decode(streams=None, video=None, audio=None, subtitles=None, data=None)
 
@@ -259,6 +387,213 @@ class InputContainer(Container):
         for packet in self.demux(*args, **kwargs):
             yield from packet.decode()
 
+    def decode_audio_ndarray(
+        self,
+        stream=None,
+        *,
+        rate=None,
+        layout="mono",
+        format="fltp",
+        chunk_samples=None,
+        overlap=0,
+        out=None,
+    ):
+        """decode_audio_ndarray(stream=None, *, rate=None, layout="mono", format="fltp", chunk_samples=None, overlap=0, out=None)
+
+        Decode an audio stream into fixed size NumPy chunks at a target rate,
+        layout and format::
+
+            for pts, chunk in container.decode_audio_ndarray(rate=16000):
+                features = model(chunk[0])
+
+        Frames are resampled with an ``swr`` :class:`.AudioResampler` and cut
+        by an :class:`.AudioFifo`, so each chunk costs one allocation, or none
+        when ``out`` is given.
+
+        Yields ``(pts, chunk)``, where ``pts`` counts samples at ``rate`` (so
+        ``pts / rate`` is the time in seconds) and ``chunk`` has the shape of
+        :meth:`.AudioFrame.to_ndarray`. The last chunk holds whatever is left
+        and may be shorter.
+
+        :param stream: The :class:`.AudioStream` to read, defaulting to the first.
+        :param int rate: The target sample rate, defaulting to the stream's.
+        :param layout: The target :class:`.AudioLayout`.
+        :param format: The target :class:`.AudioFormat`.
+        :param int chunk_samples: Samples per chunk, defaulting to one second.
+        :param int overlap: Samples each chunk shares with the one before it.
+        :param out: An array the shape of a full chunk to write every chunk
+            into, instead of allocating; each is then only valid until the next
+            is requested.
+
+        """
+        self._assert_open()
+        if stream is None:
+            stream = self.streams.audio[0]
+        if stream.codec_context is None:
+            raise ValueError("no decoder available for the stream")
+
+        rate = int(rate or stream.codec_context.sample_rate)
+        if not rate:
+            raise ValueError("rate is required when the stream has no sample rate")
+        chunk_samples = int(chunk_samples or rate)
+        if chunk_samples < 1:
+            raise ValueError("chunk_samples must be positive")
+        if not 0 <= overlap < chunk_samples:
+            raise ValueError("overlap must be at least 0 and less than chunk_samples")
+
+        from av.audio.resampler import AudioResampler
+
+        resampler = AudioResampler(format, layout, rate, backend="swr")
+        return self._iter_audio_ndarray(
+            stream, resampler, rate, chunk_samples, chunk_samples - overlap, out
+        )
+
+    def _iter_audio_ndarray(
+        self,
+        stream: Stream,
+        resampler,
+        rate: int64_t,
+        chunk_samples: cython.int,
+        hop: cython.int,
+        out,
+    ):
+        from av.audio.fifo import AudioFifo
+
+        fifo = AudioFifo()
+        first_pts: int64_t = 0
+        started: cython.bint = False
+        yielded: cython.bint = False
+
+        for frame in itertools.chain(self.decode(stream), [None]):
+            for resampled in resampler.resample(frame):
+                # A passthrough resampler hands the flush back as [None].
+                if resampled is None:
+                    continue
+                if not started:
+                    # Passthrough frames keep the stream's time base.
+                    if resampled.pts is not None:
+                        first_pts = round(resampled.time * rate)
+                    started = True
+                # The FIFO would check continuity against the first pts;
+                # count from it here instead.
+                resampled.pts = None
+                fifo.write(resampled)
+
+            while fifo.samples >= chunk_samples:
+                pts = first_pts + fifo.samples_read
+                chunk = fifo.peek(chunk_samples, out)
+                fifo.drain(hop)
+                yield pts, chunk
+                yielded = True
+
+        # Whatever is left, unless it was all in the last chunk's overlap.
+        remaining: cython.int = fifo.samples
+        if remaining > (chunk_samples - hop if yielded else 0):
+            yield first_pts + fifo.samples_read, fifo.peek(remaining, out)
+
+    def motion_vectors(self, stream=None, *, concatenate: cython.bint = False):
+        """motion_vectors(stream=None, *, concatenate=False)
+
+        Decode only the motion vectors of a video stream.
+
+        The decoder is run with ``export_mvs``, the ``fast`` flag, and its loop
+        filter and IDCT skipped, none of which change the exported vectors.
+        Pixels are never converted and each frame is released as soon as its
+        vectors are copied out. This uses a decoder of its own, set up before
+        it is opened, so the stream's decoder is left as it was, open or not.
+
+        Yields ``(pts, pict_type, vectors)`` for every frame, where ``vectors``
+        is a NumPy structured array with the fields of
+        :meth:`.MotionVectors.to_ndarray`, and is empty for intra frames::
+
+            for pts, pict_type, vectors in container.motion_vectors():
+                magnitude = np.hypot(vectors["motion_x"], vectors["motion_y"])
+
+        :param stream: The :class:`.VideoStream` to read, defaulting to the first.
+        :param bool concatenate: Return a single array for the whole stream
+            instead, with ``frame`` (the output frame index), ``pts`` and
+            ``pict_type`` columns ahead of the vector fields.
+
+        """
+        self._assert_open()
+        if stream is None:
+            stream = self.streams.video[0]
+        if stream.codec_context is None:
+            raise ValueError("no decoder available for the stream")
+
+        if not concatenate:
+            return self._iter_motion_vectors(stream)
+
+        import numpy as np
+
+        from av.sidedata.motionvectors import vector_dtype
+
+        mv_dtype = vector_dtype()
+        dtype = np.dtype(
+            [("frame", "int64"), ("pts", "int64"), ("pict_type", "uint8")]
+            + [(name, mv_dtype.fields[name][0]) for name in mv_dtype.names]
+        )
+
+        chunks: list = []
+        index: int64_t = 0
+        for pts, pict_type, vectors in self._iter_motion_vectors(stream):
+            chunk = np.empty(len(vectors), dtype=dtype)
+            chunk["frame"] = index
+            chunk["pts"] = lib.AV_NOPTS_VALUE if pts is None else pts
+            chunk["pict_type"] = pict_type
+            for name in mv_dtype.names:
+                chunk[name] = vectors[name]
+            chunks.append(chunk)
+            index += 1
+
+        if not chunks:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate(chunks)
+
+    def _iter_motion_vectors(self, stream: Stream):
+        import numpy as np
+
+        from av.sidedata.motionvectors import vector_dtype
+        from av.video.frame import PictureType
+
+        # Decoders may only read these settings when they are opened, and the
+        # stream's may be open already; use a decoder of our own.
+        source: CodecContext = stream.codec_context
+        codec_context: CodecContext = CodecContext.create(source.codec, "r")
+        ctx: cython.pointer[lib.AVCodecContext] = codec_context.ptr
+        err_check(lib.avcodec_parameters_to_context(ctx, stream.ptr.codecpar))
+        ctx.pkt_timebase = stream.ptr.time_base
+        ctx.thread_count = source.ptr.thread_count
+        ctx.thread_type = source.ptr.thread_type
+        ctx.flags2 |= lib.AV_CODEC_FLAG2_EXPORT_MVS | lib.AV_CODEC_FLAG2_FAST
+        ctx.skip_loop_filter = lib.AVDISCARD_ALL
+        ctx.skip_idct = lib.AVDISCARD_ALL
+        codec_context.open()
+
+        mv_dtype = vector_dtype()
+        frame: Frame
+        side_data: cython.pointer[lib.AVFrameSideData]
+        n: cython.Py_ssize_t
+        buf: cython.uchar[::1]
+
+        for packet in self.demux(stream):
+            for frame in codec_context.decode(packet):
+                side_data = lib.av_frame_get_side_data(
+                    frame.ptr, lib.AV_FRAME_DATA_MOTION_VECTORS
+                )
+                n = 0
+                if side_data != cython.NULL:
+                    n = side_data.size // cython.sizeof(lib.AVMotionVector)
+                vectors = np.empty(n, dtype=mv_dtype)
+                if n:
+                    buf = vectors.view(np.uint8)
+                    memcpy(
+                        cython.address(buf[0]),
+                        side_data.data,
+                        n * cython.sizeof(lib.AVMotionVector),
+                    )
+                yield frame.pts, PictureType(frame.ptr.pict_type), vectors
+
     def seek(
         self,
         offset,
@@ -334,3 +669,20 @@ class InputContainer(Container):
             codec_context = stream.codec_context
             if codec_context:
                 codec_context.flush_buffers()
+
+
+def packet_table_dtype():
+    """The NumPy structured dtype of :meth:`InputContainer.packet_table`."""
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("stream", "int32"),
+            ("pts", "int64"),
+            ("dts", "int64"),
+            ("duration", "int64"),
+            ("pos", "int64"),
+            ("size", "int32"),
+            ("is_keyframe", "bool"),
+        ]
+    )
@@ -1,13 +1,17 @@
 from collections.abc import Iterator
-from typing import Any, overload
+from typing import Any, Literal, overload
 
+import numpy as np
+
+from av.audio.format import AudioFormat
 from av.audio.frame import AudioFrame
+from av.audio.layout import AudioLayout
 from av.audio.stream import AudioStream
 from av.packet import Packet
 from av.stream import AttachmentStream, DataStream, Stream
 from av.subtitles.stream import SubtitleStream
 from av.subtitles.subtitle import SubtitleSet
-from av.video.frame import VideoFrame
+from av.video.frame import PictureType, VideoFrame
 from av.video.stream import VideoStream
 
 from .core import Container
@@ -77,6 +81,28 @@ class InputContainer(Container):
     def decode(
         self, *args: Any, **kwargs: Any
     ) -> Iterator[VideoFrame | AudioFrame | SubtitleSet]: ...
+    def decode_audio_ndarray(
+        self,
+        stream: AudioStream | None = None,
+        *,
+        rate: int | None = None,
+        layout: AudioLayout | str = "mono",
+        format: AudioFormat | str = "fltp",
+        chunk_samples: int | None = None,
+        overlap: int = 0,
+        out: np.ndarray[Any, Any] | None = None,
+    ) -> Iterator[tuple[int, np.ndarray[Any, Any]]]: ...
+    @overload
+    def motion_vectors(
+        self, stream: VideoStream | None = None, *, concatenate: Literal[False] = False
+    ) -> Iterator[tuple[int | None, PictureType, np.ndarray[Any, Any]]]: ...
+    @overload
+    def motion_vectors(
+        self, stream: VideoStream | None = None, *, concatenate: Literal[True]
+    ) -> np.ndarray[Any, Any]: ...
+    def packet_table(
+        self, *args: Any, **kwargs: Any
+    ) -> np.ndarray[Any, np.dtype[np.void]]: ...
     def seek(
         self,
         offset: int,
@@ -88,3 +114,5 @@ class InputContainer(Container):
         unsupported_byte_offset: bool = False,
     ) -> None: ...
     def flush_buffers(self) -> None: ...
+
+def packet_table_dtype() -> np.dtype[np.void]: ...
@@ -1,4 +1,5 @@
 cimport libav as lib
+from libc.stdint cimport int64_t
 
 from av.container.core cimport Container
 from av.packet cimport Packet
@@ -9,6 +10,14 @@ cdef class OutputContainer(Container):
     cdef lib.AVPacket *packet_ptr
     cdef dict _extradata_bsfs
     cdef list[Packet] _buffered_packets
+    # Real-time pacing, set by pace(); _pace_speed is 0 when it is off.
+    cdef double _pace_speed
+    cdef int64_t _pace_lead  # microseconds
+    cdef int64_t _pace_burst  # microseconds
+    cdef int64_t _pace_clock  # av_gettime_relative() at the first packet
+    cdef int64_t _pace_origin  # media time of the first packet, microseconds
+    cdef bint _pace_started
+    cdef void _pace_wait(self, lib.AVPacket *pkt) noexcept nogil
     cdef _buffer_for_extradata(self, Packet packet)
     cdef void _mux_one(self, Packet packet)
     cdef void _try_extract_extradata(self, Packet packet)
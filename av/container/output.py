@@ -13,6 +13,7 @@ from cython.cimports.av.packet import Packet
 from cython.cimports.av.stream import Stream, wrap_stream
 from cython.cimports.av.utils import dict_to_avdict, to_avrational
 from cython.cimports.libc.stdint import int64_t, uint8_t
+from cython.cimports.libc.stdlib import free, malloc
 from cython.cimports.libc.string import memcpy, memset
 
 
@@ -436,6 +437,51 @@ class OutputContainer(Container):
 
         return py_stream
 
+    def add_stream_from_context(self, codec_context: CodecContext, **kwargs):
+        """add_stream_from_context(codec_context, **kwargs)
+
+        Creates a new stream that encodes with an existing encoder.
+
+        Unlike :meth:`add_stream_from_template`, nothing is copied: the stream's
+        :attr:`~.Stream.codec_context` is ``codec_context`` itself, which may
+        already be open, as the encoders of an :class:`.EncoderPool` are. Its
+        parameters are copied to the stream now, and again when the header is
+        written.
+
+        :param codec_context: An encoding :class:`.CodecContext` that no other
+            stream is using.
+        :param \\**kwargs: Set attributes for the stream.
+        :rtype: The new :class:`~av.stream.Stream`.
+        """
+        self._assert_open()
+        if not codec_context.is_encoder:
+            raise ValueError("codec_context is not an encoder")
+
+        codec: cython.pointer[cython.const[lib.AVCodec]] = codec_context.ptr.codec
+        if not lib.avformat_query_codec(
+            self.ptr.oformat, codec.id, lib.FF_COMPLIANCE_NORMAL
+        ):
+            raise ValueError(
+                f"{self.format.name!r} format does not support {codec_context.name!r} codec"
+            )
+
+        stream: cython.pointer[lib.AVStream] = lib.avformat_new_stream(self.ptr, codec)
+        if stream == cython.NULL:
+            raise MemoryError("Could not allocate stream")
+
+        err_check(
+            lib.avcodec_parameters_from_context(stream.codecpar, codec_context.ptr)
+        )
+        stream.time_base = codec_context.ptr.time_base
+
+        py_stream: Stream = wrap_stream(self, stream, codec_context)
+        self.streams.add_stream(py_stream)
+
+        for k, v in kwargs.items():
+            setattr(py_stream, k, v)
+
+        return py_stream
+
     def add_attachment(self, name: str, mimetype: str, data: bytes):
         """
         Create an attachment stream and embed its payload into the container header.
@@ -676,8 +722,146 @@ class OutputContainer(Container):
         if isinstance(packets, Packet):
             self.mux_one(packets)
         else:
-            for packet in packets:
-                self.mux_one(packet)
+            self.mux_many(packets)
+
+    def mux_many(self, packets, interleaved: cython.bint = True):
+        """mux_many(packets, interleaved=True)
+
+        Mux a batch of packets.
+
+        Every packet is checked and rebased to its stream's time base first,
+        and then the whole batch is written in one loop without the GIL.
+
+        :param packets: An iterable of :class:`.Packet`.
+        :param bool interleaved: Write with ``av_interleaved_write_frame()``,
+            which buffers packets to interleave the streams by ``dts``. With
+            ``False``, write straight through with ``av_write_frame()``; the
+            caller must then pass the packets of all streams already in
+            ``dts`` order.
+        """
+        self._assert_open()
+        if not isinstance(packets, list):
+            packets = list(packets)
+        count: cython.Py_ssize_t = len(packets)
+        i: cython.Py_ssize_t = 0
+        packet: Packet
+
+        # Until the header is written, packets may be held back waiting for
+        # extradata, so go one at a time.
+        while i < count and not (self._myflag & 4):
+            self.mux_one(packets[i])
+            i += 1
+        if i == count:
+            return
+
+        ptrs: cython.pointer[cython.pointer[lib.AVPacket]] = cython.cast(
+            cython.pointer[cython.pointer[lib.AVPacket]],
+            malloc((count - i) * cython.sizeof(cython.pointer[lib.AVPacket])),
+        )
+        if ptrs == cython.NULL:
+            raise MemoryError("Could not allocate packet array")
+
+        n: cython.Py_ssize_t = 0
+        ret: cython.int = 0
+        try:
+            for packet in packets[i:]:
+                if (
+                    packet.ptr.stream_index < 0
+                    or cython.cast(cython.uint, packet.ptr.stream_index)
+                    >= self.ptr.nb_streams
+                ):
+                    raise ValueError("Bad Packet stream_index.")
+                packet._rebase_time(self.ptr.streams[packet.ptr.stream_index].time_base)
+                ptrs[n] = packet.ptr
+                n += 1
+
+            # The list keeps every packet alive while the GIL is released.
+            with cython.nogil:
+                for i in range(n):
+                    self._pace_wait(ptrs[i])
+                    ret = lib.av_packet_ref(self.packet_ptr, ptrs[i])
+                    if ret < 0:
+                        break
+                    if interleaved:
+                        # Takes ownership of the reference.
+                        ret = lib.av_interleaved_write_frame(self.ptr, self.packet_ptr)
+                    else:
+                        ret = lib.av_write_frame(self.ptr, self.packet_ptr)
+                        lib.av_packet_unref(self.packet_ptr)
+                    if ret < 0:
+                        break
+            self.err_check(ret)
+        finally:
+            free(ptrs)
+
+    def pace(self, speed=1.0, max_lead=0.0, burst=0.0):
+        """pace(speed=1.0, max_lead=0.0, burst=0.0)
+
+        Write packets in real time, as the ``ffmpeg`` command line does with
+        ``-re``, for live outputs such as UDP, RTP, or a pipe to a player.
+
+        Every muxed packet is held until the monotonic clock reaches its
+        ``dts`` (or ``pts``), measured from the first packet. The wait and the
+        write happen together without the GIL, so other Python threads cannot
+        delay the write once the packet is due. With :meth:`mux_many`, the
+        whole batch is released on schedule the same way, so a caller can
+        hand over many packets at once and the container spaces them out.
+        Packets without timestamps are written at once.
+
+        :param float speed: How many seconds of media to write per second.
+            ``None`` or ``0`` turns pacing off.
+        :param float max_lead: How many seconds ahead of its time each packet
+            may be written.
+        :param float burst: How many seconds of media at the start to write
+            at once, to fill the receiver's buffer.
+        """
+        if not speed:
+            self._pace_speed = 0
+            return
+        if speed < 0 or max_lead < 0 or burst < 0:
+            raise ValueError("speed, max_lead, and burst must not be negative")
+
+        self._pace_speed = speed
+        self._pace_lead = int(max_lead * 1000000)
+        self._pace_burst = int(burst * 1000000)
+        # The clock starts over at the next packet.
+        self._pace_started = False
+
+    @cython.cfunc
+    @cython.nogil
+    @cython.exceptval(check=False)
+    def _pace_wait(self, pkt: cython.pointer[lib.AVPacket]) -> cython.void:
+        if self._pace_speed <= 0:
+            return
+
+        ts: int64_t = pkt.dts if pkt.dts != lib.AV_NOPTS_VALUE else pkt.pts
+        if ts == lib.AV_NOPTS_VALUE:
+            return
+        microseconds: lib.AVRational
+        microseconds.num = 1
+        microseconds.den = 1000000
+        media: int64_t = lib.av_rescale_q(
+            ts, self.ptr.streams[pkt.stream_index].time_base, microseconds
+        )
+
+        if not self._pace_started:
+            self._pace_started = True
+            self._pace_clock = lib.av_gettime_relative()
+            self._pace_origin = media
+            return
+
+        due: int64_t = (
+            self._pace_clock
+            + cython.cast(
+                int64_t,
+                (media - self._pace_origin - self._pace_burst) / self._pace_speed,
+            )
+            - self._pace_lead
+        )
+        now: int64_t = lib.av_gettime_relative()
+        while now < due:
+            lib.av_usleep(cython.cast(cython.uint, min(due - now, 100000)))
+            now = lib.av_gettime_relative()
 
     def mux_one(self, packet: Packet):
         self._assert_open()
@@ -705,6 +889,7 @@ class OutputContainer(Container):
         self.err_check(lib.av_packet_ref(self.packet_ptr, packet.ptr))
 
         with cython.nogil:
+            self._pace_wait(self.packet_ptr)
             ret: cython.int = lib.av_interleaved_write_frame(self.ptr, self.packet_ptr)
         self.err_check(ret)
 
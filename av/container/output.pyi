@@ -1,9 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from fractions import Fraction
 from typing import TypeVar, overload
 
 from av.audio import _AudioCodecName
 from av.audio.stream import AudioStream
+from av.codec.context import CodecContext
 from av.codec.hwaccel import HWAccel
 from av.packet import Packet
 from av.rational import AVRational
@@ -61,6 +62,9 @@ class OutputContainer(Container):
     def add_stream_from_template(
         self, template: _StreamT, opaque: bool | None = None, **kwargs
     ) -> _StreamT: ...
+    def add_stream_from_context(
+        self, codec_context: CodecContext, **kwargs
+    ) -> Stream: ...
     def add_attachment(
         self, name: str, mimetype: str, data: bytes
     ) -> AttachmentStream: ...
@@ -70,6 +74,13 @@ class OutputContainer(Container):
     def start_encoding(self) -> None: ...
     def mux(self, packets: Packet | Sequence[Packet]) -> None: ...
     def mux_one(self, packet: Packet) -> None: ...
+    def mux_many(self, packets: Iterable[Packet], interleaved: bool = True) -> None: ...
+    def pace(
+        self,
+        speed: float | None = 1.0,
+        max_lead: float = 0.0,
+        burst: float = 0.0,
+    ) -> None: ...
     @property
     def default_video_codec(self) -> str: ...
     @property
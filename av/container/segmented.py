@@ -0,0 +1,365 @@
+import math
+import os
+from dataclasses import dataclass
+
+import cython
+from cython.cimports import libav as lib
+from cython.cimports.av.codec.context import CodecContext
+from cython.cimports.av.container.output import OutputContainer
+from cython.cimports.av.error import err_check
+from cython.cimports.av.format import ContainerFormat
+from cython.cimports.av.frame import Frame
+from cython.cimports.av.packet import Packet
+from cython.cimports.av.stream import Stream
+
+from av.codec.codec import Codec
+
+
+@dataclass(frozen=True, slots=True)
+class Segment:
+    """A finished segment of a :class:`SegmentedOutput`."""
+
+    index: int
+    #: What the segment was written to: the path or file object passed to
+    #: :func:`av.open`.
+    file: object
+    #: Start time in seconds.
+    start: float
+    #: Duration in seconds.
+    duration: float
+
+
+class SegmentedOutput:
+    """SegmentedOutput(target, format, duration=6.0, *, options=None, container_options=None, force_keyframes=True, on_segment=None, playlist=None, window=None)
+
+    Write encoded streams as a series of self-contained segments.
+
+    The encoders live on the :class:`SegmentedOutput` rather than on the
+    streams of any one :class:`.OutputContainer`, so they keep running from
+    segment to segment: there is no re-initialisation, and rate control
+    carries straight across the boundaries. Each segment is a container of its
+    own, opened when its first packet arrives and closed when the next
+    segment starts.
+
+    A new segment starts at the first keyframe of the first video stream (or
+    of the first stream, if there is no video) at least ``duration`` seconds
+    after the start of the current one. With ``force_keyframes``, frames that
+    reach a multiple of ``duration`` are encoded as keyframes, so segments
+    come out at the target duration whatever the encoder's GOP size.
+
+    Timestamps carry on across segments rather than restarting, as HLS
+    expects.
+
+    :param target: Where to write segment ``i``: a path with a ``%d`` style
+        placeholder, such as ``"segment_%05d.ts"``, or a callable taking ``i``
+        and returning anything :func:`av.open` accepts, such as a
+        :class:`io.BytesIO`.
+    :param str format: The container format of the segments, such as
+        ``"mpegts"`` or ``"mp4"``.
+    :param float duration: Target segment duration in seconds.
+    :param dict options: Passed to :func:`av.open` for every segment.
+    :param dict container_options: Passed to :func:`av.open` for every
+        segment.
+    :param bool force_keyframes: Encode a keyframe at every multiple of
+        ``duration``.
+    :param on_segment: Called with each :class:`Segment` once it is closed.
+    :param str playlist: Path of an HLS playlist to rewrite after every
+        segment.
+    :param int window: Only list the last ``window`` segments in the
+        playlist, for a rolling live playlist.
+
+    ::
+
+        with SegmentedOutput("live_%05d.ts", "mpegts", playlist="live.m3u8") as out:
+            video = out.add_stream("libx264", rate=30, width=1280, height=720)
+            for frame in frames:
+                out.encode(video, frame)
+
+    """
+
+    def __init__(
+        self,
+        target,
+        format,
+        duration=6.0,
+        *,
+        options=None,
+        container_options=None,
+        force_keyframes=True,
+        on_segment=None,
+        playlist=None,
+        window=None,
+    ):
+        if duration <= 0:
+            raise ValueError("duration must be positive")
+        if window is not None and window < 1:
+            raise ValueError("window must be positive")
+
+        self.target = target
+        self.format = ContainerFormat(format, "w")
+        self.duration = float(duration)
+        self.options = dict(options or {})
+        self.container_options = dict(container_options or {})
+        self.force_keyframes = force_keyframes
+        self.on_segment = on_segment
+        self.playlist_path = playlist
+        self.window = window
+
+        #: The finished :class:`Segment` objects, oldest first.
+        self.segments = []
+        self._encoders = []
+        self._flushed = set()
+        self._cue = None
+        self._next_keyframe = None
+        self._output = None
+        self._file = None
+        self._start = 0.0
+        self._end = 0.0
+        self._closed = False
+
+    def add_stream(self, codec_name, rate=None, options=None, **kwargs):
+        """add_stream(codec_name, rate=None, options=None, **kwargs)
+
+        Create an encoder for a new stream of every segment.
+
+        Video encoders default to ``yuv420p`` at 24 frames per second, and
+        audio encoders to stereo at 48 kHz in the codec's first sample format,
+        as with :meth:`.OutputContainer.add_stream`.
+
+        :param str codec_name: The name of the encoder.
+        :param rate: The frame rate of video, or the sample rate of audio.
+        :param dict options: Codec options.
+        :param \\**kwargs: Set attributes of the encoder, such as ``width``,
+            ``height``, or ``bit_rate``.
+        :return: The :class:`.CodecContext` to pass to :meth:`encode`.
+        """
+        if self._output is not None or self.segments:
+            raise ValueError("cannot add a stream once writing has started")
+
+        codec = Codec(codec_name, "w")
+        ctx: CodecContext = CodecContext.create(codec, "w")
+        if codec.type == "video":
+            formats = [f.name for f in codec.video_formats or ()]
+            ctx.pix_fmt = (
+                "yuv420p" if not formats or "yuv420p" in formats else formats[0]
+            )
+            ctx.framerate = rate or 24
+        elif codec.type == "audio":
+            formats = codec.audio_formats
+            if formats:
+                ctx.format = formats[0]
+            ctx.sample_rate = rate or 48000
+            ctx.layout = "stereo"
+        else:
+            raise ValueError(f"cannot encode {codec.type} streams")
+
+        if self.format.optr.flags & lib.AVFMT_GLOBALHEADER:
+            ctx.ptr.flags |= lib.AV_CODEC_FLAG_GLOBAL_HEADER
+        if options:
+            ctx.options.update(options)
+        for k, v in kwargs.items():
+            setattr(ctx, k, v)
+
+        self._encoders.append(ctx)
+        if self._cue is None or (ctx.type == "video" and self._cue.type != "video"):
+            self._cue = ctx
+        return ctx
+
+    def encode(self, encoder, frame=None):
+        """encode(encoder, frame=None)
+
+        Encode a frame with one of the encoders from :meth:`add_stream`, and
+        mux the packets into the current segment, starting a new segment when
+        it is time.
+
+        Pass ``None`` to flush the encoder; :meth:`close` does this for every
+        encoder.
+        """
+        if self._closed:
+            raise ValueError("SegmentedOutput is closed")
+        if encoder not in self._encoders:
+            raise ValueError("encoder does not belong to this SegmentedOutput")
+
+        forced: Frame = None
+        pict_type: lib.AVPictureType
+        if frame is None:
+            self._flushed.add(encoder)
+        elif encoder is self._cue and self.force_keyframes:
+            forced = frame
+            pict_type = forced.ptr.pict_type
+            if not self._force_keyframe(encoder, forced):
+                forced = None
+        try:
+            packets = encoder.encode(frame)
+        finally:
+            # The encoder took its own reference; leave the caller's frame as
+            # it was.
+            if forced is not None:
+                forced.ptr.pict_type = pict_type
+        for packet in packets:
+            self._mux(encoder, packet)
+
+    def _force_keyframe(self, encoder: CodecContext, frame: Frame):
+        time = frame.time
+        if time is None:
+            if not encoder.ptr.framerate.num:
+                return False
+            time = (
+                encoder.ptr.frame_num
+                * encoder.ptr.framerate.den
+                / encoder.ptr.framerate.num
+            )
+
+        if self._next_keyframe is None:
+            self._next_keyframe = time + self.duration
+        elif time >= self._next_keyframe:
+            frame.ptr.pict_type = lib.AV_PICTURE_TYPE_I
+            self._next_keyframe += self.duration * (
+                math.floor((time - self._next_keyframe) / self.duration) + 1
+            )
+            return True
+        return False
+
+    def _mux(self, encoder: CodecContext, packet: Packet):
+        time = packet.time if packet.ptr.pts != lib.AV_NOPTS_VALUE else None
+        if self._output is None:
+            self._open_segment(time or 0.0)
+        elif (
+            encoder is self._cue
+            and packet.is_keyframe
+            and time is not None
+            and time - self._start >= self.duration
+        ):
+            self._close_segment(time)
+            self._open_segment(time)
+
+        if time is not None:
+            if packet.ptr.duration:
+                end = time + packet.ptr.duration * packet.time_base
+            elif encoder.ptr.framerate.num:
+                end = time + encoder.ptr.framerate.den / encoder.ptr.framerate.num
+            else:
+                end = time
+            if end > self._end:
+                self._end = float(end)
+
+        stream: Stream = self._output.streams[self._encoders.index(encoder)]
+        packet._stream = stream
+        packet.ptr.stream_index = stream.ptr.index
+        self._output.mux_one(packet)
+
+    def _open_segment(self, start):
+        index = len(self.segments)
+        file = self.target(index) if callable(self.target) else self.target % index
+
+        from av.container.core import open
+
+        output: OutputContainer = open(
+            file,
+            "w",
+            format=self.format.name,
+            options=self.options,
+            container_options=self.container_options,
+        )
+        try:
+            encoder: CodecContext
+            stream: Stream
+            for encoder in self._encoders:
+                # Streams whose first frame is still to come describe their
+                # encoder in the header too, so it has to be open already.
+                encoder.open(strict=False)
+                stream = output.add_mux_stream(encoder.codec.name)
+                err_check(
+                    lib.avcodec_parameters_from_context(
+                        stream.ptr.codecpar, encoder.ptr
+                    )
+                )
+                stream.ptr.time_base = encoder.ptr.time_base
+        except Exception:
+            output.close()
+            raise
+
+        self._output = output
+        self._file = file
+        self._start = float(start)
+        self._end = float(start)
+
+    def _close_segment(self, end):
+        output, self._output = self._output, None
+        output.close()
+
+        segment = Segment(
+            len(self.segments), self._file, self._start, max(0.0, end - self._start)
+        )
+        self.segments.append(segment)
+        self._file = None
+
+        if self.playlist_path is not None:
+            tmp = f"{self.playlist_path}.tmp"
+            with open(tmp, "w") as f:
+                f.write(self.playlist(ended=self._closed))
+            os.replace(tmp, self.playlist_path)
+        if self.on_segment is not None:
+            self.on_segment(segment)
+
+    def playlist(self, uri=None, ended=None):
+        """playlist(uri=None, ended=None)
+
+        Build an HLS media playlist of the finished segments.
+
+        :param uri: Called with each :class:`Segment` to give its URI in the
+            playlist. Defaults to the base name of the segment's path.
+        :param bool ended: Whether to mark the playlist as complete with
+            ``#EXT-X-ENDLIST``. Defaults to whether :meth:`close` has been
+            called.
+        :rtype: str
+        """
+        if ended is None:
+            ended = self._closed
+        segments = self.segments
+        if self.window is not None:
+            segments = segments[-self.window :]
+
+        target = max([math.ceil(s.duration) for s in segments] or [0])
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{max(target, math.ceil(self.duration))}",
+            f"#EXT-X-MEDIA-SEQUENCE:{segments[0].index if segments else 0}",
+        ]
+        for segment in segments:
+            if uri is not None:
+                name = uri(segment)
+            elif isinstance(segment.file, (str, os.PathLike)):
+                name = os.path.basename(segment.file)
+            else:
+                raise ValueError("segments are not files; pass uri")
+            lines.append(f"#EXTINF:{segment.duration:.6f},")
+            lines.append(name)
+        if ended:
+            lines.append("#EXT-X-ENDLIST")
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        """Flush every encoder and close the last segment."""
+        if self._closed:
+            return
+        for encoder in self._encoders:
+            if encoder.is_open and encoder not in self._flushed:
+                for packet in encoder.encode(None):
+                    self._mux(encoder, packet)
+        self._closed = True
+        if self._output is not None:
+            self._close_segment(self._end)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._closed = True
+            if self._output is not None:
+                output, self._output = self._output, None
+                output.close()
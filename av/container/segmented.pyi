@@ -0,0 +1,66 @@
+from collections.abc import Callable
+from fractions import Fraction
+from types import TracebackType
+from typing import Any
+
+from av.codec.context import CodecContext
+from av.format import ContainerFormat
+from av.frame import Frame
+from av.rational import AVRational
+
+class Segment:
+    index: int
+    file: Any
+    start: float
+    duration: float
+
+    def __init__(
+        self, index: int, file: Any, start: float, duration: float
+    ) -> None: ...
+
+class SegmentedOutput:
+    target: str | Callable[[int], Any]
+    format: ContainerFormat
+    duration: float
+    options: dict[str, str]
+    container_options: dict[str, str]
+    force_keyframes: bool
+    on_segment: Callable[[Segment], object] | None
+    playlist_path: str | None
+    window: int | None
+    segments: list[Segment]
+
+    def __init__(
+        self,
+        target: str | Callable[[int], Any],
+        format: str,
+        duration: float = 6.0,
+        *,
+        options: dict[str, str] | None = None,
+        container_options: dict[str, str] | None = None,
+        force_keyframes: bool = True,
+        on_segment: Callable[[Segment], object] | None = None,
+        playlist: str | None = None,
+        window: int | None = None,
+    ) -> None: ...
+    def add_stream(
+        self,
+        codec_name: str,
+        rate: AVRational | Fraction | int | None = None,
+        options: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> CodecContext: ...
+    def encode(self, encoder: CodecContext, frame: Frame | None = None) -> None: ...
+    def playlist(
+        self,
+        uri: Callable[[Segment], str] | None = None,
+        ended: bool | None = None,
+    ) -> str: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> SegmentedOutput: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
@@ -0,0 +1,222 @@
+import os
+import tempfile
+
+import cython
+from cython.cimports import libav as lib
+from cython.cimports.av.codec.context import CodecContext, copy_encoder_settings
+from cython.cimports.av.container.input import InputContainer
+from cython.cimports.av.container.output import OutputContainer
+from cython.cimports.av.video.stream import VideoStream
+
+from av.codec.codec import Codec
+
+
+def two_pass(
+    source,
+    output,
+    codec,
+    bit_rate,
+    *,
+    stream=None,
+    rate=None,
+    size=None,
+    pix_fmt=None,
+    options=None,
+    first_pass_options=None,
+    cache_frames=False,
+    progress=None,
+    format=None,
+):
+    """two_pass(source, output, codec, bit_rate, *, stream=None, rate=None, size=None, pix_fmt=None, options=None, first_pass_options=None, cache_frames=False, progress=None, format=None)
+
+    Encode a video stream twice to hit an average bit rate accurately.
+
+    The first pass encodes into a codec context of its own with
+    ``AV_CODEC_FLAG_PASS1`` and muxes nothing; it only gathers the encoder's
+    statistics from :attr:`.CodecContext.stats_out`. The second pass encodes
+    into ``output`` with ``AV_CODEC_FLAG_PASS2`` and those statistics as
+    :attr:`.CodecContext.stats_in`. Both passes use the same settings, apart
+    from ``first_pass_options``, which can make the first one cheaper.
+
+    Encoders that keep their statistics in a file named by a ``stats`` option
+    of their own, such as ``libx264``, are given a temporary one, unless
+    ``options`` already names it.
+
+    Only the video stream is encoded; nothing else is copied to ``output``.
+
+    :param source: Anything :func:`av.open` accepts, or an open
+        :class:`.InputContainer`, which is left open.
+    :param output: Anything :func:`av.open` accepts for writing, or an open
+        :class:`.OutputContainer`, which is left open.
+    :param str codec: The name of the encoder.
+    :param int bit_rate: The target average bit rate.
+    :param stream: The :class:`.VideoStream` to read, defaulting to the first.
+    :param rate: Output frame rate; defaults to the source's.
+    :param tuple size: Output ``(width, height)``; defaults to the source's.
+    :param str pix_fmt: Output pixel format; defaults to the source's when the
+        encoder supports it, and the encoder's first otherwise.
+    :param dict options: Codec options for both passes.
+    :param dict first_pass_options: Codec options for the first pass only,
+        on top of ``options``, such as a faster preset.
+    :param bool cache_frames: Keep the decoded frames of the first pass in
+        memory and encode those again, rather than decoding the source twice.
+        This costs the memory of every frame.
+    :param progress: Called as ``progress(pass_number, frames_done, total)``
+        after every frame, where ``total`` is the number of frames the source
+        reports, or ``None``.
+    :param str format: Passed to :func:`av.open` when ``output`` is not open.
+    :return: The first pass statistics, as given to the second.
+    :rtype: str
+
+    """
+    if bit_rate <= 0:
+        raise ValueError("bit_rate must be positive")
+
+    input_: InputContainer
+    owned_input: cython.bint = not isinstance(source, InputContainer)
+    output_: OutputContainer
+    owned_output: cython.bint = not isinstance(output, OutputContainer)
+
+    from av.container.core import open
+
+    input_ = open(source, "r") if owned_input else source
+    try:
+        if stream is None:
+            if not input_.streams.video:
+                raise ValueError("input has no video stream")
+            stream = input_.streams.video[0]
+        output_ = open(output, "w", format=format) if owned_output else output
+        try:
+            with tempfile.TemporaryDirectory(prefix="pyav-2pass-") as tmp:
+                return _two_pass(
+                    input_,
+                    stream,
+                    output_,
+                    codec,
+                    bit_rate,
+                    rate,
+                    size,
+                    pix_fmt,
+                    dict(options or {}),
+                    dict(first_pass_options or {}),
+                    cache_frames,
+                    progress,
+                    tmp,
+                )
+        finally:
+            if owned_output:
+                output_.close()
+    finally:
+        if owned_input:
+            input_.close()
+
+
+@cython.cfunc
+def _two_pass(
+    input_: InputContainer,
+    stream: VideoStream,
+    output: OutputContainer,
+    codec,
+    bit_rate,
+    rate,
+    size,
+    pix_fmt,
+    options: dict,
+    first_pass_options: dict,
+    cache_frames: cython.bint,
+    progress,
+    tmp,
+):
+    width, height = size or (stream.width, stream.height)
+    if pix_fmt is None:
+        formats = Codec(codec, "w").video_formats
+        names = [f.name for f in formats] if formats else []
+        source_format = stream.codec_context.format
+        pix_fmt = source_format.name if source_format else None
+        if names and pix_fmt not in names:
+            pix_fmt = names[0]
+
+    out_stream: VideoStream = output.add_stream(
+        codec,
+        rate=rate or stream.average_rate or stream.guessed_rate or 24,
+        width=width,
+        height=height,
+        bit_rate=bit_rate,
+    )
+    if pix_fmt is not None:
+        out_stream.pix_fmt = pix_fmt
+    template: CodecContext = out_stream.codec_context
+
+    if "stats" not in options and any(
+        o.name == "stats" for o in template.supported_options.private
+    ):
+        options["stats"] = os.path.join(tmp, "stats.log")
+
+    # Pin the time_base the same way open() would, so both passes agree on it.
+    if not template.ptr.time_base.num:
+        template.ptr.time_base.num = template.ptr.framerate.den or 1
+        template.ptr.time_base.den = template.ptr.framerate.num or lib.AV_TIME_BASE
+
+    total = stream.frames or None
+    done: cython.Py_ssize_t = 0
+
+    # First pass: statistics only.
+    first: CodecContext = CodecContext.create(template.codec, "w")
+    copy_encoder_settings(template, first)
+    first.ptr.flags |= lib.AV_CODEC_FLAG_PASS1
+    first.options = {**options, **first_pass_options}
+
+    cache: list = [] if cache_frames else None
+    stats: list = []
+    for frame in input_.decode(stream):
+        if cache is not None:
+            cache.append(frame)
+        _first_pass_encode(first, frame, stats)
+        done += 1
+        if progress is not None:
+            progress(1, done, total)
+    _first_pass_encode(first, None, stats)
+    stats_in = "".join(stats)
+    # Closing the first encoder finishes its statistics file, which libx264
+    # only moves into place then.
+    first = None
+
+    # Second pass: the real encode.
+    template.ptr.flags |= lib.AV_CODEC_FLAG_PASS2
+    template.options.update(options)
+    if stats_in:
+        template.stats_in = stats_in
+
+    if cache is None:
+        input_.seek(stream.start_time or 0, stream=stream)
+        frames = input_.decode(stream)
+    else:
+        frames = cache
+
+    done = 0
+    packets: list = []
+    for frame in frames:
+        out_stream.encode_into(frame, packets)
+        output.mux(packets)
+        packets.clear()
+        done += 1
+        if progress is not None:
+            progress(2, done, total)
+    out_stream.encode_into(None, packets)
+    output.mux(packets)
+    return stats_in
+
+
+@cython.cfunc
+def _first_pass_encode(ctx: CodecContext, frame, stats: list) -> cython.void:
+    # Encoders rewrite stats_out for every packet, so it has to be read before
+    # the next one is received.
+    for _ in ctx.encode_lazy(frame):
+        if ctx.ptr.stats_out != cython.NULL and ctx.ptr.stats_out[0]:
+            stats.append(ctx.stats_out)
+    # Some encoders, such as libvpx and libaom, write all their statistics
+    # once flushed, whether or not a packet comes out.
+    if frame is None and ctx.ptr.stats_out != cython.NULL and ctx.ptr.stats_out[0]:
+        last = ctx.stats_out
+        if not stats or stats[-1] != last:
+            stats.append(last)
@@ -0,0 +1,22 @@
+from collections.abc import Callable
+from fractions import Fraction
+from typing import Any
+
+from .video.stream import VideoStream
+
+def two_pass(
+    source: Any,
+    output: Any,
+    codec: str,
+    bit_rate: int,
+    *,
+    stream: VideoStream | None = None,
+    rate: Fraction | int | None = None,
+    size: tuple[int, int] | None = None,
+    pix_fmt: str | None = None,
+    options: dict[str, str] | None = None,
+    first_pass_options: dict[str, str] | None = None,
+    cache_frames: bool = False,
+    progress: Callable[[int, int, int | None], object] | None = None,
+    format: str | None = None,
+) -> str: ...
@@ -2,6 +2,7 @@ cimport libav as lib
 
 from av.filter.filter cimport Filter
 from av.filter.graph cimport Graph
+from av.frame cimport Frame
 
 
 cdef class FilterContext:
@@ -12,6 +13,11 @@ cdef class FilterContext:
     cdef tuple _outputs
     cdef bint inited
     cdef unsigned char _kind
+    cdef Frame _spare
+
+    cdef FilterContext _resolve_sink(self)
+    cdef int _receive(self)
+    cdef Frame _take(self)
 
 
 cdef FilterContext wrap_filter_context(Graph graph, Filter filter, lib.AVFilterContext *ptr)
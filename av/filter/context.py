@@ -7,6 +7,7 @@ from cython.cimports.av.filter.link import alloc_filter_pads
 from cython.cimports.av.frame import Frame
 from cython.cimports.av.rational import from_avrational
 from cython.cimports.av.video.frame import alloc_video_frame
+from cython.cimports.libc.errno import EAGAIN
 
 _cinit_sentinel = cython.declare(object, object())
 
@@ -134,33 +135,81 @@ class FilterContext:
             raise ValueError("cannot delegate push without linked input")
         self.inputs[0].linked.context.push(frame)
 
-    def pull(self):
-        frame: Frame
-        res: cython.int
-        if self._kind == _KIND_VIDEO_SINK:
-            frame = alloc_video_frame()
-        elif self._kind == _KIND_AUDIO_SINK:
-            frame = alloc_audio_frame()
-        else:
-            # Delegate to the output.
-            if len(self.outputs) != 1:
-                raise ValueError(
-                    f"cannot delegate pull without single output; found {len(self.outputs)}"
-                )
-            if not self.outputs[0].link:
-                raise ValueError("cannot delegate pull without linked output")
-            return self.outputs[0].linked.context.pull()
-
-        self.graph.configure()
+    @cython.cfunc
+    def _resolve_sink(self) -> FilterContext:
+        if self._kind == _KIND_VIDEO_SINK or self._kind == _KIND_AUDIO_SINK:
+            return self
 
+        # Delegate to the output.
+        if len(self.outputs) != 1:
+            raise ValueError(
+                f"cannot delegate pull without single output; found {len(self.outputs)}"
+            )
+        if not self.outputs[0].link:
+            raise ValueError("cannot delegate pull without linked output")
+        return cython.cast(
+            FilterContext, self.outputs[0].linked.context
+        )._resolve_sink()
+
+    @cython.cfunc
+    def _receive(self) -> cython.int:
+        # A frame that came back empty (EAGAIN/EOF) is kept for the next call,
+        # so polling a sink does not allocate.
+        res: cython.int
+        if self._spare is None:
+            if self._kind == _KIND_VIDEO_SINK:
+                self._spare = alloc_video_frame()
+            else:
+                self._spare = alloc_audio_frame()
         with cython.nogil:
-            res = lib.av_buffersink_get_frame(self.ptr, frame.ptr)
-        err_check(res)
+            res = lib.av_buffersink_get_frame(self.ptr, self._spare.ptr)
+        return res
 
+    @cython.cfunc
+    def _take(self) -> Frame:
+        frame: Frame = self._spare
+        self._spare = None
         frame._init_user_attributes()
         frame.time_base = from_avrational(self.ptr.inputs[0].time_base)
         return frame
 
+    def pull(self):
+        sink: FilterContext = self._resolve_sink()
+        sink.graph.configure()
+        err_check(sink._receive())
+        return sink._take()
+
+    def try_pull(self):
+        """Pull a frame, or return ``None`` if none is ready.
+
+        Like :meth:`pull`, but "not ready yet" (``EAGAIN``) and end of stream
+        both return ``None`` instead of raising. Other errors still raise.
+        """
+        sink: FilterContext = self._resolve_sink()
+        sink.graph.configure()
+        res: cython.int = sink._receive()
+        if res == -EAGAIN or res == lib.AVERROR_EOF:
+            return None
+        err_check(res)
+        return sink._take()
+
+    def pull_all(self):
+        """Pull every frame that is ready.
+
+        :return: A list of frames, empty if none are ready or the sink has
+            reached end of stream.
+        """
+        sink: FilterContext = self._resolve_sink()
+        sink.graph.configure()
+        frames: list = []
+        res: cython.int
+        while True:
+            res = sink._receive()
+            if res == -EAGAIN or res == lib.AVERROR_EOF:
+                return frames
+            err_check(res)
+            frames.append(sink._take())
+
     def process_command(
         self, cmd, arg=None, res_len: cython.int = 1024, flags: cython.int = 0
     ):
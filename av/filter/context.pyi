@@ -17,6 +17,8 @@ class FilterContext:
     def graph(self) -> Graph: ...
     def push(self, frame: Frame | None) -> None: ...
     def pull(self) -> Frame: ...
+    def try_pull(self) -> Frame | None: ...
+    def pull_all(self) -> list[Frame]: ...
     def process_command(
         self, cmd: str, arg: str | None = None, res_len: int = 1024, flags: int = 0
     ) -> str | None: ...
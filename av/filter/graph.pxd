@@ -11,6 +11,10 @@ cdef class Graph:
     cdef dict _name_counts
     cdef dict[size_t, FilterContext] _context_by_ptr
     cdef dict[str, list[FilterContext]] _context_by_type
+    cdef list[FilterContext] _vsources
+    cdef list[FilterContext] _asources
+    cdef list[FilterContext] _sinks
+    cdef list[FilterContext] _vsinks
     cdef readonly bint configured
     cdef int _nb_filters_seen
 
@@ -19,3 +23,4 @@ cdef class Graph:
     cdef list[FilterContext] _get_context_by_type(self, str type)
     cdef void _register_context(self, FilterContext)
     cdef void _auto_register(self)
+    cdef FilterContext _get_sink(self, int at)
@@ -22,6 +22,10 @@ class Graph:
         self._nb_filters_seen = 0
         self._context_by_ptr = {}
         self._context_by_type = {}
+        self._vsources = []
+        self._asources = []
+        self._sinks = []
+        self._vsinks = []
 
     def __dealloc__(self):
         if self.ptr:
@@ -112,6 +116,17 @@ class Graph:
         self._context_by_ptr[cython.cast(cython.size_t, ctx.ptr)] = ctx
         self._context_by_type.setdefault(name, []).append(ctx)
 
+        # Sources and sinks are cached here so push() and pull() do not look
+        # them up per frame.
+        if name == "buffer":
+            self._vsources.append(ctx)
+        elif name == "abuffer":
+            self._asources.append(ctx)
+        elif name == "buffersink" or name == "abuffersink":
+            self._sinks.append(ctx)
+            if name == "buffersink":
+                self._vsinks.append(ctx)
+
     @cython.cfunc
     def _auto_register(self) -> cython.void:
         i: cython.int
@@ -243,14 +258,13 @@ class Graph:
             multiple inputs (e.g. ``overlay``). The default of ``-1`` pushes to
             every buffer source matching the frame's type.
         """
+        contexts: list
         if frame is None:
-            contexts = self._get_context_by_type("buffer") + self._get_context_by_type(
-                "abuffer"
-            )
+            contexts = self._vsources + self._asources
         elif isinstance(frame, VideoFrame):
-            contexts = self._get_context_by_type("buffer")
+            contexts = self._vsources
         elif isinstance(frame, AudioFrame):
-            contexts = self._get_context_by_type("abuffer")
+            contexts = self._asources
         else:
             raise ValueError(
                 f"can only AudioFrame, VideoFrame or None; got {type(frame)}"
@@ -269,7 +283,7 @@ class Graph:
 
     def vpush(self, frame: VideoFrame | None, at: cython.int = -1):
         """Like :meth:`push`, but only for :class:`.VideoFrame`."""
-        contexts = self._get_context_by_type("buffer")
+        contexts: list = self._vsources
         if at >= 0:
             if at >= len(contexts):
                 raise IndexError(
@@ -281,22 +295,103 @@ class Graph:
         for ctx in contexts:
             ctx.push(frame)
 
-    # TODO: Test complex filter graphs, add `at: int = 0` arg to pull() and vpull().
-    def pull(self):
-        vsinks = self._get_context_by_type("buffersink")
-        asinks = self._get_context_by_type("abuffersink")
-
-        nsinks = len(vsinks) + len(asinks)
+    @cython.cfunc
+    def _get_sink(self, at: cython.int) -> FilterContext:
+        nsinks: cython.Py_ssize_t = len(self._sinks)
+        if at >= 0:
+            if at >= nsinks:
+                raise IndexError(f"sink index {at} out of range; found {nsinks}")
+            return self._sinks[at]
         if nsinks != 1:
             raise ValueError(f"can only auto-pull with single sink; found {nsinks}")
+        return self._sinks[0]
 
-        return (vsinks or asinks)[0].pull()
+    @property
+    def sinks(self):
+        """The graph's ``buffersink`` and ``abuffersink`` contexts, in the order
+        they were added. A position in this tuple is the ``at`` argument of
+        :meth:`pull` and the sink index reported by :meth:`pull_ready` and
+        :meth:`run`."""
+        return tuple(self._sinks)
+
+    def pull(self, at: cython.int = -1):
+        """Pull a frame from the graph's sink.
+
+        :param int at: Index into :attr:`sinks` of the sink to pull from, for
+            graphs with multiple outputs. The default of ``-1`` requires a
+            single sink.
+        """
+        return self._get_sink(at).pull()
 
-    def vpull(self):
-        """Like `pull`, but only for VideoFrames."""
-        vsinks = self._get_context_by_type("buffersink")
-        nsinks = len(vsinks)
+    def vpull(self, at: cython.int = -1):
+        """Like `pull`, but only for VideoFrames; ``at`` indexes the video sinks."""
+        nsinks: cython.Py_ssize_t = len(self._vsinks)
+        if at >= 0:
+            if at >= nsinks:
+                raise IndexError(f"sink index {at} out of range; found {nsinks}")
+            return self._vsinks[at].pull()
         if nsinks != 1:
             raise ValueError(f"can only auto-pull with single sink; found {nsinks}")
 
-        return vsinks[0].pull()
+        return self._vsinks[0].pull()
+
+    def try_pull(self, at: cython.int = -1):
+        """Like :meth:`pull`, but return ``None`` instead of raising when no
+        frame is ready or the sink has reached end of stream.
+
+        See :meth:`.FilterContext.try_pull`.
+        """
+        return self._get_sink(at).try_pull()
+
+    def pull_ready(self):
+        """Pull every frame that is ready from every sink.
+
+        :return: A list of ``(sink_index, frame)`` tuples, grouped by sink in
+            the order of :attr:`sinks`, possibly empty.
+        """
+        out: list = []
+        i: cython.Py_ssize_t
+        sink: FilterContext
+        for i in range(len(self._sinks)):
+            sink = self._sinks[i]
+            for frame in sink.pull_all():
+                out.append((i, frame))
+        return out
+
+    def run(self, frames, flush: cython.bint = True):
+        """Push frames through a graph with any number of sinks.
+
+        Each frame is pushed as by :meth:`push`, so a video frame reaches every
+        ``buffer`` and an audio frame every ``abuffer``, and then every sink is
+        drained. This lets one decode feed several outputs, e.g. a ``split``
+        into differently scaled branches, or separate audio and video chains.
+
+        :param frames: An iterable of :class:`.AudioFrame` and
+            :class:`.VideoFrame`.
+        :param bool flush: Push ``None`` after the last frame and collect what
+            the filters were holding back.
+        :return: A generator of ``(sink_index, frame)`` tuples, with the sink
+            index into :attr:`sinks`.
+        """
+        self.configure()
+        for frame in frames:
+            self.push(frame)
+            yield from self.pull_ready()
+        if flush:
+            self.push(None)
+            yield from self.pull_ready()
+
+    def push_pull(self, frame, at: cython.int = -1):
+        """Push a frame and pull every frame it made ready.
+
+        Equivalent to :meth:`push` followed by :meth:`pull` until it raises
+        ``EAGAIN`` or :class:`EOFError`, without raising. Pass ``None`` to
+        flush the graph and collect what is left.
+
+        :param frame: As for :meth:`push`.
+        :param int at: As for :meth:`push`.
+        :return: A list of frames from the graph's single sink, possibly empty.
+        """
+        sink: FilterContext = self._get_sink(-1)
+        self.push(frame, at)
+        return sink.pull_all()
@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Iterator
 from fractions import Fraction
 from typing import Any
 
@@ -44,6 +45,16 @@ class Graph:
     ) -> FilterContext: ...
     def set_audio_frame_size(self, frame_size: int) -> None: ...
     def push(self, frame: None | AudioFrame | VideoFrame, at: int = -1) -> None: ...
-    def pull(self) -> VideoFrame | AudioFrame: ...
+    @property
+    def sinks(self) -> tuple[FilterContext, ...]: ...
+    def pull(self, at: int = -1) -> VideoFrame | AudioFrame: ...
     def vpush(self, frame: VideoFrame | None, at: int = -1) -> None: ...
-    def vpull(self) -> VideoFrame: ...
+    def vpull(self, at: int = -1) -> VideoFrame: ...
+    def try_pull(self, at: int = -1) -> VideoFrame | AudioFrame | None: ...
+    def pull_ready(self) -> list[tuple[int, VideoFrame | AudioFrame]]: ...
+    def run(
+        self, frames: Iterable[AudioFrame | VideoFrame], flush: bool = True
+    ) -> Iterator[tuple[int, VideoFrame | AudioFrame]]: ...
+    def push_pull(
+        self, frame: None | AudioFrame | VideoFrame, at: int = -1
+    ) -> list[VideoFrame | AudioFrame]: ...
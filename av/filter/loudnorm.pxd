@@ -1,4 +1,10 @@
+from libc.stdint cimport int64_t
+
+from av.audio.frame cimport AudioFrame
 from av.audio.stream cimport AudioStream
+from av.filter.context cimport FilterContext
+from av.filter.graph cimport Graph
+from av.frame cimport Frame
 
 
 cdef extern from "libavcodec/avcodec.h":
@@ -17,3 +23,26 @@ cdef extern from "loudnorm_impl.h":
     ) nogil
 
 cpdef bytes stats(str loudnorm_args, AudioStream stream)
+
+
+cdef class LoudnessMeter:
+    cdef readonly Graph graph
+    cdef FilterContext _src
+    cdef FilterContext _sink
+    cdef object _format
+    cdef object _layout
+    cdef object _rate
+    cdef object _time_base
+    cdef int64_t _samples
+    cdef bint _true_peak
+
+    cdef readonly double momentary
+    cdef readonly double short_term
+    cdef readonly double integrated
+    cdef readonly double lra
+    cdef readonly double sample_peak
+    cdef readonly double true_peak
+
+    cdef _init_graph(self, AudioFrame frame)
+    cdef _read_metadata(self, Frame frame)
+    cpdef update(self, frame)
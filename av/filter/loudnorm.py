@@ -1,10 +1,20 @@
+from fractions import Fraction
+
 import cython
+import cython.cimports.libav as lib
+from cython.cimports.av.audio.frame import AudioFrame
 from cython.cimports.av.audio.stream import AudioStream
 from cython.cimports.av.container.core import Container
-from cython.cimports.libc.stdlib import free
+from cython.cimports.av.filter.context import FilterContext
+from cython.cimports.av.filter.graph import Graph
+from cython.cimports.av.frame import Frame
+from cython.cimports.libc.math import log10
+from cython.cimports.libc.stdlib import free, strtod
 
 from av.logging import get_level, set_level
 
+_NAN = cython.declare(cython.double, float("nan"))
+
 
 @cython.ccall
 def stats(loudnorm_args: str, stream: AudioStream) -> bytes:
@@ -46,3 +56,193 @@ def stats(loudnorm_args: str, stream: AudioStream) -> bytes:
     set_level(level)
 
     return py_result
+
+
+@cython.cfunc
+@cython.inline
+def _r128_value(
+    frame: Frame, key: cython.p_const_char, default: cython.double
+) -> cython.double:
+    entry: cython.pointer[lib.AVDictionaryEntry] = lib.av_dict_get(
+        frame.ptr.metadata, key, cython.NULL, 0
+    )
+    if entry == cython.NULL:
+        return default
+    return strtod(entry.value, cython.NULL)
+
+
+@cython.final
+@cython.cclass
+class LoudnessMeter:
+    """LoudnessMeter(format=None, layout=None, rate=None, true_peak=True)
+
+    Measure EBU R128 loudness incrementally, as audio arrives.
+
+    Audio is run through FFmpeg's ``ebur128`` filter and the measurements it
+    attaches to each frame are kept, so they can be read at any time rather
+    than only once a whole stream has been analysed. Loudness is in LUFS,
+    :attr:`lra` in LU, and the peaks in dBFS; each is ``nan`` until measured.
+
+    :param format: The sample format of NumPy arrays passed to :meth:`update`.
+    :param layout: Their channel layout.
+    :param int rate: Their sample rate.
+    :param bool true_peak: Also measure the (oversampled) true peak.
+
+    The measurements can drive a linear normalisation of the same audio, as
+    the second pass of ``loudnorm`` does, without decoding it again::
+
+        meter = LoudnessMeter()
+        for frame in frames:
+            meter.update(frame)
+        meter.flush()
+        graph = meter.normalizer(target=-24.0, true_peak=-2.0)
+        for frame in frames:
+            for out in graph.push_pull(frame):
+                ...
+
+    """
+
+    def __cinit__(self, format=None, layout=None, rate=None, true_peak=True):
+        self._format = format
+        self._layout = layout
+        self._rate = rate
+        self._true_peak = true_peak
+        self.momentary = _NAN
+        self.short_term = _NAN
+        self.integrated = _NAN
+        self.lra = _NAN
+        self.sample_peak = _NAN
+        self.true_peak = _NAN
+
+    @cython.cfunc
+    def _init_graph(self, frame: AudioFrame):
+        # The first frame fixes the input, arrays included.
+        self._format = frame.format.name
+        self._layout = frame.layout.name
+        self._rate = frame.sample_rate
+        self._time_base = frame.time_base
+
+        graph = Graph()
+        self._src = graph.add_abuffer(
+            sample_rate=self._rate,
+            format=self._format,
+            layout=self._layout,
+            time_base=self._time_base,
+        )
+        ebur128 = graph.add(
+            "ebur128",
+            metadata="1",
+            peak="sample+true" if self._true_peak else "sample",
+        )
+        self._sink = graph.add("abuffersink")
+        self._src.link_to(ebur128)
+        ebur128.link_to(self._sink)
+        graph.configure()
+        self.graph = graph
+
+    @cython.cfunc
+    def _read_metadata(self, frame: Frame):
+        # ebur128 only attaches values at every 100ms step, so a short frame
+        # may carry none; keep the previous ones.
+        self.momentary = _r128_value(frame, b"lavfi.r128.M", self.momentary)
+        self.short_term = _r128_value(frame, b"lavfi.r128.S", self.short_term)
+        self.integrated = _r128_value(frame, b"lavfi.r128.I", self.integrated)
+        self.lra = _r128_value(frame, b"lavfi.r128.LRA", self.lra)
+
+        # Peaks are reported as linear amplitudes.
+        peak: cython.double = _r128_value(frame, b"lavfi.r128.sample_peak", -1)
+        if peak >= 0:
+            self.sample_peak = 20 * log10(peak)
+        peak = _r128_value(frame, b"lavfi.r128.true_peak", -1)
+        if peak >= 0:
+            self.true_peak = 20 * log10(peak)
+
+    @cython.ccall
+    def update(self, frame):
+        """update(frame)
+
+        Measure more audio.
+
+        :param frame: An :class:`.AudioFrame`, or a NumPy array in the
+            ``format``, ``layout``, and ``rate`` given to the constructor, with
+            the shape :meth:`.AudioFrame.from_ndarray` expects. Arrays are not
+            copied.
+        """
+        cy_frame: AudioFrame
+        if isinstance(frame, AudioFrame):
+            cy_frame = frame
+        else:
+            if self._format is None or self._layout is None or self._rate is None:
+                raise ValueError("format, layout, and rate are needed for arrays")
+            cy_frame = AudioFrame.from_numpy_buffer(
+                frame, self._format, self._layout, self._rate
+            )
+            cy_frame.pts = self._samples
+            cy_frame.time_base = Fraction(1, self._rate)
+
+        if self.graph is None:
+            self._init_graph(cy_frame)
+
+        self._samples += cy_frame.ptr.nb_samples
+        self._src.push(cy_frame)
+        for out in self._sink.pull_all():
+            self._read_metadata(out)
+
+    def flush(self):
+        """Measure whatever audio the filters are still holding back.
+
+        Call this once the input has ended; the meter takes no more audio
+        afterwards.
+        """
+        if self.graph is None:
+            return
+        self._src.push(None)
+        for out in self._sink.pull_all():
+            self._read_metadata(out)
+
+    @property
+    def samples(self):
+        """The number of samples measured so far, at the input rate."""
+        return self._samples
+
+    def gain(self, target=-24.0, true_peak=-2.0):
+        """The gain, in dB, that brings the measured audio to ``target`` LUFS.
+
+        The gain is lowered as needed to keep the peak at or below
+        ``true_peak`` dBFS, using the true peak when it was measured and the
+        sample peak otherwise. This is a single constant gain, like the linear
+        mode of ``loudnorm``, so dynamics are untouched.
+        """
+        if self.integrated != self.integrated:
+            raise ValueError("nothing has been measured")
+
+        gain: cython.double = target - self.integrated
+        peak: cython.double = self.true_peak if self._true_peak else self.sample_peak
+        if peak == peak and peak + gain > true_peak:
+            gain = true_peak - peak
+        return gain
+
+    def normalizer(self, target=-24.0, true_peak=-2.0):
+        """Build a filter graph applying :meth:`gain` to the measured audio.
+
+        The graph takes and returns frames in the format, layout, and rate
+        of the first measured frame; feed it with :meth:`.Graph.push_pull`.
+
+        :rtype: Graph
+        """
+        gain = self.gain(target, true_peak)
+
+        graph = Graph()
+        src = graph.add_abuffer(
+            sample_rate=self._rate,
+            format=self._format,
+            layout=self._layout,
+            time_base=self._time_base,
+        )
+        volume = graph.add("volume", volume=f"{gain}dB")
+        # volume works in float; convert back to the input format.
+        aformat = graph.add("aformat", sample_fmts=self._format)
+        sink = graph.add("abuffersink")
+        graph.link_nodes(src, volume, aformat, sink)
+        graph.configure()
+        return graph
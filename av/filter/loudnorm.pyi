@@ -1,3 +1,35 @@
+from typing import Any
+
+import numpy as np
+
+from av.audio.format import AudioFormat
+from av.audio.frame import AudioFrame
+from av.audio.layout import AudioLayout
 from av.audio.stream import AudioStream
 
+from .graph import Graph
+
 def stats(loudnorm_args: str, stream: AudioStream) -> bytes: ...
+
+class LoudnessMeter:
+    graph: Graph | None
+    momentary: float
+    short_term: float
+    integrated: float
+    lra: float
+    sample_peak: float
+    true_peak: float
+
+    def __init__(
+        self,
+        format: AudioFormat | str | None = None,
+        layout: AudioLayout | str | None = None,
+        rate: int | None = None,
+        true_peak: bool = True,
+    ) -> None: ...
+    @property
+    def samples(self) -> int: ...
+    def update(self, frame: AudioFrame | np.ndarray[Any, Any]) -> None: ...
+    def flush(self) -> None: ...
+    def gain(self, target: float = -24.0, true_peak: float = -2.0) -> float: ...
+    def normalizer(self, target: float = -24.0, true_peak: float = -2.0) -> Graph: ...
@@ -1,4 +1,5 @@
 cimport libav as lib
+from libc.stdint cimport uint8_t
 
 from av.packet cimport Packet
 from av.sidedata.sidedata cimport _SideDataContainer
@@ -12,3 +13,6 @@ cdef class Frame:
     cdef _SideDataContainer _side_data
     cdef void _copy_internal_attributes(self, Frame source, bint data_layout=?)
     cdef void _init_user_attributes(self)
+
+
+cdef void numpy_avbuffer_free(void *opaque, uint8_t *data) noexcept nogil
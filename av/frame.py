@@ -6,10 +6,25 @@ from cython.cimports.av.utils import (
     avdict_to_dict,
     to_avrational,
 )
+from cython.cimports.cpython.ref import Py_DECREF
+from cython.cimports.libc.stdint import uint8_t
 
 from av.sidedata.sidedata import SideDataContainer
 
 
+@cython.cfunc
+@cython.nogil
+@cython.exceptval(check=False)
+def numpy_avbuffer_free(
+    opaque: cython.p_void,
+    data: cython.pointer[uint8_t],
+) -> cython.void:
+    """Release the array an ``AVBuffer`` over NumPy memory holds in ``opaque``."""
+    if opaque != cython.NULL:
+        with cython.gil:
+            Py_DECREF(cython.cast(object, opaque))
+
+
 @cython.cclass
 class Frame:
     """
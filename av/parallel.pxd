@@ -0,0 +1,13 @@
+from libc.stdint cimport int64_t
+
+from av.codec.context cimport CodecContext
+
+
+cdef class _Retimer:
+    cdef list tail
+    cdef Py_ssize_t delay
+    cdef int64_t last_dts
+    cdef bint started
+
+    cpdef list retime(self, list packets)
+
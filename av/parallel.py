@@ -0,0 +1,214 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import cython
+from cython.cimports import libav as lib
+from cython.cimports.av.codec.context import CodecContext, copy_encoder_settings
+from cython.cimports.av.frame import Frame
+from cython.cimports.av.packet import Packet
+from cython.cimports.av.video.stream import VideoStream
+from cython.cimports.libc.stdint import int64_t
+
+
+def encode_chunked(frames, stream, options=None, chunk_frames=250, workers=None):
+    """encode_chunked(frames, stream, options=None, chunk_frames=250, workers=None)
+
+    Encode video in independent chunks on a pool of threads.
+
+    The frames are split into chunks of ``chunk_frames``, and each chunk is
+    encoded by its own :class:`.CodecContext` configured like the stream's, so
+    every chunk starts on a keyframe and never references another. Encoding
+    releases the GIL, so the chunks genuinely run side by side; this helps
+    most with encoders whose own threading does not fill the machine.
+
+    The packets come back in order, ready for :meth:`.OutputContainer.mux`.
+    Their decoding timestamps are rebuilt across the chunk boundaries so they
+    increase steadily, even with B-frames. All chunks share the stream's
+    settings, so the extradata the stream's own encoder writes into the
+    header describes every one of them.
+
+    Frames without a ``pts`` are numbered from zero in the stream's
+    ``time_base``. A frame must not be modified once it has been passed in.
+
+    :param frames: An iterable of :class:`.VideoFrame`.
+    :param stream: The output :class:`.VideoStream` to encode for; its codec,
+        size, format, rate and other settings are used for every chunk.
+    :param dict options: Codec options on top of the stream's own. They are
+        given to the stream's encoder as well, which must not be open yet,
+        so that the extradata in the header matches every chunk.
+    :param int chunk_frames: How many frames make a chunk. Shorter chunks mean
+        more keyframes.
+    :param int workers: How many chunks to encode at once; defaults to the
+        number of CPUs.
+    :return: An iterator of :class:`.Packet`.
+
+    ::
+
+        for packet in av.parallel.encode_chunked(frames, stream, workers=8):
+            output.mux(packet)
+
+    """
+    if not isinstance(stream, VideoStream):
+        raise TypeError("encode_chunked() needs a video stream")
+    template: CodecContext = stream.codec_context
+    if template is None or not template.is_encoder:
+        raise ValueError("stream is not set up for encoding")
+    if chunk_frames < 1:
+        raise ValueError("chunk_frames must be positive")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("workers must be positive")
+
+    # Pin the time_base now, the same way open() would, so that every chunk
+    # context and the stream agree on it.
+    if not template.ptr.time_base.num:
+        template.ptr.time_base.num = template.ptr.framerate.den or 1
+        template.ptr.time_base.den = template.ptr.framerate.num or lib.AV_TIME_BASE
+
+    # The stream's own encoder writes the extradata in the header, so it must
+    # open with exactly the options of the chunks: those of the container it
+    # would pick up when opened, its own, and ``options``.
+    codec_options: dict = dict(stream.container.options or {})
+    codec_options.update(template.options or {})
+    codec_options.update(options or {})
+    if not template.is_open:
+        template.options = dict(codec_options)
+    elif options:
+        raise ValueError("the stream's encoder is already open; options cannot apply")
+    return _encode_chunks(frames, stream, codec_options, chunk_frames, workers)
+
+
+def _encode_chunks(frames, stream, options, chunk_frames, workers):
+    template: CodecContext = stream.codec_context
+    pending: deque = deque()
+    retimer: _Retimer = _Retimer()
+    chunk: list = []
+    frame: Frame
+    index: int64_t = 0
+    packet: Packet
+
+    with ThreadPoolExecutor(workers, thread_name_prefix="encode_chunked") as pool:
+        try:
+            for frame in frames:
+                if frame.ptr.pts == lib.AV_NOPTS_VALUE:
+                    frame.ptr.pts = index
+                index += 1
+                chunk.append(frame)
+                if len(chunk) < chunk_frames:
+                    continue
+
+                pending.append(pool.submit(_encode_chunk, template, options, chunk))
+                chunk = []
+                # Keep a couple of chunks queued per worker, but no more, so
+                # that only a bounded number of frames are held at once.
+                while len(pending) > 2 * workers:
+                    for packet in retimer.retime(pending.popleft().result()):
+                        _assign(packet, stream)
+                        yield packet
+
+            if chunk:
+                pending.append(pool.submit(_encode_chunk, template, options, chunk))
+            while pending:
+                for packet in retimer.retime(pending.popleft().result()):
+                    _assign(packet, stream)
+                    yield packet
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+@cython.cfunc
+@cython.inline
+def _assign(packet: Packet, stream: VideoStream) -> cython.void:
+    packet._stream = stream
+    packet.ptr.stream_index = stream.ptr.index
+
+
+def _encode_chunk(template: CodecContext, options: dict, frames: list):
+    ctx: CodecContext = CodecContext.create(template.codec, "w")
+    copy_encoder_settings(template, ctx)
+    # Automatic threading in every chunk would oversubscribe the machine; the
+    # chunks are the parallelism unless the stream asks for more explicitly.
+    ctx.ptr.thread_count = template.ptr.thread_count or 1
+    ctx.options = dict(options)
+
+    packets: list = []
+    for frame in frames:
+        ctx.encode_into(frame, packets)
+    ctx.encode_into(None, packets)
+    return packets
+
+
+@cython.final
+@cython.cclass
+class _Retimer:
+    """Rebuilds decoding timestamps across independently encoded chunks.
+
+    Each chunk's encoder starts its own decoding timeline, which would overlap
+    the end of the previous chunk. Within a chunk, packet ``i`` in decoding
+    order is given the ``i``-th presentation timestamp counted from ``delay``
+    places before the chunk's first, borrowing the previous chunk's last
+    timestamps, so decoding timestamps run on without a break.
+    """
+
+    def __init__(self):
+        self.tail = []
+        self.delay = 0
+        self.last_dts = 0
+        self.started = False
+
+    @cython.ccall
+    def retime(self, packets: list) -> list:
+        if not packets:
+            return packets
+
+        packet: Packet
+        pts: list = []
+        for packet in packets:
+            if packet.ptr.pts == lib.AV_NOPTS_VALUE:
+                raise ValueError("cannot retime packets without a pts")
+            pts.append(packet.ptr.pts)
+        ordered: list = sorted(pts)
+        # Ranks per packet rather than per timestamp, so that packets sharing
+        # one keep their decoding order.
+        i: cython.Py_ssize_t
+        rank: list = [0] * len(pts)
+        for i, j in enumerate(sorted(range(len(pts)), key=pts.__getitem__)):
+            rank[j] = i
+        self.delay = max(self.delay, max([i - rank[i] for i in range(len(pts))]))
+
+        if not self.started:
+            step = ordered[1] - ordered[0] if len(ordered) > 1 else 1
+            self.tail = [
+                ordered[0] - (self.delay - i) * step for i in range(self.delay)
+            ]
+        elif len(self.tail) < self.delay:
+            # Not enough history (the delay grew, or a very short chunk):
+            # spread the missing timestamps between the last one and this
+            # chunk's first.
+            need: cython.Py_ssize_t = self.delay - len(self.tail)
+            low = self.tail[0] if self.tail else ordered[0]
+            gap = low - self.last_dts
+            self.tail = [
+                self.last_dts + (i + 1) * gap // (need + 1) for i in range(need)
+            ] + self.tail
+
+        timeline: list = self.tail[len(self.tail) - self.delay :] + ordered
+        dts: int64_t
+        for i in range(len(packets)):
+            packet = packets[i]
+            dts = timeline[i]
+            # A decoding timestamp may not pass the presentation one, and must
+            # keep increasing; only when both cannot hold does the latter win.
+            if dts > packet.ptr.pts:
+                dts = packet.ptr.pts
+            if self.started and dts <= self.last_dts:
+                dts = self.last_dts + 1
+            packet.ptr.dts = dts
+            self.last_dts = dts
+            self.started = True
+
+        self.tail = timeline[len(timeline) - self.delay :] if self.delay else []
+        return packets
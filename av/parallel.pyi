@@ -0,0 +1,13 @@
+from collections.abc import Iterable, Iterator
+
+from .packet import Packet
+from .video.frame import VideoFrame
+from .video.stream import VideoStream
+
+def encode_chunked(
+    frames: Iterable[VideoFrame],
+    stream: VideoStream,
+    options: dict[str, str] | None = None,
+    chunk_frames: int = 250,
+    workers: int | None = None,
+) -> Iterator[Packet]: ...
@@ -1,3 +1,5 @@
+from libc.stdint cimport int64_t, uint8_t, uint16_t, uint64_t
+
 from av.buffer cimport Buffer
 from av.frame cimport Frame
 
@@ -7,3 +9,48 @@ cdef class Plane(Buffer):
     cdef int index
     cdef size_t _buffer_size(self)
     cdef void* _buffer_ptr(self)
+
+
+cdef enum DeviceType:
+    kCPU = 1
+    kCuda = 2
+
+cdef enum DataTypeCode:
+    kDLInt = 0
+    kDLUInt = 1
+    kDLFloat = 2
+
+cdef struct DLDataType:
+    uint8_t code
+    uint8_t bits
+    uint16_t lanes
+
+cdef struct DLTensor:
+    void* data
+    int device_type
+    int device_id
+    int ndim
+    DLDataType dtype
+    int64_t* shape
+    int64_t* strides
+    uint64_t byte_offset
+
+cdef struct DLManagedTensor
+
+ctypedef void (*DLManagedTensorDeleter)(DLManagedTensor*) noexcept nogil
+
+cdef struct DLManagedTensor:
+    DLTensor dl_tensor
+    void* manager_ctx
+    DLManagedTensorDeleter deleter
+
+cdef object dlpack_capsule(
+    Frame frame,
+    int index,
+    int ndim,
+    const int64_t* shape,
+    const int64_t* strides,
+    DLDataType dtype,
+    int device_type,
+    int device_id,
+)
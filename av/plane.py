@@ -1,4 +1,12 @@
 import cython
+import cython.cimports.libav as lib
+from cython.cimports.av.error import err_check
+from cython.cimports.cpython.pycapsule import (
+    PyCapsule_GetPointer,
+    PyCapsule_IsValid,
+    PyCapsule_New,
+)
+from cython.cimports.libc.stdlib import free, malloc
 
 
 @cython.cclass
@@ -22,3 +30,131 @@ class Plane(Buffer):
     @cython.cfunc
     def _buffer_ptr(self) -> cython.p_void:
         return self.frame.ptr.extended_data[self.index]
+
+
+@cython.cfunc
+def dlpack_capsule(
+    frame: Frame,
+    index: cython.int,
+    ndim: cython.int,
+    shape: cython.pointer[cython.const[int64_t]],
+    strides: cython.pointer[cython.const[int64_t]],
+    dtype: DLDataType,
+    device_type: cython.int,
+    device_id: cython.int,
+) -> object:
+    """Export plane ``index`` of ``frame`` as a ``"dltensor"`` capsule.
+
+    The tensor holds its own reference to the frame's buffers, so it outlives
+    both the frame and the plane it was taken from.
+
+    """
+    frame_ref: cython.pointer[lib.AVFrame] = lib.av_frame_alloc()
+    if frame_ref == cython.NULL:
+        raise MemoryError("av_frame_alloc() failed")
+    ret: cython.int = lib.av_frame_ref(frame_ref, frame.ptr)
+    if ret < 0:
+        lib.av_frame_free(cython.address(frame_ref))
+        err_check(ret)
+
+    tensor_shape = cython.cast(
+        cython.pointer[int64_t], malloc(ndim * cython.sizeof(int64_t))
+    )
+    tensor_strides = cython.cast(
+        cython.pointer[int64_t], malloc(ndim * cython.sizeof(int64_t))
+    )
+    if tensor_shape == cython.NULL or tensor_strides == cython.NULL:
+        if tensor_shape != cython.NULL:
+            free(tensor_shape)
+        if tensor_strides != cython.NULL:
+            free(tensor_strides)
+        lib.av_frame_free(cython.address(frame_ref))
+        raise MemoryError("malloc() failed")
+
+    i: cython.int
+    for i in range(ndim):
+        tensor_shape[i] = shape[i]
+        tensor_strides[i] = strides[i]
+
+    ctx = cython.cast(
+        cython.pointer[cython.p_void], malloc(3 * cython.sizeof(cython.p_void))
+    )
+    if ctx == cython.NULL:
+        free(tensor_shape)
+        free(tensor_strides)
+        lib.av_frame_free(cython.address(frame_ref))
+        raise MemoryError("malloc() failed")
+
+    ctx[0] = cython.cast(cython.p_void, frame_ref)
+    ctx[1] = cython.cast(cython.p_void, tensor_shape)
+    ctx[2] = cython.cast(cython.p_void, tensor_strides)
+
+    managed = cython.cast(
+        cython.pointer[DLManagedTensor], malloc(cython.sizeof(DLManagedTensor))
+    )
+    if managed == cython.NULL:
+        free(ctx)
+        free(tensor_shape)
+        free(tensor_strides)
+        lib.av_frame_free(cython.address(frame_ref))
+        raise MemoryError("malloc() failed")
+
+    managed.dl_tensor.data = cython.cast(cython.p_void, frame_ref.extended_data[index])
+    managed.dl_tensor.device_type = device_type
+    managed.dl_tensor.device_id = device_id
+    managed.dl_tensor.ndim = ndim
+    managed.dl_tensor.dtype = dtype
+    managed.dl_tensor.shape = tensor_shape
+    managed.dl_tensor.strides = tensor_strides
+    managed.dl_tensor.byte_offset = 0
+    managed.manager_ctx = cython.cast(cython.p_void, ctx)
+    managed.deleter = _dlpack_managed_tensor_deleter
+
+    try:
+        capsule = PyCapsule_New(
+            cython.cast(cython.p_void, managed),
+            b"dltensor",
+            _dlpack_capsule_destructor,
+        )
+    except Exception:
+        _dlpack_managed_tensor_deleter(managed)
+        raise
+
+    return capsule
+
+
+@cython.cfunc
+@cython.nogil
+@cython.exceptval(check=False)
+def _dlpack_managed_tensor_deleter(
+    managed: cython.pointer[DLManagedTensor],
+) -> cython.void:
+    if managed == cython.NULL:
+        return
+    ctx = cython.cast(cython.pointer[cython.p_void], managed.manager_ctx)
+    if ctx != cython.NULL:
+        frame_ref = cython.cast(cython.pointer[lib.AVFrame], ctx[0])
+        shape = cython.cast(cython.pointer[int64_t], ctx[1])
+        strides = cython.cast(cython.pointer[int64_t], ctx[2])
+
+        if frame_ref != cython.NULL:
+            lib.av_frame_free(cython.address(frame_ref))
+        if shape != cython.NULL:
+            free(shape)
+        if strides != cython.NULL:
+            free(strides)
+        free(ctx)
+
+    free(managed)
+
+
+@cython.cfunc
+@cython.exceptval(check=False)
+def _dlpack_capsule_destructor(capsule: object) -> cython.void:
+    if PyCapsule_IsValid(capsule, b"dltensor"):
+        managed = cython.cast(
+            cython.pointer[DLManagedTensor],
+            PyCapsule_GetPointer(capsule, b"dltensor"),
+        )
+        if managed != cython.NULL:
+            managed.deleter(managed)
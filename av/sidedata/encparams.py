@@ -90,46 +90,116 @@ class VideoEncParams(SideData):
 
         return VideoBlockParams(self, idx)
 
-    def qp_map(self):
+    def blocks_ndarray(self):
         """
-        Convenience method that creates a 2-D map with the quantization parameters per macroblock.
-        Only for MPEG2 and H264 encoded videos.
+        Get all block parameters as a NumPy structured array, without copying.
+
+        The array is a view over the side data's ``AVVideoBlockParams`` array,
+        with fields ``src_x``, ``src_y``, ``w``, ``h`` and ``delta_qp``. It is
+        empty if :attr:`nb_blocks` is 0.
         """
         import numpy as np
 
-        mb_h: cython.int = (self.frame.ptr.height + 15) // 16
-        mb_w: cython.int = (self.frame.ptr.width + 15) // 16
-        nb_mb: cython.int = mb_h * mb_w
-        block_idx, x, y = cython.declare(cython.int)
-        block: VideoBlockParams
-
-        if self.nb_blocks != nb_mb:
-            raise RuntimeError(
-                "Expected frame size to match number of blocks in side data"
+        p: cython.pointer[lib.AVVideoEncParams] = cython.cast(
+            cython.pointer[lib.AVVideoEncParams], self.ptr.data
+        )
+        if p.nb_blocks == 0:
+            return np.empty(
+                0, dtype=_block_dtype(cython.sizeof(lib.AVVideoBlockParams))
             )
 
-        type: lib.AVVideoEncParamsType = cython.cast(
+        return np.frombuffer(
+            self,
+            dtype=_block_dtype(p.block_size),
+            count=p.nb_blocks,
+            offset=p.blocks_offset,
+        )
+
+    def qp_map(self, block_size=None):
+        """
+        Create a 2-D map of the final quantisation parameter, ``qp + delta_qp``,
+        over a grid of ``block_size`` luma pixel cells.
+
+        Blocks may be any size: each one fills every cell it covers. Cells no
+        block covers hold the frame's :attr:`qp`.
+
+        :param int block_size: Size of a cell in luma pixels. Defaults to 16,
+            the macroblock size, for H.264 and MPEG-2, and to the smallest
+            block dimension otherwise.
+        :rtype: numpy.ndarray of ``int32``, of shape
+            ``(ceil(height / block_size), ceil(width / block_size))``.
+        """
+        import numpy as np
+
+        p: cython.pointer[lib.AVVideoEncParams] = cython.cast(
             cython.pointer[lib.AVVideoEncParams], self.ptr.data
-        ).type
-        if (
-            type != lib.AVVideoEncParamsType.AV_VIDEO_ENC_PARAMS_MPEG2
-            and type != lib.AVVideoEncParamsType.AV_VIDEO_ENC_PARAMS_H264
-        ):
-            raise ValueError("Expected MPEG2 or H264")
-
-        # Create a 2-D map with the number of macroblocks
-        map = np.empty((mb_h, mb_w), dtype=np.int32)
-
-        # Fill map with quantization parameter per macroblock
-        for block_idx in range(nb_mb):
-            block = VideoBlockParams(self, block_idx)
-            y = block.src_y // 16
-            x = block.src_x // 16
-            map[y, x] = self.qp + block.delta_qp
+        )
+        blocks = self.blocks_ndarray()
+
+        if block_size is None:
+            if (
+                p.type == lib.AVVideoEncParamsType.AV_VIDEO_ENC_PARAMS_MPEG2
+                or p.type == lib.AVVideoEncParamsType.AV_VIDEO_ENC_PARAMS_H264
+                or not len(blocks)
+            ):
+                block_size = 16
+            else:
+                block_size = int(min(blocks["w"].min(), blocks["h"].min()))
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+
+        width: cython.int = self.frame.ptr.width
+        height: cython.int = self.frame.ptr.height
+        map_h: cython.int = (height + block_size - 1) // block_size
+        map_w: cython.int = (width + block_size - 1) // block_size
+        map = np.full((map_h, map_w), p.qp, dtype=np.int32)
+        if not len(blocks):
+            return map
 
+        # Range of cells covered by each block, clipped to the visible frame.
+        x0 = np.clip(blocks["src_x"], 0, width) // block_size
+        y0 = np.clip(blocks["src_y"], 0, height) // block_size
+        x1 = (
+            np.clip(blocks["src_x"] + blocks["w"], 0, width) + block_size - 1
+        ) // block_size
+        y1 = (
+            np.clip(blocks["src_y"] + blocks["h"], 0, height) + block_size - 1
+        ) // block_size
+        nx = np.maximum(x1 - x0, 0)
+        ny = np.maximum(y1 - y0, 0)
+        counts = nx * ny
+        qps = p.qp + blocks["delta_qp"]
+
+        if (counts == 1).all():
+            map[y0, x0] = qps
+            return map
+
+        # Enumerate the cells of every block at once: cell k of a block lies at
+        # (k // nx, k % nx) from its top-left cell.
+        starts = np.cumsum(counts) - counts
+        k = np.arange(counts.sum()) - np.repeat(starts, counts)
+        nx_rep = np.repeat(nx, counts)
+        map[np.repeat(y0, counts) + k // nx_rep, np.repeat(x0, counts) + k % nx_rep] = (
+            np.repeat(qps, counts)
+        )
         return map
 
 
+@cython.cfunc
+def _block_dtype(itemsize: cython.size_t):
+    # AVVideoBlockParams, padded to the stride the side data actually uses.
+    import numpy as np
+
+    return np.dtype(
+        {
+            "names": ["src_x", "src_y", "w", "h", "delta_qp"],
+            "formats": ["int32", "int32", "int32", "int32", "int32"],
+            "offsets": [0, 4, 8, 12, 16],
+            "itemsize": itemsize,
+        }
+    )
+
+
 @cython.final
 @cython.cclass
 class VideoBlockParams:
@@ -17,7 +17,8 @@ class VideoEncParams:
     qp: int
     delta_qp: int
     def block_params(self, idx: int) -> VideoBlockParams: ...
-    def qp_map(self) -> np.ndarray[Any, Any]: ...
+    def blocks_ndarray(self) -> np.ndarray[Any, Any]: ...
+    def qp_map(self, block_size: int | None = None) -> np.ndarray[Any, Any]: ...
 
 class VideoBlockParams:
     src_x: int
@@ -52,25 +52,29 @@ class MotionVectors(SideData):
         """
         import numpy as np
 
-        return np.frombuffer(
-            self,
-            dtype=np.dtype(
-                [
-                    ("source", "int32"),
-                    ("w", "uint8"),
-                    ("h", "uint8"),
-                    ("src_x", "int16"),
-                    ("src_y", "int16"),
-                    ("dst_x", "int16"),
-                    ("dst_y", "int16"),
-                    ("flags", "uint64"),
-                    ("motion_x", "int32"),
-                    ("motion_y", "int32"),
-                    ("motion_scale", "uint16"),
-                ],
-                align=True,
-            ),
-        )
+        return np.frombuffer(self, dtype=vector_dtype())
+
+
+def vector_dtype():
+    """The NumPy structured dtype matching ``AVMotionVector``."""
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("source", "int32"),
+            ("w", "uint8"),
+            ("h", "uint8"),
+            ("src_x", "int16"),
+            ("src_y", "int16"),
+            ("dst_x", "int16"),
+            ("dst_y", "int16"),
+            ("flags", "uint64"),
+            ("motion_x", "int32"),
+            ("motion_y", "int32"),
+            ("motion_scale", "uint16"),
+        ],
+        align=True,
+    )
 
 
 @cython.final
@@ -12,6 +12,8 @@ class MotionVectors(SideData):
     def __len__(self) -> int: ...
     def to_ndarray(self) -> np.ndarray[Any, Any]: ...
 
+def vector_dtype() -> np.dtype[Any]: ...
+
 class MotionVector:
     source: int
     w: int
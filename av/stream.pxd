@@ -18,6 +18,7 @@ cdef class Stream:
     cdef readonly CodecContext codec_context
 
     cdef readonly IndexEntries index_entries
+    cdef object _worker  # EncoderWorker behind encode_async()
 
     # Private API.
     cdef void _init(self, Container, lib.AVStream*, CodecContext)
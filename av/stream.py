@@ -205,6 +205,34 @@ class Stream:
         else:
             self.ptr.id = value
 
+    def encode_async(self, frame=None):
+        """encode_async(frame=None)
+
+        Encode a frame on a background thread, muxing the packets into this
+        stream's container.
+
+        The first call writes the container's header and starts an
+        :class:`~av.codec.worker.EncoderWorker`; later calls queue frames for
+        it, muxing whatever packets have come out so far. Pass ``None`` to
+        flush the encoder, wait for it, and mux the rest; do so before closing
+        the container.
+
+        Do not call :meth:`encode` on the stream while it is encoding
+        asynchronously.
+        """
+        if frame is None:
+            if self._worker is not None:
+                worker, self._worker = self._worker, None
+                worker.close()
+            return
+
+        if self._worker is None:
+            from av.codec.worker import EncoderWorker
+
+            self._assert_has_codec_context(lib.AVERROR_ENCODER_NOT_FOUND)
+            self._worker = EncoderWorker(self, self.container)
+        self._worker.submit(frame)
+
     @property
     def profiles(self):
         """
@@ -6,6 +6,7 @@ from av.rational import AVRational
 
 from .codec import Codec, CodecContext
 from .container import Container
+from .frame import Frame
 from .index import IndexEntries
 
 class Disposition(IntFlag):
@@ -68,6 +69,8 @@ class Stream:
     # From context
     codec_tag: str
 
+    def encode_async(self, frame: Frame | None = None) -> None: ...
+
 class DataStream(Stream):
     type: Literal["data"]
     name: str | None
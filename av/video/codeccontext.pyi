@@ -51,5 +51,6 @@ class VideoCodecContext(CodecContext):
     type: Literal["video"]
 
     def encode(self, frame: VideoFrame | None = None) -> list[Packet]: ...
+    def encode_into(self, frame: VideoFrame | None, packets: list[Packet]) -> int: ...
     def encode_lazy(self, frame: VideoFrame | None = None) -> Iterator[Packet]: ...
     def decode(self, packet: Packet | None = None) -> list[VideoFrame]: ...
@@ -6,10 +6,12 @@ import cython
 import cython.cimports.libav as lib
 from cython.cimports.av.dictionary import Dictionary
 from cython.cimports.av.error import err_check
+from cython.cimports.av.frame import numpy_avbuffer_free
+from cython.cimports.av.plane import DLManagedTensor, kCPU, kCuda
 from cython.cimports.av.sidedata.sidedata import get_display_rotation
 from cython.cimports.av.utils import check_ndarray
 from cython.cimports.av.video.format import get_pix_fmt, get_video_format
-from cython.cimports.av.video.plane import DLManagedTensor, VideoPlane, kCPU, kCuda
+from cython.cimports.av.video.plane import VideoPlane
 from cython.cimports.cpython.exc import PyErr_Clear
 from cython.cimports.cpython.pycapsule import (
     PyCapsule_GetPointer,
@@ -252,18 +254,6 @@ def _dlpack_avbuffer_free(
         managed.deleter(managed)
 
 
-@cython.cfunc
-@cython.nogil
-@cython.exceptval(check=False)
-def _numpy_avbuffer_free(
-    opaque: cython.p_void,
-    data: cython.pointer[uint8_t],
-) -> cython.void:
-    if opaque != cython.NULL:
-        with cython.gil:
-            Py_DECREF(cython.cast(object, opaque))
-
-
 _cinit_bypass_sentinel = cython.declare(object, object())
 
 # `pix_fmt`s supported by Frame.to_ndarray() and Frame.from_ndarray()
@@ -454,6 +444,10 @@ def alloc_video_frame() -> VideoFrame:
     return VideoFrame(_cinit_bypass_sentinel)
 
 
+# PIL image mode -> pixel format it maps onto byte for byte.
+_pil_modes = {"RGB": "rgb24", "RGBA": "rgba", "L": "gray"}
+
+
 class PictureType(IntEnum):
     NONE = lib.AV_PICTURE_TYPE_NONE  # Undefined
     I = lib.AV_PICTURE_TYPE_I  # Intra
@@ -848,41 +842,42 @@ class VideoFrame(Frame):
             output.mux(output_stream.encode(self.reformat(format=pix_fmt)))
             output.mux(output_stream.encode(None))
 
-    def to_image(self, **kwargs):
-        """Get an RGB ``PIL.Image`` of this frame.
+    def to_image(self, mode="RGB", **kwargs):
+        """Get a ``PIL.Image`` of this frame.
 
-        Any ``**kwargs`` are passed to :meth:`.VideoReformatter.reformat`.
+        :param str mode: ``"RGB"``, ``"RGBA"`` or ``"L"`` (grayscale). The frame
+            is converted to ``rgb24``, ``rgba`` or ``gray`` first.
+
+        Any other ``**kwargs`` are passed to :meth:`.VideoReformatter.reformat`.
+
+        The image is built straight from the plane with its real line size, so
+        no Python-level copy is made. ``"RGBA"`` and ``"L"`` images are views of
+        the frame's memory, which they keep alive; ``"RGB"`` images are filled
+        by a single native strided copy, as PIL stores them with 4 bytes per
+        pixel.
 
         .. note:: PIL or Pillow must be installed.
 
         """
         from PIL import Image
 
-        plane: VideoPlane = self.reformat(format="rgb24", **kwargs).planes[0]
+        pix_fmt = _pil_modes.get(mode)
+        if pix_fmt is None:
+            raise ValueError(f"unsupported image mode {mode!r}")
 
-        i_buf: cython.const[uint8_t][:] = plane
+        plane: VideoPlane = self.reformat(format=pix_fmt, **kwargs).planes[0]
         line_size: cython.int = plane.line_size
-        i_stride: cython.size_t = abs(line_size)
-
-        o_pos: cython.size_t = 0
-        o_stride: cython.size_t = plane.width * 3
-        o_size: cython.size_t = plane.height * o_stride
-        o_buf: bytearray = bytearray(o_size)
-
-        # For bottom-up frames (negative line_size) the buffer protocol exposes
-        # rows from the lowest address, so the top display row is at the far end.
-        i_pos: cython.size_t = (plane.height - 1) * i_stride if line_size < 0 else 0
-
-        while o_pos < o_size:
-            o_buf[o_pos : o_pos + o_stride] = i_buf[i_pos : i_pos + o_stride]
-            if line_size < 0:
-                i_pos -= i_stride
-            else:
-                i_pos += i_stride
-            o_pos += o_stride
 
-        return Image.frombytes(
-            "RGB", (plane.width, plane.height), bytes(o_buf), "raw", "RGB", 0, 1
+        # The plane's buffer starts at its lowest address, so a bottom-up frame
+        # (negative line_size) is read upwards.
+        return Image.frombuffer(
+            mode,
+            (plane.width, plane.height),
+            plane,
+            "raw",
+            mode,
+            abs(line_size),
+            1 if line_size > 0 else -1,
         )
 
     @cython.cdivision(True)
@@ -1287,7 +1282,7 @@ class VideoFrame(Frame):
         self.ptr.buf[0] = lib.av_buffer_create(
             c_ptr,
             required,
-            _numpy_avbuffer_free,
+            numpy_avbuffer_free,
             cython.cast(cython.p_void, py_buf),
             0,
         )
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
+from PIL.Image import Image
 
 from av.frame import Frame
 
@@ -87,7 +88,7 @@ class VideoFrame(Frame):
     ) -> VideoFrame: ...
     def to_rgb(self, **kwargs: Any) -> VideoFrame: ...
     def save(self, filepath: str | Path, **options: Any) -> None: ...
-    def to_image(self, **kwargs): ...
+    def to_image(self, mode: str = "RGB", **kwargs: Any) -> Image: ...
     def to_ndarray(
         self, channel_last: bool = False, **kwargs: Any
     ) -> _SupportedNDarray: ...
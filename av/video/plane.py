@@ -1,6 +1,12 @@
 import cython
 import cython.cimports.libav as lib
-from cython.cimports.av.error import err_check
+from cython.cimports.av.plane import (
+    DLDataType,
+    dlpack_capsule,
+    kCPU,
+    kCuda,
+    kDLUInt,
+)
 from cython.cimports.av.video.format import (
     VideoFormatComponent,
     get_pix_fmt,
@@ -9,12 +15,7 @@ from cython.cimports.av.video.format import (
 from cython.cimports.av.video.frame import VideoFrame
 from cython.cimports.cpython import PyBUF_WRITABLE, PyBuffer_FillInfo
 from cython.cimports.cpython.buffer import Py_buffer
-from cython.cimports.cpython.pycapsule import (
-    PyCapsule_GetPointer,
-    PyCapsule_IsValid,
-    PyCapsule_New,
-)
-from cython.cimports.libc.stdlib import free, malloc
+from cython.cimports.libc.stdint import int64_t
 
 
 @cython.final
@@ -257,25 +258,8 @@ class VideoPlane(Plane):
                 st1 = ncomp
                 st2 = 1
 
-        frame_ref: cython.pointer[lib.AVFrame] = lib.av_frame_alloc()
-        if frame_ref == cython.NULL:
-            raise MemoryError("av_frame_alloc() failed")
-        err_check(lib.av_frame_ref(frame_ref, self.frame.ptr))
-
-        shape = cython.cast(
-            cython.pointer[int64_t], malloc(ndim * cython.sizeof(int64_t))
-        )
-        strides = cython.cast(
-            cython.pointer[int64_t], malloc(ndim * cython.sizeof(int64_t))
-        )
-        if shape == cython.NULL or strides == cython.NULL:
-            if shape != cython.NULL:
-                free(shape)
-            if strides != cython.NULL:
-                free(strides)
-            lib.av_frame_free(cython.address(frame_ref))
-            raise MemoryError("malloc() failed")
-
+        shape: int64_t[3]
+        strides: int64_t[3]
         if ndim == 2:
             shape[0] = s0
             shape[1] = s1
@@ -289,85 +273,13 @@ class VideoPlane(Plane):
             strides[1] = st1
             strides[2] = st2
 
-        ctx = cython.cast(
-            cython.pointer[cython.p_void], malloc(3 * cython.sizeof(cython.p_void))
-        )
-        if ctx == cython.NULL:
-            free(shape)
-            free(strides)
-            lib.av_frame_free(cython.address(frame_ref))
-            raise MemoryError("malloc() failed")
-
-        ctx[0] = cython.cast(cython.p_void, frame_ref)
-        ctx[1] = cython.cast(cython.p_void, shape)
-        ctx[2] = cython.cast(cython.p_void, strides)
-
-        managed = cython.cast(
-            cython.pointer[DLManagedTensor], malloc(cython.sizeof(DLManagedTensor))
-        )
-        if managed == cython.NULL:
-            free(ctx)
-            free(shape)
-            free(strides)
-            lib.av_frame_free(cython.address(frame_ref))
-            raise MemoryError("malloc() failed")
-
-        managed.dl_tensor.data = cython.cast(cython.p_void, frame_ref.data[self.index])
-        managed.dl_tensor.device_type = device_type
-        managed.dl_tensor.device_id = device_id
-        managed.dl_tensor.ndim = ndim
-        managed.dl_tensor.dtype = DLDataType(code=1, bits=bits, lanes=1)
-        managed.dl_tensor.shape = shape
-        managed.dl_tensor.strides = strides
-        managed.dl_tensor.byte_offset = 0
-        managed.manager_ctx = cython.cast(cython.p_void, ctx)
-        managed.deleter = _dlpack_managed_tensor_deleter
-
-        try:
-            capsule = PyCapsule_New(
-                cython.cast(cython.p_void, managed),
-                b"dltensor",
-                _dlpack_capsule_destructor,
-            )
-        except Exception:
-            _dlpack_managed_tensor_deleter(managed)
-            raise
-
-        return capsule
-
-
-@cython.cfunc
-@cython.nogil
-@cython.exceptval(check=False)
-def _dlpack_managed_tensor_deleter(
-    managed: cython.pointer[DLManagedTensor],
-) -> cython.void:
-    if managed == cython.NULL:
-        return
-    ctx = cython.cast(cython.pointer[cython.p_void], managed.manager_ctx)
-    if ctx != cython.NULL:
-        frame_ref = cython.cast(cython.pointer[lib.AVFrame], ctx[0])
-        shape = cython.cast(cython.pointer[int64_t], ctx[1])
-        strides = cython.cast(cython.pointer[int64_t], ctx[2])
-
-        if frame_ref != cython.NULL:
-            lib.av_frame_free(cython.address(frame_ref))
-        if shape != cython.NULL:
-            free(shape)
-        if strides != cython.NULL:
-            free(strides)
-        free(ctx)
-
-    free(managed)
-
-
-@cython.cfunc
-@cython.exceptval(check=False)
-def _dlpack_capsule_destructor(capsule: object) -> cython.void:
-    if PyCapsule_IsValid(capsule, b"dltensor"):
-        managed = cython.cast(
-            cython.pointer[DLManagedTensor],
-            PyCapsule_GetPointer(capsule, b"dltensor"),
+        return dlpack_capsule(
+            self.frame,
+            self.index,
+            ndim,
+            shape,
+            strides,
+            DLDataType(code=kDLUInt, bits=bits, lanes=1),
+            device_type,
+            device_id,
         )
-        if managed != cython.NULL:
-            managed.deleter(managed)
@@ -15,4 +15,5 @@ cdef class VideoStream(Stream):
     cdef void _apply_display_matrix(self)
 
     cpdef encode(self, VideoFrame frame=?)
+    cpdef int encode_into(self, VideoFrame frame, list packets)
     cpdef decode(self, Packet packet=?)
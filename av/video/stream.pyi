@@ -20,6 +20,7 @@ class VideoStream(Stream):
     codec_context: VideoCodecContext
 
     def encode(self, frame: VideoFrame | None = None) -> list[Packet]: ...
+    def encode_into(self, frame: VideoFrame | None, packets: list[Packet]) -> int: ...
     def encode_lazy(self, frame: VideoFrame | None = None) -> Iterator[Packet]: ...
     def decode(self, packet: Packet | None = None) -> list[VideoFrame]: ...
     def set_display_matrix(self, matrix: Sequence[int] | None) -> None: ...
@@ -0,0 +1,319 @@
+import cython
+from cython.cimports import libav as lib
+from cython.cimports.av.codec.context import CodecContext
+from cython.cimports.av.container.input import InputContainer
+from cython.cimports.av.error import err_check
+from cython.cimports.av.packet import Packet
+from cython.cimports.av.video.frame import VideoFrame
+from cython.cimports.av.video.reformatter import VideoReformatter
+from cython.cimports.av.video.stream import VideoStream
+from cython.cimports.libc.stdint import int64_t
+
+from av.error import FFmpegError
+
+# Encoder and pixel format used for each supported ``format=`` value.
+_image_encoders = {
+    "jpg": ("mjpeg", "yuvj420p"),
+    "jpeg": ("mjpeg", "yuvj420p"),
+    "png": ("png", "rgb24"),
+}
+
+
+@cython.cfunc
+def _target_size(src_width: cython.int, src_height: cython.int, size):
+    if size is None:
+        return src_width, src_height
+
+    width, height = size
+    if width is None and height is None:
+        return src_width, src_height
+    if width is None:
+        width = max(1, round(src_width * height / src_height))
+    elif height is None:
+        height = max(1, round(src_height * width / src_width))
+    return width, height
+
+
+@cython.cfunc
+def _pick_lowres(
+    src_width: cython.int,
+    src_height: cython.int,
+    width: cython.int,
+    height: cython.int,
+    max_lowres: cython.int,
+) -> cython.int:
+    # Largest reduction that still decodes at least as many pixels as we output.
+    lowres: cython.int = 0
+    while (
+        lowres < max_lowres
+        and (src_width >> (lowres + 1)) >= width
+        and (src_height >> (lowres + 1)) >= height
+    ):
+        lowres += 1
+    return lowres
+
+
+@cython.cfunc
+def _decode_keyframe(codec_context: CodecContext, packet: Packet) -> VideoFrame:
+    # Send the one keyframe and drain the decoder straight away, so a decoder
+    # with reorder delay hands it back without being fed the rest of the GOP.
+    frames = codec_context.decode(packet) + codec_context.decode(None)
+    codec_context.flush_buffers()
+    return frames[0] if frames else None
+
+
+def thumbnails(
+    file,
+    count=None,
+    interval=None,
+    size=None,
+    format=None,
+    *,
+    stream=None,
+    lowres=None,
+    interpolation=None,
+    options=None,
+):
+    """thumbnails(file, count=None, interval=None, size=None, format=None, *, stream=None, lowres=None, interpolation=None, options=None)
+
+    Extract preview images from a video by decoding keyframes only.
+
+    Exactly one of ``count`` or ``interval`` must be given. Each thumbnail is
+    the keyframe at or before its target time, found through
+    :attr:`.Stream.index_entries` when the demuxer has an index and by a
+    keyframe seek otherwise. Targets that land on the same keyframe produce a
+    single thumbnail. Inputs that cannot seek are scanned once instead.
+
+    Decoding uses a decoder of its own, leaving the stream's untouched, run
+    with ``skip_frame="NONKEY"``, so nothing but those keyframes is ever
+    decoded, and with the ``lowres`` option when the decoder supports it and
+    the requested size allows it. All thumbnails are scaled by a single
+    :class:`.VideoReformatter`.
+
+    :param file: Anything :func:`av.open` accepts, or an open
+        :class:`.InputContainer`, which is left open.
+    :param int count: Number of thumbnails, spread evenly over the duration.
+    :param float interval: Seconds between thumbnails.
+    :param tuple size: ``(width, height)`` of the thumbnails. Either may be
+        ``None`` to preserve the aspect ratio. ``None`` keeps the source size.
+    :param str format: ``None`` to return :class:`.VideoFrame` objects in
+        ``rgb24``, or ``"jpg"``/``"png"`` to return encoded images as ``bytes``.
+    :param stream: The :class:`.VideoStream` to read, defaulting to the first.
+    :param int lowres: Decoder downscale as a power of two, clamped to
+        :attr:`.Codec.max_lowres`. ``None`` picks the largest one that still
+        covers ``size``.
+    :param interpolation: Passed to :meth:`.VideoReformatter.reformat`.
+    :param dict options: Passed to :func:`av.open` when ``file`` is not open.
+    :rtype: list[VideoFrame] | list[bytes]
+
+    """
+    if (count is None) == (interval is None):
+        raise ValueError("exactly one of count or interval must be given")
+    if count is not None and count < 1:
+        raise ValueError("count must be positive")
+    if interval is not None and interval <= 0:
+        raise ValueError("interval must be positive")
+    if format is not None and format not in _image_encoders:
+        raise ValueError(f"unsupported thumbnail format {format!r}")
+
+    container: InputContainer
+    owned: cython.bint = not isinstance(file, InputContainer)
+    if owned:
+        from av.container.core import open
+
+        container = open(file, "r", options=options)
+    else:
+        container = file
+
+    try:
+        return _thumbnails(
+            container, stream, count, interval, size, format, lowres, interpolation
+        )
+    finally:
+        if owned:
+            container.close()
+
+
+@cython.cfunc
+def _thumbnails(
+    container: InputContainer,
+    stream: VideoStream,
+    count,
+    interval,
+    size,
+    format,
+    lowres,
+    interpolation,
+):
+    if stream is None:
+        if not container.streams.video:
+            raise ValueError("input has no video stream")
+        stream = container.streams.video[0]
+
+    source: CodecContext = stream.codec_context
+    if source is None:
+        raise ValueError("no decoder available for the video stream")
+
+    # Decode with a context of our own, so that the stream's decoder, which
+    # may be the caller's, keeps its settings and state.
+    codec_context: CodecContext = CodecContext.create(source.codec, "r")
+    err_check(lib.avcodec_parameters_to_context(codec_context.ptr, stream.ptr.codecpar))
+    codec_context.ptr.pkt_timebase = stream.ptr.time_base
+    codec_context.ptr.thread_count = source.ptr.thread_count
+    codec_context.ptr.thread_type = source.ptr.thread_type
+
+    src_width: cython.int = codec_context.ptr.width
+    src_height: cython.int = codec_context.ptr.height
+    width, height = _target_size(src_width, src_height, size)
+
+    max_lowres: cython.int = codec_context.codec.max_lowres
+    if lowres is None:
+        lowres = (
+            _pick_lowres(src_width, src_height, width, height, max_lowres)
+            if size is not None
+            else 0
+        )
+    lowres = min(lowres, max_lowres)
+    if lowres > 0:
+        codec_context.options["lowres"] = str(lowres)
+    codec_context.skip_frame = "NONKEY"
+
+    # Work out the target timestamps in the stream's time base.
+    time_base = stream.time_base
+    start: int64_t = stream.start_time if stream.start_time is not None else 0
+    duration = stream.duration
+    if duration is None and container.duration is not None:
+        duration = int(container.duration / 1_000_000 / time_base)
+
+    targets: list = []
+    n: cython.int = 0
+    if duration:
+        if count is not None:
+            for n in range(count):
+                targets.append(start + int((n + 0.5) * duration / count))
+        else:
+            step = interval / time_base
+            while n * step < duration:
+                targets.append(start + int(n * step))
+                n += 1
+
+    frames: list = []
+    if targets:
+        try:
+            frames = _seek_keyframes(container, stream, codec_context, targets)
+        except FFmpegError:
+            # Not seekable; fall through to a single linear pass.
+            frames = []
+    if not frames:
+        if targets:
+            # Scan from the start, not from wherever the last seek left off.
+            try:
+                container.seek(0)
+            except FFmpegError:
+                pass
+        if interval is not None:
+            frames = _scan_keyframes(
+                container, stream, codec_context, int(interval / time_base), 0
+            )
+        else:
+            frames = _scan_keyframes(container, stream, codec_context, 0, count)
+
+    reformatter: VideoReformatter = VideoReformatter()
+    pix_fmt = "rgb24" if format is None else _image_encoders[format][1]
+    out: list = []
+    encoder: CodecContext = None
+    frame: VideoFrame
+    for frame in frames:
+        frame = reformatter.reformat(
+            frame, width, height, format=pix_fmt, interpolation=interpolation
+        )
+        if format is None:
+            out.append(frame)
+            continue
+
+        if encoder is None:
+            encoder = CodecContext.create(_image_encoders[format][0], "w")
+            encoder.width = width
+            encoder.height = height
+            encoder.pix_fmt = pix_fmt
+            encoder.time_base = frame.time_base or time_base
+        for packet in encoder.encode(frame):
+            out.append(bytes(packet))
+    if encoder is not None:
+        for packet in encoder.encode(None):
+            out.append(bytes(packet))
+
+    return out
+
+
+@cython.cfunc
+def _seek_keyframes(
+    container: InputContainer,
+    stream: VideoStream,
+    codec_context: CodecContext,
+    targets: list,
+):
+    index = stream.index_entries
+    use_index: cython.bint = len(index) > 0
+    frames: list = []
+    last_key = None
+    last_pts = None
+    packet: Packet
+
+    for target in targets:
+        seek_to = target
+        if use_index:
+            i = index.search_timestamp(target, backward=True)
+            if i >= 0:
+                seek_to = index[i].timestamp
+                # Several targets inside one GOP share a keyframe; decode it once.
+                if seek_to == last_key:
+                    continue
+                last_key = seek_to
+
+        container.seek(seek_to, stream=stream)
+        for packet in container.demux(stream):
+            if packet.ptr.size == 0:
+                break
+            if not packet.is_keyframe:
+                continue
+            frame = _decode_keyframe(codec_context, packet)
+            if frame is None:
+                continue
+            if frame.pts is None or frame.pts != last_pts:
+                frames.append(frame)
+                last_pts = frame.pts
+            break
+
+    return frames
+
+
+@cython.cfunc
+def _scan_keyframes(
+    container: InputContainer,
+    stream: VideoStream,
+    codec_context: CodecContext,
+    step: int64_t,
+    count: cython.int,
+):
+    frames: list = []
+    next_pts = None
+    packet: Packet
+
+    for packet in container.demux(stream):
+        if packet.ptr.size == 0:
+            break
+        if not packet.is_keyframe:
+            continue
+        if next_pts is not None and packet.pts is not None and packet.pts < next_pts:
+            continue
+        frame = _decode_keyframe(codec_context, packet)
+        if frame is None:
+            continue
+        frames.append(frame)
+        if count and len(frames) >= count:
+            break
+        if step and frame.pts is not None:
+            next_pts = frame.pts + step
+
+    return frames
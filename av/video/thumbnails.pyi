@@ -0,0 +1,34 @@
+from typing import Any, Literal, overload
+
+from av.container import InputContainer
+
+from .frame import VideoFrame
+from .reformatter import Interpolation
+from .stream import VideoStream
+
+@overload
+def thumbnails(
+    file: Any,
+    count: int | None = None,
+    interval: float | None = None,
+    size: tuple[int | None, int | None] | None = None,
+    format: None = None,
+    *,
+    stream: VideoStream | None = None,
+    lowres: int | None = None,
+    interpolation: Interpolation | str | None = None,
+    options: dict[str, str] | None = None,
+) -> list[VideoFrame]: ...
+@overload
+def thumbnails(
+    file: Any,
+    count: int | None = None,
+    interval: float | None = None,
+    size: tuple[int | None, int | None] | None = None,
+    *,
+    format: Literal["jpg", "jpeg", "png"],
+    stream: VideoStream | None = None,
+    lowres: int | None = None,
+    interpolation: Interpolation | str | None = None,
+    options: dict[str, str] | None = None,
+) -> list[bytes]: ...
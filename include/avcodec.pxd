@@ -166,6 +166,7 @@ cdef extern from "libavcodec/avcodec.h" nogil:
         AVMediaType type
         AVCodecID id
         int capabilities
+        uint8_t max_lowres
         const AVClass *priv_class
 
     cdef int av_codec_is_encoder(const AVCodec*)
@@ -288,6 +289,8 @@ cdef extern from "libavcodec/avcodec.h" nogil:
         int refs
         int profile
         int level
+        AVDiscard skip_loop_filter
+        AVDiscard skip_idct
         AVDiscard skip_frame
 
         int subtitle_header_size
@@ -359,6 +362,8 @@ cdef extern from "libavcodec/avcodec.h" nogil:
         size_t size
         AVDictionary *metadata
 
+    cdef int AV_NUM_DATA_POINTERS
+
     # See: http://ffmpeg.org/doxygen/trunk/structAVFrame.html
     cdef struct AVFrame:
         uint8_t *data[8]
@@ -489,8 +494,10 @@ cdef extern from "libavcodec/avcodec.h" nogil:
         AVCodecID codec_id
         uint8_t *extradata
         int extradata_size
+        int format
         int width
         int height
+        AVChannelLayout ch_layout
         int sample_rate
         AVPacketSideData *coded_side_data
         int nb_coded_side_data
@@ -10,7 +10,9 @@ cdef extern from "libavutil/audio_fifo.h" nogil:
     )
     cdef int av_audio_fifo_write(AVAudioFifo *af, void *const *data, int nb_samples)
     cdef int av_audio_fifo_read(AVAudioFifo *af, void *const *data, int nb_samples)
+    cdef int av_audio_fifo_peek(const AVAudioFifo *af, void *const *data, int nb_samples)
     cdef int av_audio_fifo_size(AVAudioFifo *af)
+    cdef int av_audio_fifo_drain(AVAudioFifo *af, int nb_samples)
 
 cdef extern from "libavutil/avutil.h" nogil:
     cdef const char* av_version_info()
@@ -107,6 +109,7 @@ cdef extern from "libavutil/avutil.h" nogil:
     ctypedef struct AVRational:
         int num
         int den
+    cdef int64_t av_rescale(int64_t a, int64_t b, int64_t c)
     cdef int64_t av_rescale_q(int64_t a, AVRational bq, AVRational cq)
     cdef const char* av_get_media_type_string(AVMediaType media_type)
 
@@ -187,6 +190,9 @@ cdef extern from "libavutil/frame.h" nogil:
     cdef int av_frame_get_buffer(AVFrame *frame, int align)
     cdef int av_frame_make_writable(AVFrame *frame)
     cdef int av_frame_copy_props(AVFrame *dst, const AVFrame *src)
+    cdef AVFrameSideData* av_frame_get_side_data(
+        const AVFrame *frame, AVFrameSideDataType type
+    )
 
 cdef extern from "libavutil/hwcontext.h" nogil:
     cdef struct AVHWDeviceContext:
@@ -332,6 +338,7 @@ cdef extern from "libavutil/opt.h" nogil:
     cdef int av_opt_get(
         void *obj, const char *name, int search_flags, uint8_t **out_val
     )
+    cdef int av_opt_set(void *obj, const char *name, const char *val, int search_flags)
 
 cdef extern from "libavutil/pixdesc.h" nogil:
     # See: http://ffmpeg.org/doxygen/trunk/structAVComponentDescriptor.html
@@ -378,6 +385,7 @@ cdef extern from "libavutil/samplefmt.h" nogil:
         AV_SAMPLE_FMT_S32
         AV_SAMPLE_FMT_FLT
         AV_SAMPLE_FMT_DBL
+        AV_SAMPLE_FMT_S64
 
     cdef AVSampleFormat av_get_sample_fmt(const char *name)
     cdef const char *av_get_sample_fmt_name(AVSampleFormat sample_fmt)
@@ -393,6 +401,10 @@ cdef extern from "libavutil/samplefmt.h" nogil:
         int align
     )
 
+cdef extern from "libavutil/time.h" nogil:
+    cdef int64_t av_gettime_relative()
+    cdef int av_usleep(unsigned usec)
+
 cdef extern from "libavutil/video_enc_params.h" nogil:
     cdef enum AVVideoEncParamsType:
         AV_VIDEO_ENC_PARAMS_NONE
@@ -1,8 +1,11 @@
 from fractions import Fraction
 
+import numpy as np
+import pytest
+
 import av
 
-from .common import TestCase, fate_suite
+from .common import TestCase, assertNdarraysEqual, fate_suite
 
 
 class TestAudioFifo(TestCase):
@@ -115,3 +118,80 @@ class TestAudioFifo(TestCase):
         assert oframe is not None
         assert oframe.pts is None and oframe.time_base is None
         assert oframe.sample_rate == iframe.sample_rate
+
+    def test_ndarray_roundtrip(self) -> None:
+        fifo = av.AudioFifo()
+        with pytest.raises(ValueError):
+            fifo.write_ndarray(np.zeros((2, 10), dtype="f4"))
+
+        data = np.random.rand(2, 1000).astype("f4")
+        fifo.write_ndarray(data[:, :600], format="fltp", layout="stereo", rate=16000)
+        fifo.write_ndarray(data[:, 600:])
+        assert fifo.samples == 1000
+        assert fifo.sample_rate == 16000
+
+        # Peeking leaves the samples in place.
+        peeked = fifo.peek(300)
+        assert peeked is not None
+        assertNdarraysEqual(peeked, data[:, :300])
+        assert fifo.samples == 1000
+
+        out = np.empty((2, 400), dtype="f4")
+        window = fifo.read_ndarray(out=out)
+        assert window is out
+        assertNdarraysEqual(out, data[:, :400])
+
+        assert fifo.read_ndarray(700) is None
+        rest = fifo.read_ndarray(700, partial=True)
+        assert rest is not None
+        assertNdarraysEqual(rest, data[:, 400:])
+        assert fifo.read_ndarray() is None
+        assert fifo.samples_read == 1000
+
+    def test_ndarray_packed_into_out_view(self) -> None:
+        fifo = av.AudioFifo()
+        data = np.arange(200, dtype="i2").reshape(1, 200)
+        fifo.write_ndarray(data, format="s16", layout="stereo")
+
+        out = np.zeros((1, 300), dtype="i2")
+        window = fifo.read_ndarray(out=out, partial=True)
+        assert window is not None
+        assert window.shape == (1, 200)
+        assert np.shares_memory(window, out)
+        assertNdarraysEqual(window, data)
+
+    def test_ndarray_mismatch(self) -> None:
+        fifo = av.AudioFifo()
+        fifo.write_ndarray(np.zeros((1, 20), dtype="i2"), "s16", "stereo")
+        with pytest.raises(ValueError):
+            fifo.write_ndarray(np.zeros((1, 20), dtype="f4"))
+        with pytest.raises(ValueError):
+            fifo.write_ndarray(np.zeros((1, 20), dtype="i2"), layout="mono")
+        with pytest.raises(ValueError):
+            fifo.read_ndarray(out=np.zeros((1, 20), dtype="i2")[:, ::2])
+        with pytest.raises(ValueError):
+            fifo.read_ndarray(20, out=np.zeros((1, 20), dtype="i2"))
+
+    def test_read_into(self) -> None:
+        fifo = av.AudioFifo()
+
+        iframe = av.AudioFrame(format="s16", layout="stereo", samples=1024)
+        iframe.planes[0].update(np.arange(2048, dtype="i2").tobytes())
+        iframe.pts = 0
+        iframe.sample_rate = 48000
+        iframe.time_base = Fraction(1, 48000)
+        fifo.write(iframe)
+
+        oframe = av.AudioFrame(format="s16", layout="stereo", samples=256)
+        for i in range(4):
+            assert fifo.read_into(oframe)
+            assert oframe.pts == i * 256
+            assert oframe.time_base == iframe.time_base
+            assert oframe.sample_rate == 48000
+            assertNdarraysEqual(
+                oframe.to_ndarray(), np.arange(i * 512, (i + 1) * 512, dtype="i2")[None]
+            )
+        assert not fifo.read_into(oframe)
+
+        with pytest.raises(ValueError):
+            fifo.read_into(av.AudioFrame(format="fltp", layout="stereo", samples=16))
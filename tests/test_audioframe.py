@@ -1,12 +1,14 @@
+import gc
 from re import escape
 
 import numpy as np
 import pytest
 
+import av
 from av import AudioFrame
 from av.audio.plane import AudioPlane
 
-from .common import assertNdarraysEqual
+from .common import assertNdarraysEqual, fate_suite
 
 
 def test_null_constructor() -> None:
@@ -213,3 +215,84 @@ def test_plane_index_out_of_range() -> None:
         for bad in (-1, nb_planes, 100000000):
             with pytest.raises(ValueError):
                 AudioPlane(frame, bad)
+
+
+def test_to_ndarray_no_copy() -> None:
+    for format, layout, shape in (
+        ("s16", "stereo", (1, 320)),
+        ("s16p", "stereo", (2, 160)),
+        ("fltp", "mono", (1, 160)),
+    ):
+        frame = AudioFrame(format=format, layout=layout, samples=160, align=8)
+        array = frame.to_ndarray(copy=False)
+        assert isinstance(array, np.ndarray)
+        assert array.shape == shape
+        assert not array.flags.owndata
+
+        # The views share memory with the frame.
+        array[...] = np.arange(array.size, dtype=array.dtype).reshape(shape)
+        assertNdarraysEqual(frame.to_ndarray(), array)
+
+
+def test_to_ndarray_no_copy_decoded() -> None:
+    with av.open(fate_suite("mkv/codec_delay_opus.mkv")) as container:
+        frame = next(container.decode(audio=0))
+
+    expected = frame.to_ndarray()
+    view = frame.to_ndarray(copy=False)
+    if isinstance(view, tuple):
+        # Planes in separate buffers come back one view per plane.
+        assert len(view) == len(frame.planes)
+        assertNdarraysEqual(np.vstack(view), expected)
+    else:
+        assertNdarraysEqual(view, expected)
+
+
+def test_from_numpy_buffer_shares_memory() -> None:
+    for format, layout, shape, dtype in (
+        ("s16", "stereo", (1, 320), "i2"),
+        ("fltp", "stereo", (2, 160), "f4"),
+        ("fltp", "hexadecagonal", (16, 160), "f4"),
+    ):
+        array = np.zeros(shape, dtype=dtype)
+        frame = AudioFrame.from_numpy_buffer(array, format, layout, rate=48000)
+        assert frame.format.name == format
+        assert frame.layout.name == layout
+        assert frame.samples == 160
+        assert frame.rate == 48000
+        assert len(frame.planes) == shape[0]
+
+        array[...] = np.arange(array.size, dtype=dtype).reshape(shape)
+        assertNdarraysEqual(frame.to_ndarray(), array)
+
+
+def test_from_numpy_buffer_spaced_rows() -> None:
+    # Planar rows only need to be contiguous themselves.
+    array = np.random.rand(2, 200).astype("f4")[:, :160]
+    assert not array.flags.c_contiguous
+    frame = AudioFrame.from_numpy_buffer(array, "fltp", "stereo")
+    assertNdarraysEqual(frame.to_ndarray(), array)
+
+
+def test_from_numpy_buffer_keeps_array_alive() -> None:
+    array = np.arange(320, dtype="i2").reshape(1, 320)
+    expected = array.copy()
+    frame = AudioFrame.from_numpy_buffer(array, "s16", "stereo")
+    del array
+    gc.collect()
+    assertNdarraysEqual(frame.to_ndarray(), expected)
+
+
+def test_from_numpy_buffer_value_error() -> None:
+    with pytest.raises(ValueError, match="C_CONTIGUOUS"):
+        AudioFrame.from_numpy_buffer(
+            np.zeros((2, 320), dtype="f4")[:, ::2], "fltp", "stereo"
+        )
+    with pytest.raises(ValueError, match="overlapping"):
+        AudioFrame.from_numpy_buffer(
+            np.zeros((2, 160), dtype="f4")[::-1], "fltp", "stereo"
+        )
+    with pytest.raises(ValueError, match="shape"):
+        AudioFrame.from_numpy_buffer(np.zeros((2, 160), dtype="i2"), "s16", "stereo")
+    with pytest.raises(ValueError, match="multiple"):
+        AudioFrame.from_numpy_buffer(np.zeros((1, 161), dtype="i2"), "s16", "stereo")
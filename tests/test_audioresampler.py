@@ -1,5 +1,6 @@
 from fractions import Fraction
 
+import numpy as np
 import pytest
 
 import av
@@ -332,3 +333,108 @@ def test_mismatched_input() -> None:
         ValueError, match="Frame does not match AudioResampler setup."
     ) as cm:
         resampler.resample(iframe)
+
+
+def _swr_input(pts: int, rate: int = 48000) -> AudioFrame:
+    iframe = AudioFrame("s16", "stereo", 1024)
+    iframe.sample_rate = rate
+    iframe.time_base = Fraction(1, rate)
+    iframe.pts = pts
+    return iframe
+
+
+def test_swr_backend() -> None:
+    resampler = AudioResampler("s16", "mono", 44100, backend="swr")
+    assert resampler.backend == "swr"
+
+    oframes = []
+    for pts in range(0, 4096, 1024):
+        oframes += resampler.resample(_swr_input(pts))
+    assert resampler.graph is None
+    oframes += resampler.resample(None)
+    assert resampler.resample(None) == []
+
+    # Timestamps follow on from each other, from the first input's.
+    assert oframes[0].pts == 0
+    for prev, oframe in zip(oframes, oframes[1:]):
+        assert prev.pts is not None
+        assert oframe.pts == prev.pts + prev.samples
+    for oframe in oframes:
+        assert oframe.format.name == "s16"
+        assert oframe.layout.name == "mono"
+        assert oframe.sample_rate == 44100
+        assert oframe.time_base == Fraction(1, 44100)
+
+    # Every input sample comes out, once drained.
+    assert abs(sum(f.samples for f in oframes) - 4096 * 44100 / 48000) <= 1
+
+
+def test_swr_backend_matches_filter() -> None:
+    outputs = []
+    for backend in ("filter", "swr"):
+        resampler = AudioResampler("fltp", "mono", 16000, backend=backend)  # type: ignore[arg-type]
+        samples = []
+        for pts in range(0, 8192, 1024):
+            iframe = _swr_input(pts)
+            iframe.planes[0].update(bytes(range(256)) * 16)
+            samples += [f.to_ndarray() for f in resampler.resample(iframe)]
+        samples += [f.to_ndarray() for f in resampler.resample(None)]
+        outputs.append(np.hstack(samples))
+    assert outputs[0].shape == outputs[1].shape
+    assert np.allclose(outputs[0], outputs[1], atol=1e-4)
+
+
+def test_swr_backend_frame_size() -> None:
+    resampler = AudioResampler("fltp", "mono", 8000, 1024, backend="swr")
+
+    iframe = AudioFrame("s16", "mono", 1000)
+    iframe.sample_rate = 8000
+    iframe.time_base = Fraction(1, 8000)
+    iframe.pts = 4000
+
+    oframes = resampler.resample(iframe)
+    assert oframes == []
+    iframe.pts = 5000
+    oframes = resampler.resample(iframe)
+    assert [(f.pts, f.samples) for f in oframes] == [(4000, 1024)]
+    oframes = resampler.resample(None)
+    assert [(f.pts, f.samples) for f in oframes] == [(5024, 976)]
+
+
+def test_swr_backend_options() -> None:
+    resampler = AudioResampler(
+        "s16", "mono", 44100, options={"filter_size": "32"}, backend="swr"
+    )
+    assert resampler.resample(_swr_input(0))
+
+    resampler = AudioResampler(
+        "s16", "mono", 44100, options={"not_a_real_option": "1"}, backend="swr"
+    )
+    with pytest.raises(ValueError, match="unused config: not_a_real_option"):
+        resampler.resample(_swr_input(0))
+
+    with pytest.raises(ValueError):
+        AudioResampler(backend="sox")  # type: ignore[arg-type]
+
+
+def test_swr_resample_into() -> None:
+    resampler = AudioResampler("s16", "mono", 24000, backend="swr")
+    out = AudioFrame("s16", "mono", 512)
+
+    total = 0
+    pts = []
+    for i in range(4):
+        n = resampler.resample_into(_swr_input(i * 1024), out)
+        assert 0 <= n <= 512
+        assert out.samples == n
+        total += n
+        pts.append(out.pts)
+    while n := resampler.resample_into(None, out):
+        total += n
+    assert abs(total - 2048) <= 1
+    assert pts[0] == 0
+
+    with pytest.raises(ValueError):
+        resampler.resample_into(_swr_input(4096), AudioFrame("fltp", "mono", 512))
+    with pytest.raises(ValueError):
+        AudioResampler("s16", "mono", 24000).resample_into(_swr_input(0), out)
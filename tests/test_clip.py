@@ -0,0 +1,133 @@
+import io
+
+import numpy as np
+import pytest
+
+import av
+import av.clip
+
+from .common import TestCase
+
+WIDTH = 160
+HEIGHT = 120
+
+
+def write_source(
+    path: str, count: int = 72, codec: str = "mpeg4", options: dict | None = None
+) -> None:
+    with av.open(path, "w") as output:
+        stream = output.add_stream(
+            codec, rate=24, width=WIDTH, height=HEIGHT, options=options
+        )
+        assert isinstance(stream, av.VideoStream)
+        stream.codec_context.gop_size = 12
+        stream.codec_context.max_b_frames = 2
+        for i in range(count):
+            array = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+            array[:, :] = (3 * i, 128, 255 - 3 * i)
+            frame = av.VideoFrame.from_ndarray(array, format="rgb24")
+            frame.pts = i
+            output.mux(stream.encode(frame))
+        output.mux(stream.encode(None))
+
+
+def nal_types(data: bytes, length_size: int) -> list[int]:
+    """The NAL unit types of a length-prefixed H.264 packet."""
+    types = []
+    while data:
+        size = int.from_bytes(data[:length_size], "big")
+        assert 0 < size <= len(data) - length_size
+        types.append(data[length_size] & 0x1F)
+        data = data[length_size + size :]
+    return types
+
+
+class TestClipExtract(TestCase):
+    def test_smart_cut(self) -> None:
+        source = self.sandboxed("clip_source.mp4")
+        write_source(source)
+        path = self.sandboxed("clip.mp4")
+
+        # Starts mid-GOP at frame 8 and ends mid-GOP before frame 54.
+        av.clip.extract(source, 0.3, 2.25, path)
+
+        with av.open(source, "r") as container:
+            source_packets = {bytes(p) for p in container.demux(video=0) if p.size}
+        with av.open(path, "r") as container:
+            packets = [p for p in container.demux(video=0) if p.size]
+            copied = [p for p in packets if bytes(p) in source_packets]
+            dts = [p.dts for p in packets]
+
+        # The whole GOPs in between are copied untouched, the ends are not.
+        assert len(copied) >= 24
+        assert len(copied) < len(packets)
+        assert all(
+            a is not None and b is not None and a < b for a, b in zip(dts, dts[1:])
+        )
+
+        with av.open(path, "r") as container:
+            frames = list(container.decode(video=0))
+        assert len(frames) == 46
+        times = [f.time for f in frames]
+        assert times[0] == pytest.approx(0, abs=0.05)
+        assert times == sorted(times)
+
+    def test_smart_cut_h264(self) -> None:
+        if "libx264" not in av.codecs_available:
+            pytest.skip()
+
+        source = self.sandboxed("clip_source_h264.mp4")
+        write_source(
+            source,
+            codec="libx264",
+            options={"x264-params": "keyint=12:min-keyint=12:scenecut=0"},
+        )
+        with av.open(source, "r") as container:
+            extradata = container.streams.video[0].codec_context.extradata
+            source_packets = {bytes(p) for p in container.demux(video=0) if p.size}
+        # avcC extradata: packets hold length-prefixed NAL units.
+        assert extradata is not None and extradata[0] == 1
+        length_size = (extradata[4] & 3) + 1
+
+        path = self.sandboxed("clip_h264.mp4")
+        av.clip.extract(source, 0.3, 2.25, path)
+
+        with av.open(path, "r") as container:
+            demuxed = [p for p in container.demux(video=0) if p.size]
+        packets = [bytes(p) for p in demuxed]
+        keyframes = [bytes(p) for p in demuxed if p.is_keyframe]
+        # Re-encoded frames come out of the encoder in Annex B form and must be
+        # converted like the rest.
+        for data in packets:
+            nal_types(data, length_size)
+        # The first copied keyframe follows re-encoded frames with parameter
+        # sets of their own, so it carries those of the source again.
+        copied = [p for p in packets if p in source_packets]
+        assert copied
+        assert keyframes[1] not in source_packets
+        assert {7, 8} <= set(nal_types(keyframes[1], length_size))
+
+        with av.open(path, "r") as container:
+            stream = container.streams.video[0]
+            # Fail on any decoding error, such as a missing parameter set.
+            stream.codec_context.options = {"err_detect": "explode"}
+            frames = list(container.decode(stream))
+        assert len(frames) == 46
+        times = [f.time for f in frames]
+        assert times[0] == pytest.approx(0, abs=0.05)
+        assert times == sorted(times)
+
+    def test_keyframe_aligned(self) -> None:
+        source = self.sandboxed("clip_source_aligned.mp4")
+        write_source(source)
+
+        buffer = io.BytesIO()
+        av.clip.extract(source, 0.5, 1.5, buffer, format="mp4")
+        buffer.seek(0)
+        with av.open(buffer, "r") as container:
+            frames = list(container.decode(video=0))
+        assert len(frames) == 24
+
+    def test_invalid_range(self) -> None:
+        with pytest.raises(ValueError):
+            av.clip.extract("unused.mp4", 2.0, 1.0, "unused_out.mp4")
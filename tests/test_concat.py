@@ -0,0 +1,112 @@
+import io
+
+import numpy as np
+import pytest
+
+import av
+
+from .common import TestCase
+
+WIDTH = 160
+HEIGHT = 120
+
+
+def write_chunk(
+    path: str, first: int, count: int = 24, width: int = WIDTH, format=None
+) -> None:
+    with av.open(path, "w", format=format) as output:
+        stream = output.add_stream("mpeg4", rate=24, width=width, height=HEIGHT)
+        for i in range(first, first + count):
+            array = np.empty((HEIGHT, width, 3), dtype=np.uint8)
+            array[:, :] = (3 * i, 128, 255 - 3 * i)
+            frame = av.VideoFrame.from_ndarray(array, format="rgb24")
+            frame.pts = i
+            output.mux(stream.encode(frame))
+        output.mux(stream.encode(None))
+
+
+def write_audio_chunk(path: str, frames: int = 47) -> None:
+    with av.open(path, "w") as output:
+        stream = output.add_stream("aac", rate=48000)
+        for i in range(frames):
+            samples = np.zeros((2, 1024), dtype=np.float32)
+            samples[:, :] = np.sin(np.arange(i * 1024, (i + 1) * 1024) / 20)
+            frame = av.AudioFrame.from_ndarray(samples, format="fltp", layout="stereo")
+            frame.sample_rate = 48000
+            frame.pts = i * 1024
+            output.mux(stream.encode(frame))
+        output.mux(stream.encode(None))
+
+
+class TestConcat(TestCase):
+    def check_output(self, file, count: int) -> None:
+        with av.open(file, "r") as container:
+            packets = [p for p in container.demux(video=0) if p.size]
+            frames = list(container.decode(video=0))
+
+        dts = [p.dts for p in packets]
+        assert all(
+            a is not None and b is not None and a < b for a, b in zip(dts, dts[1:])
+        )
+        assert len(frames) == count
+        times = [f.time for f in frames]
+        assert times[0] == pytest.approx(0, abs=0.05)
+        assert times[-1] == pytest.approx((count - 1) / 24, abs=0.05)
+        assert times == sorted(times)
+
+    def test_continuous_chunks(self) -> None:
+        # Chunks of a recording: MPEG-TS with timestamps carrying on.
+        chunks = [self.sandboxed(f"concat_chunk_{i}.ts") for i in range(3)]
+        for i, path in enumerate(chunks):
+            write_chunk(path, 24 * i)
+
+        for prefetch in (False, True):
+            path = self.sandboxed(f"concat_{prefetch}.mp4")
+            av.concat(chunks, path, prefetch=prefetch)
+            self.check_output(path, 72)
+
+    def test_time_bases(self) -> None:
+        # Timestamps restart in every input, and the time bases differ.
+        first = self.sandboxed("concat_first.mp4")
+        second = self.sandboxed("concat_second.mkv")
+        write_chunk(first, 0)
+        write_chunk(second, 0)
+        with av.open(first, "r") as a, av.open(second, "r") as b:
+            assert a.streams.video[0].time_base != b.streams.video[0].time_base
+
+        buffer = io.BytesIO()
+        with av.open(second, "r") as container:
+            # Open containers are used as they are, and left open.
+            av.concat(iter([first, container]), buffer, format="matroska")
+            container.seek(0)
+
+        buffer.seek(0)
+        self.check_output(buffer, 48)
+
+    def test_audio_priming(self) -> None:
+        # AAC in MP4 starts with priming the edit list discards; it is dropped
+        # from later inputs, which must then start where the previous ends.
+        chunks = [self.sandboxed(f"concat_audio_{i}.mp4") for i in range(3)]
+        for path in chunks:
+            write_audio_chunk(path)
+        with av.open(chunks[0], "r") as container:
+            assert any(p.is_discard for p in container.demux(audio=0))
+
+        path = self.sandboxed("concat_audio.mp4")
+        av.concat(chunks, path)
+
+        with av.open(path, "r") as container:
+            packets = [p for p in container.demux(audio=0) if p.size]
+        assert len(packets) == 3 * 47 + 1
+        for packet, following in zip(packets, packets[1:]):
+            assert packet.pts is not None and following.pts is not None
+            assert following.pts - packet.pts == packet.duration
+
+    def test_incompatible(self) -> None:
+        first = self.sandboxed("concat_narrow.ts")
+        second = self.sandboxed("concat_wide.ts")
+        write_chunk(first, 0)
+        write_chunk(second, 24, width=2 * WIDTH)
+
+        with pytest.raises(ValueError, match="width differs"):
+            av.concat([first, second], io.BytesIO(), format="mpegts")
@@ -153,6 +153,48 @@ class TestDecode(TestCase):
         )
         assert sample_count == total_samples
 
+    def test_decode_audio_ndarray(self) -> None:
+        path = fate_suite("audio-reference/chorusnoise_2ch_44kHz_s16.wav")
+        with av.open(path) as container:
+            expected = sum(f.samples for f in container.decode(audio=0))
+            container.seek(0)
+            chunks = list(
+                container.decode_audio_ndarray(rate=16000, chunk_samples=4000)
+            )
+
+        *full, last = chunks
+        for pts, chunk in chunks:
+            assert chunk.dtype == np.float32
+            assert chunk.shape[0] == 1
+        assert all(chunk.shape == (1, 4000) for _, chunk in full)
+        assert 0 < last[1].shape[1] <= 4000
+        assert [pts for pts, _ in chunks] == list(range(0, 4000 * len(chunks), 4000))
+
+        total = sum(chunk.shape[1] for _, chunk in chunks)
+        assert abs(total - expected * 16000 / 44100) <= 1
+
+    def test_decode_audio_ndarray_overlap_out(self) -> None:
+        path = fate_suite("audio-reference/chorusnoise_2ch_44kHz_s16.wav")
+        with av.open(path) as container:
+            plain = np.hstack(
+                [c for _, c in container.decode_audio_ndarray(layout="stereo")]
+            )
+            container.seek(0)
+
+            out = np.empty((2, 1000), dtype=np.float32)
+            previous = None
+            for pts, chunk in container.decode_audio_ndarray(
+                layout="stereo", chunk_samples=1000, overlap=250, out=out
+            ):
+                assert np.shares_memory(chunk, out)
+                assert np.array_equal(chunk, plain[:, pts : pts + chunk.shape[1]])
+                if previous is not None:
+                    assert pts == previous + 750
+                previous = pts
+
+            with pytest.raises(ValueError):
+                container.decode_audio_ndarray(chunk_samples=100, overlap=100)
+
     def test_decoded_time_base(self) -> None:
         container = av.open(fate_suite("h264/interlaced_crop.mp4"))
         stream = container.streams.video[0]
@@ -184,6 +226,37 @@ class TestDecode(TestCase):
                 assert vectors is not None and len(vectors) > 0
                 return
 
+    def test_motion_vectors_only(self) -> None:
+        container = av.open(fate_suite("h264/interlaced_crop.mp4"))
+        stream = container.streams.video[0]
+
+        expected = []
+        for frame in container.decode(stream):
+            expected.append((frame.pts, frame.pict_type))
+        container.seek(0)
+
+        # The stream's decoder is open by now, which must not matter.
+        assert stream.codec_context.is_open
+        results = list(container.motion_vectors(stream))
+        assert [(pts, int(pict_type)) for pts, pict_type, _ in results] == expected
+        assert any(len(vectors) for _, _, vectors in results)
+        for _, pict_type, vectors in results:
+            if pict_type == av.video.frame.PictureType.I:
+                assert len(vectors) == 0
+
+        # The stream's own decoder is never touched.
+        assert stream.codec_context.flags2 & av.codec.context.Flags2.export_mvs == 0
+
+        container.seek(0)
+        table = container.motion_vectors(stream, concatenate=True)
+        assert len(table) == sum(len(vectors) for _, _, vectors in results)
+        frame_index, (pts, _, vectors) = next(
+            (i, r) for i, r in enumerate(results) if len(r[2])
+        )
+        rows = table[table["frame"] == frame_index]
+        assert (rows["pts"] == pts).all()
+        assert (rows["motion_x"] == vectors["motion_x"]).all()
+
     def test_motion_vector_index_bounds(self) -> None:
         container = av.open(fate_suite("h264/interlaced_crop.mp4"))
         stream = container.streams.video[0]
@@ -229,6 +302,39 @@ class TestDecode(TestCase):
             assert video_enc_params.qp + first_block.delta_qp == 29
             return
 
+    def test_video_enc_params_ndarray(self) -> None:
+        container = av.open(fate_suite("h264/interlaced_crop.mp4"))
+        stream = container.streams.video[0]
+        stream.codec_context.options = {"export_side_data": "venc_params"}
+
+        for frame in container.decode(stream):
+            params = cast(VideoEncParams, frame.side_data.get("VIDEO_ENC_PARAMS"))
+            assert params is not None
+
+            blocks = params.blocks_ndarray()
+            assert len(blocks) == params.nb_blocks
+            for i in (0, 1, params.nb_blocks - 1):
+                block = params.block_params(i)
+                assert blocks[i]["src_x"] == block.src_x
+                assert blocks[i]["src_y"] == block.src_y
+                assert blocks[i]["w"] == block.w
+                assert blocks[i]["h"] == block.h
+                assert blocks[i]["delta_qp"] == block.delta_qp
+
+            qp_map = params.qp_map()
+            assert qp_map.shape == ((frame.height + 15) // 16, (frame.width + 15) // 16)
+            for i in range(params.nb_blocks):
+                block = params.block_params(i)
+                if block.src_y < frame.height and block.src_x < frame.width:
+                    qp = qp_map[block.src_y // 16, block.src_x // 16]
+                    assert qp == params.qp + block.delta_qp
+
+            # A finer grid repeats each macroblock's value over its cells.
+            fine = params.qp_map(block_size=8)
+            assert fine.shape == ((frame.height + 7) // 8, (frame.width + 7) // 8)
+            assert (fine[::2, ::2] == qp_map).all()
+            return
+
     def test_decoded_video_enc_params_no_flag(self) -> None:
         container = av.open(fate_suite("h264/interlaced_crop.mp4"))
         stream = container.streams.video[0]
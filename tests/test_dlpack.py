@@ -8,7 +8,7 @@ import av
 from av import VideoFrame
 from av.codec.hwaccel import HWAccel
 
-from .common import assertNdarraysEqual, fate_png
+from .common import assertNdarraysEqual, fate_png, fate_suite
 
 
 def _make_u8(shape: tuple[int, ...]) -> numpy.ndarray:
@@ -749,3 +749,47 @@ def test_encode_cuda_frame_with_nvenc_external_stream_if_available() -> None:
         assert any(p.size for p in packets)
     except av.FFmpegError as e:
         pytest.skip(f"nvenc/CUDA not available in this build/runtime: {e}")
+
+
+def test_audio_dlpack_export_cpu() -> None:
+    with av.open(fate_suite("audio-reference/chorusnoise_2ch_44kHz_s16.wav")) as c:
+        frame = next(c.decode(audio=0))
+    assert frame.format.name == "s16"
+    expected = frame.to_ndarray()
+
+    # A packed frame has one plane of interleaved samples.
+    plane = frame.planes[0]
+    assert plane.__dlpack_device__() == (1, 0)
+    arr = numpy.from_dlpack(plane)
+    assert arr.shape == (frame.samples, 2)
+    assert arr.dtype == numpy.int16
+    assertNdarraysEqual(arr.reshape(1, -1), expected)
+
+    arr = numpy.from_dlpack(frame)
+    assert frame.__dlpack_device__() == (1, 0)
+    assertNdarraysEqual(arr, expected)
+
+    del frame, plane
+    gc.collect()
+    assertNdarraysEqual(arr, expected)
+
+
+def test_audio_plane_dlpack_export_planar_cpu() -> None:
+    with av.open(fate_suite("mkv/codec_delay_opus.mkv")) as c:
+        frame = next(c.decode(audio=0))
+    assert frame.format.name == "fltp"
+    expected = frame.to_ndarray()
+
+    for i, plane in enumerate(frame.planes):
+        arr = numpy.from_dlpack(plane)
+        assert arr.shape == (frame.samples,)
+        assert arr.dtype == numpy.float32
+        assertNdarraysEqual(arr, expected[i])
+
+
+def test_audio_dlpack_export_requires_refcounted_frame() -> None:
+    frame = av.AudioFrame(format="s16", layout="stereo", samples=16)
+    with pytest.raises(TypeError, match="refcounted"):
+        frame.planes[0].__dlpack__()
+    with pytest.raises(TypeError, match="refcounted"):
+        frame.__dlpack__()
@@ -10,8 +10,12 @@ import pytest
 
 import av
 import av.codec.hwaccel
+import av.encode
+import av.parallel
 from av import AudioFrame, VideoFrame
 from av.audio.stream import AudioStream
+from av.codec.pool import EncoderPool
+from av.codec.worker import EncoderWorker
 from av.video.stream import VideoStream
 
 from .common import TestCase, fate_suite, has_pillow
@@ -377,6 +381,357 @@ class TestEncodeStreamSemantics(TestCase):
             assert stream.time_base == Fraction(1, 48000)
 
 
+def gradient_frames(count: int) -> list[VideoFrame]:
+    frames = []
+    for i in range(count):
+        array = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        array[:, :] = (8 * i, 128, 255 - 8 * i)
+        frame = VideoFrame.from_ndarray(array, format="rgb24")
+        frame.pts = i
+        frames.append(frame)
+    return frames
+
+
+def add_mpeg4_stream(container: av.container.OutputContainer) -> VideoStream:
+    stream = container.add_stream("mpeg4", rate=24)
+    stream.width = WIDTH
+    stream.height = HEIGHT
+    stream.pix_fmt = "yuv420p"
+    return stream
+
+
+class TestEncodeAsync(TestCase):
+    def test_encode_async(self) -> None:
+        path = self.sandboxed("encode_async.mp4")
+        with av.open(path, "w") as output:
+            stream = add_mpeg4_stream(output)
+            for frame in gradient_frames(24):
+                stream.encode_async(frame)
+            stream.encode_async(None)
+
+        with av.open(path) as container:
+            frames = list(container.decode(video=0))
+        assert len(frames) == 24
+        assert len({f.pts for f in frames}) == 24
+
+    def test_worker_matches_encode(self) -> None:
+        frames = gradient_frames(12)
+
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            stream = add_mpeg4_stream(output)
+            expected = [bytes(p) for f in frames for p in stream.encode(f)]
+            expected += [bytes(p) for p in stream.encode(None)]
+
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            stream = add_mpeg4_stream(output)
+            worker = EncoderWorker(stream, maxsize=2)
+            packets = []
+            for frame in gradient_frames(12):
+                worker.submit(frame)
+                packets += worker.packets()
+            packets += worker.close()
+
+        assert [bytes(p) for p in packets] == expected
+        assert all(p.stream is stream for p in packets)
+
+    def test_worker_writes_header_first(self) -> None:
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            stream = add_mpeg4_stream(output)
+            with EncoderWorker(stream, output) as worker:
+                # The header is written on this thread, before any encoding.
+                assert stream.codec_context.is_open
+                for frame in gradient_frames(6):
+                    worker.submit(frame)
+
+    def test_worker_error(self) -> None:
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            stream = add_mpeg4_stream(output)
+            worker = EncoderWorker(stream)
+            worker.submit(AudioFrame(format="s16", layout="mono", samples=64))
+            with pytest.raises(TypeError):
+                worker.close()
+
+
+class TestEncodeInto(TestCase):
+    def test_encode_into(self) -> None:
+        frames = gradient_frames(12)
+
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            stream = add_mpeg4_stream(output)
+            expected = [bytes(p) for f in frames for p in stream.encode(f)]
+            expected += [bytes(p) for p in stream.encode(None)]
+
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            stream = add_mpeg4_stream(output)
+            packets: list[av.Packet] = []
+            total = 0
+            for frame in gradient_frames(12):
+                total += stream.encode_into(frame, packets)
+            total += stream.encode_into(None, packets)
+
+            assert total == len(packets)
+            assert [bytes(p) for p in packets] == expected
+            assert all(p.stream is stream for p in packets)
+            assert all(p.time_base == stream.codec_context.time_base for p in packets)
+
+
+class TestEncodeChunked(TestCase):
+    def test_encode_chunked(self) -> None:
+        path = self.sandboxed("encode_chunked.mp4")
+        with av.open(path, "w") as output:
+            stream = add_mpeg4_stream(output)
+            stream.codec_context.max_b_frames = 2
+            packets = list(
+                av.parallel.encode_chunked(
+                    gradient_frames(30), stream, chunk_frames=8, workers=3
+                )
+            )
+            for packet in packets:
+                output.mux(packet)
+
+        assert all(p.stream is stream for p in packets)
+        dts = [p.dts for p in packets]
+        assert all(
+            a is not None and b is not None and a < b for a, b in zip(dts, dts[1:])
+        )
+        assert all(
+            p.dts <= p.pts for p in packets if p.dts is not None and p.pts is not None
+        )
+        # Every chunk starts on a keyframe.
+        assert sum(p.is_keyframe for p in packets) >= 4
+
+        with av.open(path) as container:
+            frames = list(container.decode(video=0))
+        assert len(frames) == 30
+        assert len({f.pts for f in frames}) == 30
+
+    def test_encode_chunked_options(self) -> None:
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            stream = add_mpeg4_stream(output)
+            packets = list(
+                av.parallel.encode_chunked(
+                    gradient_frames(8), stream, options={"qmax": "20"}, chunk_frames=4
+                )
+            )
+            # The stream's encoder, which writes the header, opens the same way.
+            assert stream.codec_context.options["qmax"] == "20"
+            output.mux(packets)
+
+            with pytest.raises(ValueError):
+                av.parallel.encode_chunked([], stream, options={"qmax": "30"})
+
+    def test_retimer_delay_grows(self) -> None:
+        def packets(pts: list[int]) -> list[av.Packet]:
+            out = []
+            for p in pts:
+                packet = av.Packet(b"\0")
+                packet.pts = p
+                out.append(packet)
+            return out
+
+        retimer = av.parallel._Retimer()  # type: ignore[attr-defined]
+        retimed = retimer.retime(packets([0, 10, 20]))
+        # The second chunk reorders two frames deeper than the first.
+        retimed += retimer.retime(packets([30, 70, 50, 40, 60]))
+        # Packets sharing a timestamp keep their own ranks.
+        retimed += retimer.retime(packets([80, 100, 90, 90]))
+
+        dts = [p.dts for p in retimed]
+        assert all(
+            a is not None and b is not None and a < b for a, b in zip(dts, dts[1:])
+        )
+        assert all(
+            p.dts is not None and p.pts is not None and p.dts <= p.pts for p in retimed
+        )
+
+        with pytest.raises(ValueError):
+            retimer.retime([av.Packet(b"\0")])
+
+    def test_encode_chunked_errors(self) -> None:
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            stream = add_mpeg4_stream(output)
+            with pytest.raises(ValueError):
+                av.parallel.encode_chunked([], stream, chunk_frames=0)
+            with pytest.raises(ValueError):
+                av.parallel.encode_chunked([], stream, workers=0)
+            assert list(av.parallel.encode_chunked([], stream)) == []
+
+
+class TestTwoPass(TestCase):
+    def write_source(self) -> str:
+        path = self.sandboxed("two_pass_source.mp4")
+        with av.open(path, "w") as output:
+            stream = add_mpeg4_stream(output)
+            for frame in gradient_frames(24):
+                output.mux(stream.encode(frame))
+            output.mux(stream.encode(None))
+        return path
+
+    def test_two_pass(self) -> None:
+        source = self.write_source()
+        for cache_frames in (False, True):
+            path = self.sandboxed(f"two_pass_{cache_frames}.mp4")
+            calls: list[tuple[int, int, int | None]] = []
+            stats = av.encode.two_pass(
+                source,
+                path,
+                "mpeg4",
+                200_000,
+                cache_frames=cache_frames,
+                progress=lambda *args: calls.append(args),
+            )
+
+            # mpeg4 writes one line of statistics per frame.
+            assert len(stats.splitlines()) == 24
+            assert [c[:2] for c in calls] == [(1, i) for i in range(1, 25)] + [
+                (2, i) for i in range(1, 25)
+            ]
+
+            with av.open(path) as container:
+                stream = container.streams.video[0]
+                assert stream.codec_context.name == "mpeg4"
+                assert (stream.width, stream.height) == (WIDTH, HEIGHT)
+                frames = list(container.decode(stream))
+            assert len(frames) == 24
+
+    def test_two_pass_external_encoders(self) -> None:
+        source = self.write_source()
+        tested = False
+        for codec, options in (
+            ("libx264", {"preset": "ultrafast"}),
+            ("libvpx", {"deadline": "realtime"}),
+        ):
+            if codec not in av.codecs_available:
+                continue
+            tested = True
+            path = self.sandboxed(f"two_pass_{codec}.mkv")
+            stats = av.encode.two_pass(source, path, codec, 200_000, options=options)
+            if codec == "libvpx":
+                # Its statistics only come out once it is flushed.
+                assert stats
+
+            with av.open(path) as container:
+                frames = list(container.decode(video=0))
+            assert len(frames) == 24
+
+        if not tested:
+            pytest.skip()
+
+    def test_two_pass_errors(self) -> None:
+        with pytest.raises(ValueError):
+            av.encode.two_pass(self.write_source(), io.BytesIO(), "mpeg4", 0)
+
+
+class TestEncoderPool(TestCase):
+    def encode(self, pool: EncoderPool) -> bytes:
+        buffer = io.BytesIO()
+        with av.open(buffer, "w", format="mp4") as output:
+            stream = pool.add_stream(output, "mpeg4", 24, width=WIDTH, height=HEIGHT)
+            assert isinstance(stream, VideoStream)
+            assert stream.codec_context.is_open
+            for frame in gradient_frames(12):
+                output.mux(stream.encode(frame))
+            output.mux(stream.encode(None))
+        pool.release(stream.codec_context)
+        return buffer.getvalue()
+
+    def test_reuse(self) -> None:
+        pool = EncoderPool(max_idle=1)
+        first = self.encode(pool)
+        assert len(pool) == 1
+        # A reused or reopened encoder gives the same result as a new one.
+        assert self.encode(pool) == first
+        assert len(pool) == 1
+
+        with av.open(io.BytesIO(first), "r") as container:
+            frames = list(container.decode(video=0))
+        assert len(frames) == 12
+        assert len({f.pts for f in frames}) == 12
+
+    def test_flush_buffers(self) -> None:
+        names = [
+            name
+            for name in ("libx264", "libx265", "libvpx-vp9", "libaom-av1")
+            if name in av.codecs_available
+            and av.Codec(name, "w").capabilities & av.codec.Capabilities.encoder_flush
+        ]
+        if not names:
+            pytest.skip()
+
+        pool = EncoderPool(max_idle=1)
+        results = []
+        for _ in range(2):
+            buffer = io.BytesIO()
+            with av.open(buffer, "w", format="matroska") as output:
+                stream = pool.add_stream(
+                    output, names[0], 24, width=WIDTH, height=HEIGHT
+                )
+                assert isinstance(stream, VideoStream)
+                for frame in gradient_frames(12):
+                    frame.pts = None
+                    output.mux(stream.encode(frame))
+                output.mux(stream.encode(None))
+            pool.release(stream.codec_context)
+            results.append((stream.codec_context, buffer))
+
+        # Kept and reset rather than reopened.
+        assert results[0][0] is results[1][0]
+        for _, buffer in results:
+            buffer.seek(0)
+            with av.open(buffer, "r") as container:
+                frames = list(container.decode(video=0))
+            assert len(frames) == 12
+            assert frames[0].time == 0
+
+    def test_audio(self) -> None:
+        pool = EncoderPool(max_idle=1)
+        runs = []
+        for _ in range(2):
+            buffer = io.BytesIO()
+            with av.open(buffer, "w", format="matroska") as output:
+                stream = pool.add_stream(output, "aac", 48000)
+                assert isinstance(stream, av.AudioStream)
+                for i in range(10):
+                    # No pts: the encoder numbers the samples itself.
+                    frame = av.AudioFrame(format="fltp", layout="stereo", samples=1000)
+                    for plane in frame.planes:
+                        plane.update(bytes(plane.buffer_size))
+                    frame.sample_rate = 48000
+                    output.mux(stream.encode(frame))
+                output.mux(stream.encode(None))
+            pool.release(stream.codec_context)
+
+            buffer.seek(0)
+            with av.open(buffer, "r") as container:
+                runs.append([p.pts for p in container.demux(audio=0) if p.size])
+
+        # The reused or reopened encoder starts again from zero.
+        assert runs[0] == runs[1]
+        assert runs[0][0] is not None and runs[0][0] <= 0
+
+    def test_keys(self) -> None:
+        pool = EncoderPool()
+        a = pool.acquire("mpeg4", width=WIDTH, height=HEIGHT)
+        b = pool.acquire("mpeg4", width=WIDTH, height=HEIGHT)
+        assert a is not b
+        assert a.is_open and b.is_open
+        pool.release(a)
+        pool.release(b)
+        assert len(pool) == 2
+
+        c = pool.acquire("mpeg4", width=WIDTH // 2, height=HEIGHT // 2)
+        assert isinstance(c, av.VideoCodecContext)
+        assert (c.width, c.height) == (WIDTH // 2, HEIGHT // 2)
+        assert len(pool) == 2
+        pool.release(c)
+        assert len(pool) == 3
+
+        with pytest.raises(ValueError):
+            pool.release(c)
+        pool.clear()
+        assert len(pool) == 0
+
+
 def encode_file_with_max_b_frames(max_b_frames: int) -> io.BytesIO:
     """
     Create an encoded video file (or file-like object) with the given
@@ -313,6 +313,108 @@ class TestFilters(TestCase):
         graph.threads = 4
         self._test_video_buffer(graph)
 
+    def test_push_pull(self) -> None:
+        graph = Graph()
+        src = graph.add_buffer(
+            width=16, height=16, format="yuv420p", time_base=Fraction(1, 30)
+        )
+        fps = graph.add("fps", "fps=60")
+        sink = graph.add("buffersink")
+        src.link_to(fps)
+        fps.link_to(sink)
+        graph.configure()
+
+        assert graph.try_pull() is None
+        assert sink.pull_all() == []
+
+        frames = []
+        for i in range(5):
+            frame = VideoFrame(16, 16, "yuv420p")
+            frame.pts = i
+            frame.time_base = Fraction(1, 30)
+            frames.extend(graph.push_pull(frame))
+        frames.extend(graph.push_pull(None))
+
+        assert [f.pts for f in frames] == list(range(len(frames)))
+        assert len(frames) >= 8
+        assert all(f.time_base == Fraction(1, 60) for f in frames)
+
+        # Drained: neither call raises EOFError.
+        assert graph.try_pull() is None
+        assert src.pull_all() == []
+
+    def test_push_pull_multiple_sinks(self) -> None:
+        graph = Graph()
+        src = graph.add_buffer(
+            width=16, height=16, format="yuv420p", time_base=Fraction(1, 30)
+        )
+        split = graph.add("split")
+        src.link_to(split)
+        split.link_to(graph.add("buffersink"), 0)
+        split.link_to(graph.add("buffersink"), 1)
+        graph.configure()
+
+        with self.assertRaises(ValueError):
+            graph.push_pull(VideoFrame(16, 16, "yuv420p"))
+
+    def test_run_multiple_sinks(self) -> None:
+        graph = Graph()
+        src = graph.add_buffer(
+            width=64, height=48, format="yuv420p", time_base=Fraction(1, 30)
+        )
+        split = graph.add("split")
+        half = graph.add("scale", "32:24")
+        quarter = graph.add("scale", "16:12")
+        src.link_to(split)
+        split.link_to(half, 0)
+        split.link_to(quarter, 1)
+        half.link_to(graph.add("buffersink"))
+        quarter.link_to(graph.add("buffersink"))
+
+        def frames():
+            for i in range(5):
+                frame = VideoFrame(64, 48, "yuv420p")
+                frame.pts = i
+                frame.time_base = Fraction(1, 30)
+                yield frame
+
+        out: dict[int, list[av.VideoFrame]] = {0: [], 1: []}
+        for index, frame in graph.run(frames()):
+            assert isinstance(frame, av.VideoFrame)
+            out[index].append(frame)
+
+        assert len(graph.sinks) == 2
+        assert [f.pts for f in out[0]] == list(range(5))
+        assert [f.pts for f in out[1]] == list(range(5))
+        assert all((f.width, f.height) == (32, 24) for f in out[0])
+        assert all((f.width, f.height) == (16, 12) for f in out[1])
+
+        assert graph.pull_ready() == []
+        with self.assertRaises(IndexError):
+            graph.pull(at=2)
+        assert graph.try_pull(at=1) is None
+
+    def test_run_audio_and_video(self) -> None:
+        graph = Graph()
+        vsrc = graph.add_buffer(
+            width=16, height=16, format="yuv420p", time_base=Fraction(1, 30)
+        )
+        vsrc.link_to(graph.add("buffersink"))
+        asrc = graph.add_abuffer(sample_rate=44100, format="s16", layout="stereo")
+        volume = graph.add("volume", "0.5")
+        asrc.link_to(volume)
+        volume.link_to(graph.add("abuffersink"))
+
+        video = VideoFrame(16, 16, "yuv420p")
+        video.pts = 0
+        video.time_base = Fraction(1, 30)
+        audio = generate_audio_frame(0)
+        audio.time_base = Fraction(1, 44100)
+
+        results = list(graph.run([video, audio]))
+        kinds = {index: type(frame) for index, frame in results}
+        assert kinds == {0: av.VideoFrame, 1: av.AudioFrame}
+
     def test_EOF(self) -> None:
         input_container = av.open(format="lavfi", file="color=c=pink:duration=1:r=30")
         video_stream = input_container.streams.video[0]
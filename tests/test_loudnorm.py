@@ -0,0 +1,79 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import av
+from av.filter.loudnorm import LoudnessMeter
+
+from .common import TestCase
+
+
+def sine_chunks(amplitude: float, seconds: int = 5, rate: int = 48000):
+    # 997 Hz is the BS.1770 calibration tone: a full scale sine on one channel
+    # reads -3.01 LUFS, so one at `amplitude` on both reads 20 * log10(amplitude).
+    t = np.arange(seconds * rate) / rate
+    wave = (amplitude * np.sin(2 * np.pi * 997 * t)).astype(np.float32)
+    stereo = np.vstack([wave, wave])
+    for start in range(0, stereo.shape[1], 1024):
+        yield np.ascontiguousarray(stereo[:, start : start + 1024])
+
+
+class TestLoudnessMeter(TestCase):
+    def test_sine(self) -> None:
+        meter = LoudnessMeter(format="fltp", layout="stereo", rate=48000)
+        assert math.isnan(meter.integrated)
+
+        for chunk in sine_chunks(0.1):
+            meter.update(chunk)
+        meter.flush()
+
+        assert meter.samples == 5 * 48000
+        assert meter.integrated == pytest.approx(-20.0, abs=0.5)
+        assert meter.short_term == pytest.approx(-20.0, abs=0.5)
+        assert meter.momentary == pytest.approx(-20.0, abs=0.5)
+        assert meter.lra == pytest.approx(0.0, abs=1.0)
+        assert meter.sample_peak == pytest.approx(-20.0, abs=0.1)
+        assert meter.true_peak == pytest.approx(-20.0, abs=0.5)
+
+    def test_normalizer(self) -> None:
+        meter = LoudnessMeter(format="fltp", layout="stereo", rate=48000)
+        chunks = list(sine_chunks(0.1))
+        for chunk in chunks:
+            meter.update(chunk)
+        meter.flush()
+
+        assert meter.gain(target=-24.0, true_peak=-2.0) == pytest.approx(
+            -24.0 - meter.integrated
+        )
+        # The peak limit wins over the loudness target.
+        assert meter.gain(target=-10.0, true_peak=-15.0) == pytest.approx(
+            -15.0 - meter.true_peak
+        )
+
+        graph = meter.normalizer(target=-24.0)
+        check = LoudnessMeter()
+        pts = 0
+        for chunk in chunks:
+            frame = av.AudioFrame.from_ndarray(chunk, format="fltp", layout="stereo")
+            frame.sample_rate = 48000
+            frame.pts = pts
+            frame.time_base = Fraction(1, 48000)
+            pts += frame.samples
+            for out in graph.push_pull(frame):
+                assert isinstance(out, av.AudioFrame)
+                assert out.format.name == "fltp"
+                check.update(out)
+        for out in graph.push_pull(None):
+            assert isinstance(out, av.AudioFrame)
+            check.update(out)
+        check.flush()
+        assert check.integrated == pytest.approx(-24.0, abs=0.5)
+
+    def test_arrays_need_format(self) -> None:
+        meter = LoudnessMeter()
+        with pytest.raises(ValueError):
+            meter.update(np.zeros((2, 1024), dtype=np.float32))
+        with pytest.raises(ValueError):
+            meter.gain()
@@ -149,6 +149,52 @@ class TestProperties:
                 assert packet.duration == old_duration + 10
 
 
+class TestPacketTable:
+    def test_matches_demux(self) -> None:
+        with av.open(fate_suite("h264/interlaced_crop.mp4")) as container:
+            stream = container.streams.video[0]
+            packets = [p for p in container.demux(stream) if p.size]
+            container.seek(0)
+            table = container.packet_table(stream)
+
+        assert table.dtype == av.container.input.packet_table_dtype()
+        assert len(table) == len(packets)
+        assert (table["stream"] == stream.index).all()
+        assert table["pts"].tolist() == [p.pts for p in packets]
+        assert table["dts"].tolist() == [p.dts for p in packets]
+        assert table["duration"].tolist() == [p.duration for p in packets]
+        assert table["pos"].tolist() == [p.pos for p in packets]
+        assert table["size"].tolist() == [p.size for p in packets]
+        assert numpy.flatnonzero(table["is_keyframe"]).tolist() == [
+            0,
+            21,
+            45,
+            69,
+            93,
+            117,
+        ]
+
+    def test_stream_selection(self) -> None:
+        path = fate_suite(
+            "amv/MTV_high_res_320x240_sample_Penguin_Joke_MTV_from_WMV.amv"
+        )
+        with av.open(path) as container:
+            counts = dict.fromkeys(range(len(container.streams)), 0)
+            for packet in container.demux():
+                if packet.size:
+                    counts[packet.stream_index] += 1
+            container.seek(0)
+            table = container.packet_table()
+            container.seek(0)
+            audio = container.packet_table(audio=0)
+            audio_index = container.streams.audio[0].index
+
+        assert len(table) == sum(counts.values())
+        assert numpy.bincount(table["stream"]).tolist() == list(counts.values())
+        assert len(audio) == counts[audio_index]
+        assert (audio["stream"] == audio_index).all()
+
+
 class TestPacketSideData:
     def test_data_types(self) -> None:
         dtypes = get_args(av.packet.PktSideDataT)
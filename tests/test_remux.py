@@ -1,4 +1,5 @@
 import io
+import time
 from fractions import Fraction
 
 import numpy as np
@@ -230,3 +231,78 @@ def test_remux_keeps_keyframe_with_none_dts() -> None:
     with av.open(output, "r") as container:
         first_out = next(p for p in container.demux(video=0) if p.size)
         assert first_out.is_keyframe
+
+
+@pytest.mark.parametrize("interleaved", [True, False])
+def test_mux_many(interleaved: bool) -> None:
+    input_path = av.datasets.curated("pexels/time-lapse-video-of-night-sky-857195.mp4")
+
+    def remux(mux_batch: bool) -> bytes:
+        buf = io.BytesIO()
+        with av.open(input_path) as input_, av.open(buf, "w", format="mp4") as output:
+            in_stream = input_.streams.video[0]
+            out_stream = output.add_stream_from_template(in_stream)
+            packets = []
+            for packet in input_.demux(in_stream):
+                if packet.size == 0:
+                    continue
+                packet.stream = out_stream
+                packets.append(packet)
+
+            if mux_batch:
+                output.mux_many(packets, interleaved=interleaved)
+            else:
+                for packet in packets:
+                    output.mux_one(packet)
+        return buf.getvalue()
+
+    # A single stream in dts order interleaves to the same file either way.
+    assert remux(True) == remux(False)
+
+
+def test_mux_many_bad_stream_index() -> None:
+    with av.open(io.BytesIO(), "w", format="mp4") as other:
+        other.add_stream("mpeg4", rate=24)
+        foreign = other.add_stream("mpeg4", rate=24)
+
+        with av.open(io.BytesIO(), "w", format="mp4") as output:
+            output.add_stream("mpeg4", rate=24)
+            output.start_encoding()
+
+            packet = av.Packet(b"\x00" * 16)
+            packet.stream = foreign
+            with pytest.raises(ValueError):
+                output.mux_many([packet])
+
+
+def test_pace() -> None:
+    def encode(output: av.container.OutputContainer) -> list[av.Packet]:
+        stream = output.add_stream("mpeg4", rate=24, width=64, height=48)
+        packets = []
+        for i in range(25):
+            frame = av.VideoFrame(64, 48, "yuv420p")
+            frame.pts = i
+            packets += stream.encode(frame)
+        return packets + stream.encode(None)
+
+    with av.open(io.BytesIO(), "w", format="mpegts") as output:
+        packets = encode(output)
+        # 25 frames at 24 fps span one second of media; at double speed, with
+        # the first 0.25 seconds sent at once, that takes about 0.375 seconds.
+        output.pace(2.0, burst=0.25)
+        start = time.monotonic()
+        output.mux_many(packets)
+        elapsed = time.monotonic() - start
+    assert 0.3 <= elapsed < 2.0
+
+    with av.open(io.BytesIO(), "w", format="mpegts") as output:
+        packets = encode(output)
+        output.pace(2.0)
+        output.pace(None)
+        start = time.monotonic()
+        output.mux(packets)
+        assert time.monotonic() - start < 0.3
+
+    with av.open(io.BytesIO(), "w", format="mpegts") as output:
+        with pytest.raises(ValueError):
+            output.pace(-1.0)
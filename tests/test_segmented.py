@@ -0,0 +1,134 @@
+import io
+import os
+
+import numpy as np
+import pytest
+
+import av
+from av.container.segmented import Segment, SegmentedOutput
+
+from .common import TestCase
+
+WIDTH = 160
+HEIGHT = 120
+
+
+def frames(count: int) -> list[av.VideoFrame]:
+    out = []
+    for i in range(count):
+        array = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        array[:, :] = (4 * i, 128, 255 - 4 * i)
+        frame = av.VideoFrame.from_ndarray(array, format="rgb24")
+        frame.pts = i
+        out.append(frame)
+    return out
+
+
+class TestSegmentedOutput(TestCase):
+    def test_in_memory(self) -> None:
+        sinks: list[io.BytesIO] = []
+        finished: list[Segment] = []
+
+        def sink(index: int) -> io.BytesIO:
+            assert index == len(sinks)
+            sinks.append(io.BytesIO())
+            return sinks[-1]
+
+        with SegmentedOutput(sink, "mpegts", 0.5, on_segment=finished.append) as out:
+            # A GOP longer than the whole clip: every cut needs a forced keyframe.
+            video = out.add_stream(
+                "mpeg4", rate=24, width=WIDTH, height=HEIGHT, gop_size=1000
+            )
+            for frame in frames(48):
+                out.encode(video, frame)
+
+        assert finished == out.segments
+        assert len(out.segments) == 4
+        assert [s.index for s in out.segments] == [0, 1, 2, 3]
+        assert [s.file for s in out.segments] == sinks
+        for segment in out.segments:
+            assert segment.duration == pytest.approx(0.5, abs=0.05)
+
+        total = 0
+        for segment, buffer in zip(out.segments, sinks):
+            buffer.seek(0)
+            with av.open(buffer, "r", format="mpegts") as container:
+                decoded = list(container.decode(video=0))
+            assert decoded[0].key_frame
+            assert decoded[0].time == pytest.approx(segment.start, abs=0.05)
+            total += len(decoded)
+        assert total == 48
+
+    def test_audio_and_video(self) -> None:
+        sinks: list[io.BytesIO] = []
+
+        def sink(index: int) -> io.BytesIO:
+            sinks.append(io.BytesIO())
+            return sinks[-1]
+
+        video_frames = frames(48)
+        with SegmentedOutput(sink, "mpegts", 1.0) as out:
+            # Video comes first, so the first segment starts before the audio
+            # encoder has seen a frame.
+            video = out.add_stream("mpeg4", rate=24, width=WIDTH, height=HEIGHT)
+            audio = out.add_stream("aac", rate=48000)
+            for i, frame in enumerate(video_frames):
+                out.encode(video, frame)
+                samples = np.zeros((2, 2000), dtype=np.float32)
+                audio_frame = av.AudioFrame.from_ndarray(
+                    samples, format="fltp", layout="stereo"
+                )
+                audio_frame.sample_rate = 48000
+                audio_frame.pts = i * 2000
+                out.encode(audio, audio_frame)
+
+        # Forcing keyframes left the caller's frames alone.
+        assert all(f.pict_type == av.video.frame.PictureType.NONE for f in video_frames)
+
+        assert len(out.segments) == 2
+        for buffer in sinks:
+            buffer.seek(0)
+            with av.open(buffer, "r", format="mpegts") as container:
+                assert len(container.streams.video) == 1
+                assert len(container.streams.audio) == 1
+                stream = container.streams.audio[0]
+                assert stream.sample_rate == 48000
+                assert stream.channels == 2
+                assert list(container.decode(stream))
+
+    def test_files_and_playlist(self) -> None:
+        pattern = self.sandboxed("segment_%03d.ts")
+        playlist = self.sandboxed("live.m3u8")
+
+        out = SegmentedOutput(pattern, "mpegts", 1.0, playlist=playlist, window=2)
+        video = out.add_stream("mpeg4", rate=24, width=WIDTH, height=HEIGHT)
+        for frame in frames(72):
+            out.encode(video, frame)
+
+        with open(playlist) as f:
+            live = f.read()
+        assert "#EXT-X-ENDLIST" not in live
+
+        out.close()
+        assert len(out.segments) == 3
+        for segment in out.segments:
+            assert os.path.exists(segment.file)
+
+        with open(playlist) as f:
+            lines = f.read().splitlines()
+        assert lines[0] == "#EXTM3U"
+        assert "#EXT-X-MEDIA-SEQUENCE:1" in lines
+        assert "segment_001.ts" in lines
+        assert "segment_002.ts" in lines
+        assert "segment_000.ts" not in lines
+        assert lines[-1] == "#EXT-X-ENDLIST"
+
+    def test_errors(self) -> None:
+        with pytest.raises(ValueError):
+            SegmentedOutput("x_%d.ts", "mpegts", 0)
+
+        out = SegmentedOutput(lambda i: io.BytesIO(), "mpegts")
+        with pytest.raises(ValueError):
+            out.add_stream("ass")
+        with pytest.raises(ValueError):
+            out.encode(av.CodecContext.create("mpeg4", "w"))
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+import av
+
+from .common import TestCase, fate_suite
+
+PATH = "audio-reference/chorusnoise_2ch_44kHz_s16.wav"
+
+
+class TestExtractSegments(TestCase):
+    def test_matches_full_decode(self) -> None:
+        with av.open(fate_suite(PATH)) as container:
+            full = np.hstack(
+                [c for _, c in container.decode_audio_ndarray(layout="stereo")]
+            )
+
+        # Unsorted, overlapping, nested, and far apart.
+        ranges = [(2.5, 2.75), (0.1, 0.6), (0.3, 0.4), (0.5, 1.0), (0.0, 0.0)]
+        segments = av.audio.extract_segments(
+            fate_suite(PATH), ranges, layout="stereo", merge_gap=0.5
+        )
+
+        assert len(segments) == len(ranges)
+        for (start, end), segment in zip(ranges, segments):
+            lo, hi = round(start * 44100), round(end * 44100)
+            assert segment.dtype == np.float32
+            assert segment.shape == (2, hi - lo)
+            assert np.array_equal(segment, full[:, lo:hi])
+
+    def test_resample_and_truncate(self) -> None:
+        with av.open(fate_suite(PATH)) as container:
+            assert container.duration is not None
+            duration = container.duration / av.time_base
+            segments = av.audio.extract_segments(
+                container,
+                [(1.0, 2.0), (duration - 0.5, duration + 10)],
+                rate=16000,
+                layout="mono",
+                format="s16",
+            )
+
+        assert segments[0].shape == (1, 16000)
+        assert segments[0].dtype == np.int16
+        assert 0 < segments[1].shape[1] <= 8001
+
+    def test_late_seek(self) -> None:
+        import av.audio.segments
+
+        with av.open(fate_suite(PATH)) as container:
+            full = np.hstack(
+                [c for _, c in container.decode_audio_ndarray(layout="stereo")]
+            )
+
+        # A negative margin makes the first seek land after the region starts.
+        margin = av.audio.segments._SEEK_MARGIN  # type: ignore[attr-defined]
+        av.audio.segments._SEEK_MARGIN = -0.5  # type: ignore[attr-defined]
+        try:
+            (segment,) = av.audio.extract_segments(
+                fate_suite(PATH), [(2.0, 2.25)], layout="stereo"
+            )
+        finally:
+            av.audio.segments._SEEK_MARGIN = margin  # type: ignore[attr-defined]
+
+        assert np.array_equal(segment, full[:, 88200:99225])
+
+    def test_invalid_range(self) -> None:
+        with pytest.raises(ValueError):
+            av.audio.extract_segments(fate_suite(PATH), [(2.0, 1.0)])
@@ -0,0 +1,75 @@
+import pytest
+
+import av
+
+from .common import TestCase, fate_suite
+
+
+class TestThumbnails(TestCase):
+    def test_count(self) -> None:
+        frames = av.thumbnails(
+            fate_suite("h264/interlaced_crop.mp4"), count=3, size=(64, 48)
+        )
+
+        assert 1 <= len(frames) <= 3
+        for frame in frames:
+            assert frame.format.name == "rgb24"
+            assert (frame.width, frame.height) == (64, 48)
+            assert frame.key_frame
+
+        pts = [frame.pts for frame in frames if frame.pts is not None]
+        assert pts == sorted(set(pts))
+
+    def test_interval_keeps_aspect_ratio(self) -> None:
+        with av.open(fate_suite("h264/interlaced_crop.mp4")) as container:
+            stream = container.streams.video[0]
+            width, height = stream.width, stream.height
+            frames = av.thumbnails(container, interval=1.0, size=(width // 2, None))
+
+            assert frames
+            assert frames[0].width == width // 2
+            assert frames[0].height == round(height * (width // 2) / width)
+
+    def test_encoded(self) -> None:
+        images = av.thumbnails(
+            fate_suite("h264/interlaced_crop.mp4"), count=2, size=(32, 32), format="png"
+        )
+
+        assert images
+        for image in images:
+            assert image.startswith(b"\x89PNG")
+
+    def test_lowres(self) -> None:
+        # MPEG-2 supports lowres; the output size must not change.
+        frames = av.thumbnails(
+            fate_suite("mpeg2/mpeg2_field_encoding.ts"),
+            count=1,
+            size=(32, 24),
+            lowres=2,
+        )
+        assert frames
+        assert (frames[0].width, frames[0].height) == (32, 24)
+
+    def test_caller_decoder_untouched(self) -> None:
+        with av.open(fate_suite("mpeg2/mpeg2_field_encoding.ts")) as container:
+            stream = container.streams.video[0]
+            assert av.thumbnails(container, count=2, size=(32, 24), lowres=2)
+            assert stream.codec_context.skip_frame == "DEFAULT"
+            assert "lowres" not in stream.codec_context.options
+
+            container.seek(0)
+            frames = list(container.decode(stream))
+            assert len(frames) > 2
+            assert not all(frame.key_frame for frame in frames)
+            assert (frames[0].width, frames[0].height) == (stream.width, stream.height)
+
+    def test_arguments(self) -> None:
+        path = fate_suite("h264/interlaced_crop.mp4")
+        with pytest.raises(ValueError):
+            av.thumbnails(path)
+        with pytest.raises(ValueError):
+            av.thumbnails(path, count=1, interval=1.0)
+        with pytest.raises(ValueError):
+            av.thumbnails(path, count=0)
+        with pytest.raises(ValueError):
+            av.thumbnails(path, count=1, format="gif")  # type: ignore[call-overload]
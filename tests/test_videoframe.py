@@ -10,7 +10,7 @@ from av import VideoFrame
 from av.video.frame import supported_np_pix_fmts
 from av.video.reformatter import Colorspace, Interpolation
 
-from .common import assertNdarraysEqual, fate_png, fate_suite
+from .common import assertNdarraysEqual, fate_png, fate_suite, has_pillow
 
 
 def assertPixelValue16(plane, expected, byteorder: str) -> None:
@@ -235,6 +235,45 @@ def test_negative_linesize_to_ndarray(format: str) -> None:
     assert result.copy().sum() == int(array.sum())
 
 
+@pytest.mark.skipif(not has_pillow, reason="Pillow is not installed")
+@pytest.mark.parametrize(
+    "mode,format,channels", [("RGB", "rgb24", 3), ("RGBA", "rgba", 4), ("L", "gray", 1)]
+)
+def test_to_image(mode: str, format: str, channels: int) -> None:
+    # 318 is not a multiple of the plane alignment, so line_size is padded.
+    shape = (5, 318, channels) if channels > 1 else (5, 318)
+    array = numpy.random.randint(0, 256, size=shape, dtype=numpy.uint8)
+    frame = VideoFrame.from_ndarray(array, format=format)
+    assert frame.planes[0].line_size > frame.planes[0].width * channels
+
+    image = frame.to_image(mode=mode)
+    assert image.mode == mode
+    assert image.size == (318, 5)
+    assertNdarraysEqual(numpy.asarray(image), array)
+
+
+@pytest.mark.skipif(not has_pillow, reason="Pillow is not installed")
+@pytest.mark.parametrize("mode,format", [("RGB", "rgb24"), ("L", "gray")])
+def test_negative_linesize_to_image(mode: str, format: str) -> None:
+    height, width = 6, 4
+    if format == "gray":
+        array = numpy.arange(height * width, dtype=numpy.uint8).reshape(height, width)
+    else:
+        array = numpy.zeros((height, width, 3), dtype=numpy.uint8)
+        for row in range(height):
+            array[row, :, :] = row * 10
+
+    frame = _vflip(VideoFrame.from_ndarray(array, format=format))
+    assert frame.planes[0].line_size < 0
+
+    assertNdarraysEqual(numpy.asarray(frame.to_image(mode=mode)), array[::-1])
+
+
+def test_to_image_invalid_mode() -> None:
+    with pytest.raises(ValueError):
+        VideoFrame(16, 16, "rgb24").to_image(mode="CMYK")
+
+
 def test_ndarray_gray() -> None:
     array = numpy.random.randint(0, 256, size=(480, 640), dtype=numpy.uint8)
     for format in ("gray", "gray8"):
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import av
+from av.audio import waveform_dtype
+
+from .common import TestCase, fate_suite
+
+PATH = "audio-reference/chorusnoise_2ch_44kHz_s16.wav"
+
+
+def decoded_samples() -> np.ndarray:
+    with av.open(fate_suite(PATH)) as container:
+        chunks = [f.to_ndarray() for f in container.decode(audio=0)]
+    # Packed s16 arrives as (1, samples * channels).
+    samples = np.hstack(chunks).reshape(-1, 2).T
+    return samples.astype(np.float32) / 32768
+
+
+class TestWaveform(TestCase):
+    def test_samples_per_bucket(self) -> None:
+        expected = decoded_samples()
+        result = av.audio.waveform(fate_suite(PATH), samples_per_bucket=4096)
+
+        nb_buckets = -(-expected.shape[1] // 4096)
+        assert result.dtype == waveform_dtype()
+        assert result.shape == (2, nb_buckets)
+
+        for i in (0, nb_buckets // 2, nb_buckets - 1):
+            bucket = expected[:, i * 4096 : (i + 1) * 4096]
+            assert np.allclose(result["min"][:, i], bucket.min(axis=1))
+            assert np.allclose(result["max"][:, i], bucket.max(axis=1))
+            rms = np.sqrt((bucket.astype(np.float64) ** 2).mean(axis=1))
+            assert np.allclose(result["rms"][:, i], rms, rtol=1e-4)
+
+    def test_buckets_and_levels(self) -> None:
+        with av.open(fate_suite(PATH)) as container:
+            stream = container.streams.audio[0]
+            levels = av.audio.waveform(stream, buckets=100, levels=3)
+
+        fine, mid, coarse = levels
+        assert 99 <= fine.shape[1] <= 101
+        assert mid.shape[1] == -(-fine.shape[1] // 2)
+        assert coarse.shape[1] == -(-mid.shape[1] // 2)
+
+        assert np.array_equal(mid["min"][:, 0], fine["min"][:, :2].min(axis=1))
+        assert np.array_equal(coarse["max"][:, 0], fine["max"][:, :4].max(axis=1))
+        assert fine["max"].max() == coarse["max"].max()
+        # Merged buckets hold equal sample counts, so RMS is the quadratic mean.
+        rms = np.sqrt((fine["rms"][:, :2].astype(np.float64) ** 2).mean(axis=1))
+        assert np.allclose(mid["rms"][:, 0], rms)
+
+    def test_arguments(self) -> None:
+        path = fate_suite(PATH)
+        with pytest.raises(ValueError):
+            av.audio.waveform(path)
+        with pytest.raises(ValueError):
+            av.audio.waveform(path, buckets=10, samples_per_bucket=10)
+        with pytest.raises(ValueError):
+            av.audio.waveform(path, samples_per_bucket=0)